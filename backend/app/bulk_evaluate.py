@@ -0,0 +1,278 @@
+"""Offline bulk evaluation of JSONL transcripts.
+
+Each input line is ``{"id": ..., "transcript": [{"role": ..., "content": ...}, ...]}``
+with optional ``metadata`` and ``tenant``. Inputs are read lazily, heuristics run on
+a process pool, LLM calls run with bounded concurrency and every finished
+``DualEvaluationResponse`` is appended to the output JSONL as soon as it is ready::
+
+    python -m backend.app.bulk_evaluate transcripts/ --output results.jsonl --workers 4 --concurrency 16
+    python -m backend.app.bulk_evaluate archive.jsonl --output results.jsonl --stub --resume
+
+Completed ids and output offsets are recorded in ``<output>.checkpoint``; ``--resume``
+truncates the output to the last checkpointed line and skips completed ids.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Iterable, Iterator, List, Set
+
+from pydantic import ValidationError
+
+from .config import get_settings
+from .models import ChatMessage, DualEvaluationResponse, TranscriptMetadata
+from .services.evaluation import HeuristicStage, evaluate_transcript, run_heuristic_stage
+from .services.gpt5_client import clear_gpt5_client_cache
+
+
+@dataclass
+class BulkRecord:
+    record_id: str
+    transcript: List[ChatMessage]
+    metadata: TranscriptMetadata
+    tenant: str | None = None
+
+
+@dataclass
+class BulkSummary:
+    completed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[str] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "completed": self.completed,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "per_second": round(self.completed / self.wall_seconds, 3) if self.wall_seconds else 0.0,
+        }
+
+
+def _input_files(paths: Iterable[str]) -> Iterator[Path]:
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            yield from sorted(path.glob("*.jsonl"))
+        else:
+            yield path
+
+
+def _iter_lines(paths: Iterable[str]) -> Iterator[tuple[str, int, str]]:
+    for raw in paths:
+        if raw == "-":
+            for number, line in enumerate(sys.stdin, start=1):
+                yield "<stdin>", number, line
+            continue
+        for path in _input_files([raw]):
+            with path.open("r", encoding="utf-8") as handle:
+                for number, line in enumerate(handle, start=1):
+                    yield path.name, number, line
+
+
+def read_records(paths: Iterable[str], errors: List[str] | None = None) -> Iterator[BulkRecord]:
+    """Stream records from JSONL files, directories of them or ``-`` for stdin."""
+
+    for source, number, line in _iter_lines(paths):
+        if not line.strip():
+            continue
+        try:
+            document = json.loads(line)
+            record = BulkRecord(
+                record_id=str(document.get("id") or f"{source}:{number}"),
+                transcript=[ChatMessage(**message) for message in document["transcript"]],
+                metadata=TranscriptMetadata(**(document.get("metadata") or {})),
+                tenant=document.get("tenant"),
+            )
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError, ValidationError) as exc:
+            if errors is not None:
+                errors.append(f"{source}:{number}: invalid record ({exc})")
+            continue
+        yield record
+
+
+class Checkpoint:
+    """Append-only log of ``{"id", "offset"}`` entries written after each output line."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.completed: Set[str] = set()
+        self.offset = 0
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        valid_end = 0
+        with self.path.open("rb") as handle:
+            for line in handle:
+                try:
+                    entry = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    break  # torn final write
+                self.completed.add(entry["id"])
+                self.offset = max(self.offset, int(entry["offset"]))
+                valid_end += len(line)
+        with self.path.open("r+b") as handle:
+            handle.truncate(valid_end)
+
+    def record(self, handle: IO[str], record_id: str, offset: int) -> None:
+        handle.write(json.dumps({"id": record_id, "offset": offset}) + "\n")
+        handle.flush()
+        self.completed.add(record_id)
+        self.offset = offset
+
+
+def use_stub_provider(latency_ms: float = 0.0, jitter_ms: float = 0.0) -> None:
+    """Route LLM calls of this process to the local stub provider."""
+
+    os.environ["LLM_PROVIDERS"] = json.dumps(
+        [{"name": "stub", "kind": "stub", "latency_ms": latency_ms, "jitter_ms": jitter_ms}]
+    )
+    get_settings.cache_clear()
+    clear_gpt5_client_cache()
+
+
+async def _evaluate_record(
+    record: BulkRecord,
+    heuristic_pool: Executor | None,
+    llm_pool: Executor,
+    llm_slots: asyncio.Semaphore,
+) -> DualEvaluationResponse:
+    loop = asyncio.get_running_loop()
+    if heuristic_pool is None:
+        stage: HeuristicStage = run_heuristic_stage(record.transcript)
+    else:
+        stage = await loop.run_in_executor(heuristic_pool, run_heuristic_stage, record.transcript)
+    async with llm_slots:
+        return await loop.run_in_executor(
+            llm_pool,
+            lambda: evaluate_transcript(
+                record.transcript,
+                session_id=record.record_id,
+                metadata=record.metadata,
+                tenant=record.tenant,
+                heuristics=stage,
+            ),
+        )
+
+
+async def run_bulk(
+    records: Iterable[BulkRecord],
+    output: Path,
+    *,
+    workers: int = os.cpu_count() or 1,
+    concurrency: int = 8,
+    resume: bool = False,
+    checkpoint_path: Path | None = None,
+    summary: BulkSummary | None = None,
+) -> BulkSummary:
+    """Evaluate ``records`` into ``output``; ``workers=0`` keeps heuristics in-process."""
+
+    summary = summary or BulkSummary()
+    checkpoint = Checkpoint(checkpoint_path or output.with_name(output.name + ".checkpoint"))
+    if resume:
+        checkpoint.load()
+    else:
+        checkpoint.path.unlink(missing_ok=True)
+        output.unlink(missing_ok=True)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.touch()
+    if output.stat().st_size < checkpoint.offset:
+        raise ValueError(f"{output} is shorter than its checkpoint; rerun without --resume")
+    with output.open("r+b") as out:
+        out.truncate(checkpoint.offset)  # drop lines written after the last checkpoint
+
+    concurrency = max(1, concurrency)
+    max_pending = concurrency * 2 + max(workers, 1)
+    heuristic_pool: Executor | None = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    llm_pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bulk-llm")
+    llm_slots = asyncio.Semaphore(concurrency)
+    started = time.perf_counter()
+
+    with output.open("ab") as out, checkpoint.path.open("a", encoding="utf-8") as log:
+
+        def collect(done: Set[asyncio.Task]) -> None:
+            for task in done:
+                record_id = task.get_name()
+                try:
+                    result = task.result()
+                except Exception as exc:  # noqa: BLE001 - one bad transcript must not stop the run
+                    summary.failed += 1
+                    summary.errors.append(f"{record_id}: {exc}")
+                    continue
+                out.write(result.model_dump_json().encode("utf-8") + b"\n")
+                out.flush()
+                checkpoint.record(log, record_id, out.tell())
+                summary.completed += 1
+
+        pending: Set[asyncio.Task] = set()
+        try:
+            for record in records:
+                if record.record_id in checkpoint.completed:
+                    summary.skipped += 1
+                    continue
+                if len(pending) >= max_pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    collect(done)
+                task = asyncio.create_task(_evaluate_record(record, heuristic_pool, llm_pool, llm_slots))
+                task.set_name(record.record_id)
+                pending.add(task)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+        finally:
+            llm_pool.shutdown(wait=True)
+            if heuristic_pool is not None:
+                heuristic_pool.shutdown(wait=True)
+
+    summary.wall_seconds = time.perf_counter() - started
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Evaluate JSONL transcripts offline.")
+    parser.add_argument("inputs", nargs="+", help="JSONL files, directories of *.jsonl files or - for stdin")
+    parser.add_argument("--output", required=True, help="Output JSONL of DualEvaluationResponse documents")
+    parser.add_argument("--checkpoint", help="Checkpoint path (default: <output>.checkpoint)")
+    parser.add_argument("--resume", action="store_true", help="Continue from the checkpoint instead of starting over")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Heuristic worker processes (0: in-process)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum concurrent LLM calls")
+    parser.add_argument("--stub", action="store_true", help="Use the local stub provider instead of GPT-5")
+    parser.add_argument("--stub-latency-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    if args.stub:
+        use_stub_provider(args.stub_latency_ms)
+
+    summary = BulkSummary()
+    records = read_records(args.inputs, summary.errors)
+    asyncio.run(
+        run_bulk(
+            records,
+            Path(args.output),
+            workers=args.workers,
+            concurrency=args.concurrency,
+            resume=args.resume,
+            checkpoint_path=Path(args.checkpoint) if args.checkpoint else None,
+            summary=summary,
+        )
+    )
+    print(json.dumps(summary.as_dict()))
+    if summary.errors:
+        print("\n".join(summary.errors), file=sys.stderr)
+    return 1 if summary.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
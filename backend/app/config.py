@@ -1,3 +1,4 @@
+import json
 import os
 
 from functools import lru_cache
@@ -105,6 +106,18 @@ class EmailSettings(BaseModel):
         )
 
 
+class LLMProviderSettings(BaseModel):
+    name: str = Field(..., description="Unique provider name used in routing statistics")
+    kind: str = Field(default="openai", pattern="^(openai|stub)$", description="Provider implementation")
+    base_url: str | None = Field(default=None, description="OpenAI-compatible base URL; defaults to GPT5_API_BASE_URL")
+    api_key: str | None = Field(default=None, description="API key; defaults to GPT5_API_KEY")
+    model: str | None = Field(default=None, description="Default model for this endpoint; a tier-specific model still takes precedence")
+    timeout: float = Field(default=300.0, description="Request timeout in seconds")
+    latency_ms: float = Field(default=0.0, description="Simulated latency for stub providers")
+    jitter_ms: float = Field(default=0.0, description="Simulated latency jitter for stub providers")
+    error_rate: float = Field(default=0.0, ge=0.0, le=1.0, description="Simulated failure rate for stub providers")
+
+
 class AppSettings(BaseModel):
     target_email: EmailStr | None = Field(default=None, description="Default report recipient")
     app_base_url: str = Field(default="http://localhost:8000", description="Base URL for report links")
@@ -123,6 +136,84 @@ class AppSettings(BaseModel):
         default=None,
         description="Optional sampling temperature for GPT-5 evaluations; omit to use API default.",
     )
+    evaluation_tiering: bool = Field(
+        default=False,
+        description="Resolve evaluations with heuristics or a cheaper model first and escalate to GPT-5 when needed",
+    )
+    gpt5_tier1_model: str | None = Field(
+        default=None,
+        description="Cheaper model used as the intermediate evaluation tier; tier 1 is skipped when unset",
+    )
+    tier0_min_confidence: float = Field(
+        default=0.75,
+        description="Minimum heuristic confidence required to accept a tier 0 evaluation",
+    )
+    tier1_min_confidence: float = Field(
+        default=0.6,
+        description="Minimum confidence required to accept a tier 1 evaluation",
+    )
+    tier_max_cefr_spread: int = Field(
+        default=1,
+        description="Largest CEFR level spread across standards a lower tier may show before escalating",
+    )
+    full_model_tenants: tuple[str, ...] = Field(
+        default=(),
+        description="Tenants whose evaluations always use the full GPT-5 model",
+    )
+    llm_providers: tuple[LLMProviderSettings, ...] = Field(
+        default=(),
+        description="OpenAI-compatible endpoints to route evaluations across; empty uses the GPT-5 settings only",
+    )
+    llm_max_error_rate: float = Field(
+        default=0.5,
+        description="Recent error rate above which an LLM provider is only used as a last resort",
+    )
+    llm_cooldown_seconds: float = Field(
+        default=30.0,
+        description="How long an LLM provider is deprioritised after repeated consecutive failures",
+    )
+    batch_evaluation_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of items of one /api/evaluate/batch request evaluated at the same time",
+    )
+    report_reaper_interval_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Longest the background report reaper sleeps between passes over expired reports",
+    )
+    report_reaper_batch_size: int = Field(
+        default=200,
+        ge=1,
+        description="Number of expired reports the reaper deletes per batch",
+    )
+    report_lazy_render: bool = Field(
+        default=False,
+        description="Store only the evaluation JSON for /api/report and render the HTML on first download",
+    )
+    report_keep_evaluation_json: bool = Field(
+        default=False,
+        description="Also store the evaluation JSON next to rendered reports (cohort exports, PDF re-rendering)",
+    )
+    report_pdf_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes rendering report PDFs; 0 disables PDF generation",
+    )
+    report_pdf_queue_size: int = Field(
+        default=32,
+        ge=1,
+        description="PDF jobs that may be queued or running at once before new ones are refused",
+    )
+    report_cache_max_bytes: int = Field(
+        default=16 * 1024 * 1024,
+        ge=0,
+        description="Total size of recently served report bodies kept in memory",
+    )
+    accel_redirect_prefix: str | None = Field(
+        default=None,
+        description="Internal nginx location prefix for X-Accel-Redirect downloads; unset serves files from Python",
+    )
 
     @staticmethod
     def from_env() -> "AppSettings":
@@ -146,6 +237,24 @@ class AppSettings(BaseModel):
             gpt5_api_base_url=os.getenv("GPT5_API_BASE_URL", "https://api.openai.com/v1"),
             gpt5_model=os.getenv("GPT5_MODEL", "gpt-5"),
             gpt5_temperature=_load_temperature(),
+            evaluation_tiering=os.getenv("EVALUATION_TIERING", "false").lower() == "true",
+            gpt5_tier1_model=os.getenv("GPT5_TIER1_MODEL") or None,
+            tier0_min_confidence=_load_float("EVALUATION_TIER0_MIN_CONFIDENCE", 0.75),
+            tier1_min_confidence=_load_float("EVALUATION_TIER1_MIN_CONFIDENCE", 0.6),
+            tier_max_cefr_spread=int(os.getenv("EVALUATION_TIER_MAX_CEFR_SPREAD", "1")),
+            full_model_tenants=_load_csv("GPT5_FULL_MODEL_TENANTS"),
+            llm_providers=_load_llm_providers(),
+            llm_max_error_rate=_load_float("LLM_MAX_ERROR_RATE", 0.5),
+            llm_cooldown_seconds=_load_float("LLM_COOLDOWN_SECONDS", 30.0),
+            batch_evaluation_concurrency=int(os.getenv("BATCH_EVALUATION_CONCURRENCY", "8")),
+            report_reaper_interval_seconds=_load_float("REPORT_REAPER_INTERVAL_SECONDS", 60.0),
+            report_reaper_batch_size=int(os.getenv("REPORT_REAPER_BATCH_SIZE", "200")),
+            report_lazy_render=os.getenv("REPORT_LAZY_RENDER", "false").lower() == "true",
+            report_keep_evaluation_json=os.getenv("REPORT_KEEP_EVALUATION_JSON", "false").lower() == "true",
+            report_pdf_workers=int(os.getenv("REPORT_PDF_WORKERS", "0")),
+            report_pdf_queue_size=int(os.getenv("REPORT_PDF_QUEUE_SIZE", "32")),
+            report_cache_max_bytes=int(os.getenv("REPORT_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+            accel_redirect_prefix=os.getenv("ACCEL_REDIRECT_PREFIX") or None,
         )
 
 
@@ -197,6 +306,40 @@ def _load_temperature() -> float | None:
         raise ValueError("GPT5_TEMPERATURE must be a numeric value") from exc
 
 
+def _load_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+
+    try:
+        return float(raw)
+    except ValueError as exc:  # pragma: no cover - config error surfaced during startup
+        raise ValueError(f"{name} must be a numeric value") from exc
+
+
+def _load_csv(name: str) -> tuple[str, ...]:
+    raw = os.getenv(name)
+    if not raw or not raw.strip():
+        return ()
+    return tuple(item.strip() for item in raw.split(",") if item.strip())
+
+
+def _load_llm_providers() -> tuple[LLMProviderSettings, ...]:
+    """Parse ``LLM_PROVIDERS``, a JSON list of provider objects."""
+
+    raw = os.getenv("LLM_PROVIDERS")
+    if raw is None or raw.strip() == "":
+        return ()
+
+    try:
+        entries = json.loads(raw)
+    except json.JSONDecodeError as exc:  # pragma: no cover - config error surfaced during startup
+        raise ValueError("LLM_PROVIDERS must be a JSON list of provider objects") from exc
+    if not isinstance(entries, list):
+        raise ValueError("LLM_PROVIDERS must be a JSON list of provider objects")
+    return tuple(LLMProviderSettings(**entry) for entry in entries)
+
+
 def _load_trusted_origins() -> tuple[str, ...]:
     """
     Load trusted CORS origins with automatic Render deployment support.
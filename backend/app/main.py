@@ -1,21 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import AsyncIterator, List
 
-from fastapi import Depends, FastAPI, Form, HTTPException, status, Request
+from fastapi import Depends, FastAPI, Form, HTTPException, Query, status, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, JSONResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 import jwt
+from pydantic import ValidationError
+from starlette.requests import ClientDisconnect
 
 
 from .auth import get_current_token
 from .config import get_settings, set_gpt5_api_key, set_email_settings
 from .models import (
+    BatchEvaluationItem,
+    BatchEvaluationResult,
     ChatMessage,
     ChatRequest,
     ChatResponse,
@@ -29,6 +35,9 @@ from .models import (
     EvaluationRequest,
     GPT5KeyRequest,
     GPT5KeyStatus,
+    HeuristicBatchRequest,
+    HeuristicBatchResponse,
+    ProvisionalLevelResponse,
     ReportRequest,
     ReportResponse,
     SessionAudioUploadRequest,
@@ -39,19 +48,41 @@ from .models import (
     SessionStartResponse,
     TranscriptMetadata,
 )
+from .services.batch_scoring import score_transcripts
+from .services.cohort_export import MAX_EXPORT_SESSIONS, build_cohort_archive
 from .services.conversation import next_prompt
-from .services.evaluation import evaluate_transcript
+from .services.error_rules import get_rule_stats
+from .services.evaluation import SUPPORTED_STANDARDS, HeuristicStage, evaluate_transcript
 from .services.gpt5_client import clear_gpt5_client_cache
+from .services.llm_router import get_provider_stats
+from .services.tiering import get_tier_stats
 from .services.emailer import send_email
-from .services.reporting import get_latest_report_for_session, persist_report, resolve_report_token
-from .services.audio import store_session_audio
+from .services.pdf_queue import get_pdf_queue, get_pdf_stats
+from .services.report_delivery import download_headers, etag_matches, get_report_cache_stats, report_headers
+from .services.report_expiry import get_expiry_stats
+from .services.reporting import (
+    get_latest_report_for_session,
+    load_report_body,
+    persist_report,
+    read_report_html,
+    report_accel_headers,
+    resolve_report_pdf,
+    resolve_report_token,
+    schedule_report_pdf,
+    start_report_reaper,
+    stop_report_reaper,
+)
+from .services.audio import recording_accel_headers, session_recording, store_session_audio
 from .services.session_store import get_store
+from .services.zip_stream import parse_range
 from . import portal_sso
 
 app = FastAPI(title="Foreign Language Assessment API", version="0.1.0")
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+MAX_BATCH_LINE_BYTES = 8 * 1024 * 1024
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=list(settings.trusted_origins),
@@ -95,6 +126,18 @@ def health_check() -> dict:
     return {"status": "ok", "timestamp": datetime.utcnow().isoformat()}
 
 
+@app.get("/api/metrics", tags=["health"])
+def service_metrics(_: str = Depends(get_current_token)) -> dict:
+    return {
+        "evaluation_tiers": get_tier_stats(),
+        "llm_providers": get_provider_stats(),
+        "error_rules": get_rule_stats(),
+        "report_expiry": get_expiry_stats(),
+        "report_cache": get_report_cache_stats(),
+        "report_pdf": get_pdf_stats(),
+    }
+
+
 @app.get("/api/me", tags=["auth"])
 def get_current_user_info(request: Request, _: str = Depends(get_current_token)) -> dict:
     """Decode 'delta_token' user cookie to identify admin status."""
@@ -159,7 +202,7 @@ def chat(payload: ChatRequest, _: str = Depends(get_current_token)) -> ChatRespo
             detail="Participant consent is required for this session",
         )
 
-    user_message = ChatMessage(role="user", content=payload.user_message)
+    user_message = ChatMessage(role="user", content=payload.user_message, audio_meta=payload.audio_meta)
     session.add_message(user_message)
     assistant_reply = next_prompt(session.messages, session=session)
     session.add_message(ChatMessage(role="assistant", content=assistant_reply))
@@ -167,6 +210,25 @@ def chat(payload: ChatRequest, _: str = Depends(get_current_token)) -> ChatRespo
     return ChatResponse(assistant_message=assistant_reply, turns_completed=turn_count, mode=session.mode)
 
 
+@app.get(
+    "/api/session/{session_id}/provisional",
+    response_model=ProvisionalLevelResponse,
+    tags=["session"],
+)
+def provisional_level(session_id: str, _: str = Depends(get_current_token)) -> ProvisionalLevelResponse:
+    store = get_store()
+    try:
+        session = store.get(session_id)
+    except KeyError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+    if not session.consent_granted:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Participant consent is required for this session",
+        )
+    return session.live.provisional()
+
+
 @app.post("/api/session/audio", response_model=SessionAudioUploadResponse, tags=["session"])
 def upload_session_audio(payload: SessionAudioUploadRequest, _: str = Depends(get_current_token)) -> SessionAudioUploadResponse:
     print(f"\n{'='*80}")
@@ -211,11 +273,15 @@ def finish_session(payload: SessionFinishRequest, _: str = Depends(get_current_t
     return response
 
 
-@app.post("/api/evaluate", response_model=DualEvaluationResponse, tags=["evaluation"])
-def evaluate(payload: EvaluationRequest, _: str = Depends(get_current_token)) -> DualEvaluationResponse:
+def _resolve_evaluation_input(
+    payload: EvaluationRequest,
+) -> tuple[List[ChatMessage], TranscriptMetadata, HeuristicStage | None]:
+    """Transcript and metadata to evaluate, plus the live heuristic stage for stored sessions."""
+
     store = get_store()
     transcript: List[ChatMessage] = []
     metadata = payload.metadata or TranscriptMetadata()
+    heuristics: HeuristicStage | None = None
 
     if payload.session_id:
         try:
@@ -234,32 +300,320 @@ def evaluate(payload: EvaluationRequest, _: str = Depends(get_current_token)) ->
             "word_count": metadata.word_count or session.word_count,
             "turns": metadata.turns or len([m for m in session.messages if m.role == "user"]),
         })
+        heuristics = session.live.heuristic_stage(transcript)
     elif payload.transcript:
         transcript = payload.transcript
     else:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Provide session_id or transcript")
+    return transcript, metadata, heuristics
+
 
-    evaluation = evaluate_transcript(transcript, session_id=payload.session_id, metadata=metadata)
+@app.post("/api/evaluate", response_model=DualEvaluationResponse, tags=["evaluation"])
+def evaluate(payload: EvaluationRequest, _: str = Depends(get_current_token)) -> DualEvaluationResponse:
+    transcript, metadata, heuristics = _resolve_evaluation_input(payload)
+    evaluation = evaluate_transcript(
+        transcript,
+        session_id=payload.session_id,
+        metadata=metadata,
+        tenant=payload.tenant,
+        require_full_model=payload.require_full_model,
+        heuristics=heuristics,
+    )
     return evaluation
 
 
+def _evaluate_batch_line(index: int, line: bytes) -> bytes:
+    item_id: str | None = None
+    try:
+        item = BatchEvaluationItem.model_validate_json(line)
+        item_id = item.id or str(index)
+        transcript, metadata, heuristics = _resolve_evaluation_input(item)
+        evaluation = evaluate_transcript(
+            transcript,
+            session_id=item.session_id,
+            metadata=metadata,
+            tenant=item.tenant,
+            require_full_model=item.require_full_model,
+            heuristics=heuristics,
+        )
+        result = BatchEvaluationResult(id=item_id, status="ok", result=evaluation)
+    except ValidationError as exc:
+        result = BatchEvaluationResult(
+            id=str(index),
+            status="error",
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            error=f"Invalid batch item: {exc.error_count()} validation error(s)",
+        )
+    except HTTPException as exc:
+        result = BatchEvaluationResult(id=item_id, status="error", status_code=exc.status_code, error=str(exc.detail))
+    except Exception:  # noqa: BLE001 - one failing item must not end the stream
+        logger.exception("Batch evaluation item %s failed", item_id or index)
+        result = BatchEvaluationResult(
+            id=item_id,
+            status="error",
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            error="Evaluation failed",
+        )
+    return result.model_dump_json().encode("utf-8") + b"\n"
+
+
+async def _iter_ndjson_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    buffer = bytearray()
+    index = 0
+    async for chunk in chunks:
+        buffer.extend(chunk)
+        while (newline := buffer.find(b"\n")) >= 0:
+            line = bytes(buffer[:newline])
+            del buffer[: newline + 1]
+            if line.strip():
+                index += 1
+                yield index, line
+        if len(buffer) > MAX_BATCH_LINE_BYTES:
+            raise ValueError(f"Batch item {index + 1} exceeds {MAX_BATCH_LINE_BYTES} bytes")
+    if buffer.strip():
+        yield index + 1, bytes(buffer)
+
+
+async def _stream_batch_results(request: Request, limit: int) -> AsyncIterator[bytes]:
+    """Evaluate NDJSON items as they arrive, at most ``limit`` at a time.
+
+    A slot is held until the item's result has been handed to the response, so a slow
+    reader throttles request parsing and memory stays bounded by ``limit``. When the
+    client goes away no further items are scheduled and pending ones are cancelled.
+    """
+
+    results: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=limit)
+    slots = asyncio.Semaphore(limit)
+    tasks: set[asyncio.Task] = set()
+    gone = asyncio.Event()
+    body_read = False
+
+    async def run_item(index: int, line: bytes) -> None:
+        try:
+            await results.put(await run_in_threadpool(_evaluate_batch_line, index, line))
+        finally:
+            slots.release()
+
+    async def feed() -> None:
+        nonlocal body_read
+        try:
+            async for index, line in _iter_ndjson_lines(request.stream()):
+                await slots.acquire()
+                if gone.is_set():
+                    slots.release()
+                    break
+                task = asyncio.create_task(run_item(index, line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            body_read = True
+        except ClientDisconnect:
+            gone.set()
+        except ValueError as exc:
+            await results.put(
+                BatchEvaluationResult(
+                    status="error",
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    error=str(exc),
+                ).model_dump_json().encode("utf-8")
+                + b"\n"
+            )
+        finally:
+            if gone.is_set():
+                for task in tasks:
+                    task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            await results.put(None)
+
+    feeder = asyncio.create_task(feed())
+    try:
+        while (line := await results.get()) is not None:
+            # ``receive`` belongs to ``request.stream()`` until the body is read; a
+            # disconnect before that surfaces there as ``ClientDisconnect``.
+            if body_read and await request.is_disconnected():
+                gone.set()
+                break
+            yield line
+    finally:
+        feeder.cancel()
+        for task in list(tasks):
+            task.cancel()
+
+
+class _NDJSONStreamingResponse(StreamingResponse):
+    """Streaming response that leaves ``receive`` to the body reader.
+
+    ``StreamingResponse`` listens for disconnects on ``receive`` on older ASGI
+    servers, which would swallow request body chunks the batch endpoint still has
+    to read; a disconnect surfaces through ``request.stream()`` instead, and is
+    polled by ``_stream_batch_results`` once the body has been read.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:  # noqa: ANN001 - ASGI signature
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+@app.post("/api/evaluate/batch", tags=["evaluation"])
+async def evaluate_batch(request: Request, _: str = Depends(get_current_token)) -> StreamingResponse:
+    """Evaluate an NDJSON stream of ``EvaluationRequest`` items (plus an optional ``id``).
+
+    Results are streamed back as NDJSON ``BatchEvaluationResult`` lines in completion
+    order, each tagged with the item's ``id`` (or its 1-based line number).
+    """
+
+    limit = get_settings().batch_evaluation_concurrency
+    return _NDJSONStreamingResponse(_stream_batch_results(request, limit), media_type="application/x-ndjson")
+
+
+@app.post("/api/evaluate/heuristic-batch", response_model=HeuristicBatchResponse, tags=["evaluation"])
+def evaluate_heuristic_batch(payload: HeuristicBatchRequest, _: str = Depends(get_current_token)) -> HeuristicBatchResponse:
+    standards = payload.standards or list(SUPPORTED_STANDARDS)
+    unknown = [standard for standard in standards if standard not in SUPPORTED_STANDARDS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported standards: {', '.join(unknown)}",
+        )
+
+    scores = score_transcripts((item.transcript for item in payload.items), standards=standards)
+    return HeuristicBatchResponse.model_validate({"results": scores.to_records([item.id for item in payload.items])})
+
+
 @app.post("/api/report", response_model=ReportResponse, tags=["report"])
 def generate_report(payload: ReportRequest, _: str = Depends(get_current_token)) -> ReportResponse:
-    html, url = persist_report(payload.evaluation, session_metadata=payload.session_metadata)
-    return ReportResponse(report_url=url, pdf_url=None, html=html)
+    html, url = persist_report(payload.evaluation, session_metadata=payload.session_metadata, tenant=payload.tenant)
+    pdf_url = schedule_report_pdf(url, payload.evaluation, payload.session_metadata, tenant=payload.tenant)
+    return ReportResponse(report_url=url, pdf_url=pdf_url, html=html)
 
 
 @app.get("/api/reports/{token}", tags=["report"])
-def download_report(token: str) -> FileResponse:
+def download_report(token: str, request: Request) -> Response:
     try:
         record = resolve_report_token(token)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
-    if not record.path.exists():
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found")
+    offload = report_accel_headers(record)
+    if offload is not None:
+        headers = download_headers(record.filename, record.expires_at, datetime.utcnow())
+        return Response(media_type="text/html", headers={**headers, **offload})
+
+    try:
+        body = load_report_body(record, request.headers.get("accept-encoding"))
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found") from exc
+
+    headers = report_headers(record, body, datetime.utcnow())
+    if etag_matches(request.headers.get("if-none-match"), body.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body.content, media_type="text/html", headers=headers)
+
+
+@app.get("/api/reports/{token}/pdf", tags=["report"])
+def download_report_pdf(token: str, request: Request) -> Response:
+    try:
+        record = resolve_report_pdf(resolve_report_token(token))
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    if record is None:
+        return JSONResponse(
+            {"status": "rendering"},
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Retry-After": "2", "Cache-Control": "no-store"},
+        )
+
+    offload = report_accel_headers(record)
+    if offload is not None:
+        headers = download_headers(record.filename, record.expires_at, datetime.utcnow())
+        return Response(media_type="application/pdf", headers={**headers, **offload})
 
-    return FileResponse(path=record.path, media_type="text/html", filename=record.filename)
+    try:
+        body = load_report_body(record, request.headers.get("accept-encoding"))
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Report not found") from exc
+
+    headers = report_headers(record, body, datetime.utcnow())
+    if etag_matches(request.headers.get("if-none-match"), body.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body.content, media_type="application/pdf", headers=headers)
+
+
+@app.get("/api/reports/{token}/audio", tags=["report"])
+def download_report_audio(token: str) -> Response:
+    try:
+        record = resolve_report_token(token)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    recording = session_recording(record.session_id)
+    if recording is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recording not found")
+
+    headers = download_headers(recording.name, record.expires_at, datetime.utcnow())
+    offload = recording_accel_headers(recording)
+    if offload is not None:
+        return Response(media_type="audio/mpeg", headers={**headers, **offload})
+    return FileResponse(recording, media_type="audio/mpeg", headers=headers)
+
+
+@app.get("/api/exports/cohort", tags=["report"])
+def export_cohort(
+    request: Request,
+    session_id: List[str] = Query(default=[], max_length=MAX_EXPORT_SESSIONS),
+    tenant: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    _: str = Depends(get_current_token),
+) -> Response:
+    if not (session_id or tenant or created_from or created_to):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Select sessions by session_id, tenant or a created_from/created_to range",
+        )
+    try:
+        archive = build_cohort_archive(
+            session_ids=session_id or None,
+            tenant=tenant,
+            created_from=created_from,
+            created_to=created_to,
+        )
+    except LookupError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": archive.etag,
+        "Content-Disposition": 'attachment; filename="cohort-export.zip"',
+    }
+    if_range = request.headers.get("if-range")
+    requested = request.headers.get("range") if if_range in (None, archive.etag) else None
+    try:
+        byte_range = parse_range(requested, archive.size)
+    except ValueError:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, "Content-Range": f"bytes */{archive.size}"},
+        )
+    if byte_range is None:
+        return StreamingResponse(
+            archive.iter_bytes(),
+            media_type="application/zip",
+            headers={**headers, "Content-Length": str(archive.size)},
+        )
+    start, end = byte_range
+    return StreamingResponse(
+        archive.iter_bytes(start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type="application/zip",
+        headers={
+            **headers,
+            "Content-Length": str(end - start + 1),
+            "Content-Range": f"bytes {start}-{end}/{archive.size}",
+        },
+    )
 
 
 @app.post("/api/email", response_model=EmailResponse, tags=["email"])
@@ -347,7 +701,7 @@ def send_report_email(payload: EmailRequest, _: str = Depends(get_current_token)
                 )
             else:
                 try:
-                    report_bytes = report_record.path.read_bytes()
+                    report_bytes = read_report_html(report_record)
                     encoded_report = base64.b64encode(report_bytes).decode("ascii")
                     attachments.append(
                         EmailAttachment(
@@ -496,6 +850,13 @@ def configure_gpt5(payload: GPT5KeyRequest, _: str = Depends(get_current_token))
 def startup_event() -> None:
     # Preload settings to ensure env validation occurs early
     _ = settings
+    start_report_reaper()
+
+
+@app.on_event("shutdown")
+def shutdown_event() -> None:
+    stop_report_reaper()
+    get_pdf_queue().shutdown(wait=False)
 
 
 _frontend_dist = _resolve_frontend_dist()
@@ -0,0 +1,199 @@
+"""Mock OpenAI-compatible GPT-5 server for load tests and offline development.
+
+Point ``GPT5_API_BASE_URL`` at ``http://<host>:<port>/v1`` and any ``GPT5_API_KEY``.
+Responses are schema-valid evaluations built by the stub provider; latency, error
+rate and streaming behaviour are configurable from the command line or the
+``MOCK_GPT5_*`` environment variables::
+
+    python -m backend.app.mock_gpt5 --port 8100 --latency-ms 800 --latency-dist lognormal --error-rate 0.02
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import time
+import uuid
+from dataclasses import dataclass
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from .services.llm_stub import build_stub_evaluation
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal")
+
+
+@dataclass
+class MockConfig:
+    latency_ms: float = 0.0
+    latency_spread_ms: float = 0.0
+    latency_dist: str = "fixed"
+    error_rate: float = 0.0
+    error_status: int = 500
+    stream_chunk_chars: int = 64
+    seed: int | None = None
+
+    @staticmethod
+    def from_env() -> "MockConfig":
+        seed = os.getenv("MOCK_GPT5_SEED")
+        return MockConfig(
+            latency_ms=float(os.getenv("MOCK_GPT5_LATENCY_MS", "0")),
+            latency_spread_ms=float(os.getenv("MOCK_GPT5_LATENCY_SPREAD_MS", "0")),
+            latency_dist=os.getenv("MOCK_GPT5_LATENCY_DIST", "fixed"),
+            error_rate=float(os.getenv("MOCK_GPT5_ERROR_RATE", "0")),
+            error_status=int(os.getenv("MOCK_GPT5_ERROR_STATUS", "500")),
+            stream_chunk_chars=int(os.getenv("MOCK_GPT5_STREAM_CHUNK_CHARS", "64")),
+            seed=int(seed) if seed else None,
+        )
+
+
+class LatencySampler:
+    def __init__(self, config: MockConfig) -> None:
+        if config.latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{config.latency_dist}'")
+        self._config = config
+        self._random = random.Random(config.seed)
+
+    def sample_seconds(self) -> float:
+        mean = self._config.latency_ms
+        spread = self._config.latency_spread_ms
+        dist = self._config.latency_dist
+        if dist == "uniform":
+            value = self._random.uniform(mean - spread, mean + spread)
+        elif dist == "normal":
+            value = self._random.gauss(mean, spread)
+        elif dist == "lognormal" and mean > 0:
+            # ``latency_ms`` is the median and ``spread / latency`` the shape parameter.
+            value = self._random.lognormvariate(math.log(mean), spread / mean)
+        else:
+            value = mean
+        return max(0.0, value) / 1000
+
+    def should_fail(self) -> bool:
+        return self._config.error_rate > 0 and self._random.random() < self._config.error_rate
+
+
+def _extract_metrics(body: dict) -> dict:
+    for message in reversed(body.get("messages") or []):
+        if not isinstance(message, dict) or message.get("role") != "user":
+            continue
+        try:
+            content = json.loads(message.get("content") or "{}")
+        except (TypeError, json.JSONDecodeError):
+            return {}
+        metrics = content.get("metrics") if isinstance(content, dict) else None
+        return metrics if isinstance(metrics, dict) else {}
+    return {}
+
+
+def _completion(model: str, content: str) -> dict:
+    return {
+        "id": f"chatcmpl-mock-{uuid.uuid4().hex[:12]}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+        "usage": {"prompt_tokens": 0, "completion_tokens": len(content) // 4, "total_tokens": len(content) // 4},
+    }
+
+
+def _chunk(completion_id: str, model: str, delta: dict, finish_reason: str | None = None) -> str:
+    payload = {
+        "id": completion_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def create_app(config: MockConfig | None = None) -> FastAPI:
+    config = config or MockConfig.from_env()
+    sampler = LatencySampler(config)
+    mock_app = FastAPI(title="Mock GPT-5 API", version="0.1.0")
+    mock_app.state.config = config
+
+    @mock_app.get("/v1/models")
+    async def list_models() -> dict:
+        return {"object": "list", "data": [{"id": "gpt-5", "object": "model", "owned_by": "mock"}]}
+
+    @mock_app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):  # noqa: ANN202 - JSON or streaming response
+        body = await request.json()
+        model = str(body.get("model") or "gpt-5")
+        latency = sampler.sample_seconds()
+
+        if sampler.should_fail():
+            await asyncio.sleep(latency)
+            return JSONResponse(
+                status_code=config.error_status,
+                content={"error": {"message": "Simulated upstream failure", "type": "mock_error"}},
+            )
+
+        content = json.dumps(build_stub_evaluation(_extract_metrics(body)), ensure_ascii=False)
+        if not body.get("stream"):
+            await asyncio.sleep(latency)
+            return _completion(model, content)
+
+        size = max(1, config.stream_chunk_chars)
+        pieces = [content[i : i + size] for i in range(0, len(content), size)]
+        completion_id = f"chatcmpl-mock-{uuid.uuid4().hex[:12]}"
+
+        async def event_stream():  # noqa: ANN202 - async generator
+            yield _chunk(completion_id, model, {"role": "assistant"})
+            for piece in pieces:
+                await asyncio.sleep(latency / len(pieces))
+                yield _chunk(completion_id, model, {"content": piece})
+            yield _chunk(completion_id, model, {}, finish_reason="stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+    return mock_app
+
+
+app = create_app()
+
+
+def main(argv: list[str] | None = None) -> None:
+    import uvicorn
+
+    defaults = MockConfig.from_env()
+    parser = argparse.ArgumentParser(description="Run a mock OpenAI-compatible GPT-5 server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--latency-spread-ms", type=float, default=defaults.latency_spread_ms)
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default=defaults.latency_dist)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--stream-chunk-chars", type=int, default=defaults.stream_chunk_chars)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args(argv)
+
+    config = MockConfig(
+        latency_ms=args.latency_ms,
+        latency_spread_ms=args.latency_spread_ms,
+        latency_dist=args.latency_dist,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        stream_chunk_chars=args.stream_chunk_chars,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
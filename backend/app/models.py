@@ -18,6 +18,7 @@ class ChatMessage(BaseModel):
     role: str
     content: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
+    audio_meta: Optional[dict] = Field(default=None, description="Audio metadata sent with the message, if any")
 
 
 class SessionConsent(BaseModel):
@@ -64,10 +65,70 @@ class SessionFinishResponse(BaseModel):
     duration_seconds: int
 
 
+class ProvisionalStandardScore(BaseModel):
+    standard_id: str
+    label: str
+    overall: float
+    cefr: str
+
+
+class ProvisionalLevelResponse(BaseModel):
+    session_id: str
+    turns: int
+    total_words: int
+    consensus_cefr: str
+    standards: List[ProvisionalStandardScore]
+
+
 class EvaluationRequest(BaseModel):
     session_id: Optional[str] = None
     transcript: Optional[List[ChatMessage]] = None
     metadata: Optional["TranscriptMetadata"] = None
+    tenant: Optional[str] = Field(default=None, description="Tenant slug the evaluation is performed for")
+    require_full_model: bool = Field(
+        default=False,
+        description="Skip the cheaper evaluation tiers and always use the full GPT-5 model",
+    )
+
+
+class BatchEvaluationItem(EvaluationRequest):
+    id: Optional[str] = Field(default=None, description="Client identifier echoed back on the result line")
+
+
+class BatchEvaluationResult(BaseModel):
+    id: Optional[str] = None
+    status: str = Field(pattern="^(ok|error)$")
+    status_code: int = 200
+    result: Optional["DualEvaluationResponse"] = None
+    error: Optional[str] = None
+
+
+class HeuristicBatchItem(BaseModel):
+    id: str
+    transcript: List[ChatMessage]
+
+
+class HeuristicBatchRequest(BaseModel):
+    items: List[HeuristicBatchItem] = Field(min_length=1)
+    standards: Optional[List[str]] = Field(
+        default=None,
+        description="Standards to score; defaults to every supported standard",
+    )
+
+
+class HeuristicStandardScore(BaseModel):
+    overall: float
+    cefr: str
+    criteria: Dict[str, float]
+
+
+class HeuristicBatchResult(BaseModel):
+    id: str
+    standards: Dict[str, HeuristicStandardScore]
+
+
+class HeuristicBatchResponse(BaseModel):
+    results: List[HeuristicBatchResult]
 
 
 class TranscriptMetadata(BaseModel):
@@ -131,12 +192,13 @@ class DualEvaluationResponse(BaseModel):
 class ReportRequest(BaseModel):
     evaluation: DualEvaluationResponse
     session_metadata: Optional[dict] = None
+    tenant: Optional[str] = Field(default=None, description="Tenant slug whose report template overrides apply")
 
 
 class ReportResponse(BaseModel):
     report_url: str
     pdf_url: Optional[str] = None
-    html: str
+    html: Optional[str] = Field(default=None, description="Rendered report; omitted when reports are rendered lazily")
 
 
 class EmailAttachment(BaseModel):
@@ -1,9 +1,24 @@
 __all__ = [
+    "accel_redirect",
+    "batch_scoring",
+    "cohort_export",
     "conversation",
+    "error_rules",
     "evaluation",
     "gpt5_client",
+    "llm_router",
+    "llm_stub",
+    "pdf_queue",
+    "pdf_writer",
     "emailer",
+    "report_delivery",
+    "report_expiry",
+    "report_index",
     "reporting",
+    "scoring",
+    "schema",
     "session_store",
     "audio",
+    "tiering",
+    "zip_stream",
 ]
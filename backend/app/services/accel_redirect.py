@@ -0,0 +1,36 @@
+"""Hand file downloads over to nginx with ``X-Accel-Redirect``.
+
+With ``ACCEL_REDIRECT_PREFIX`` set (e.g. ``/_protected``), download endpoints check
+the token and answer with an empty response naming the file under an ``internal``
+nginx location: ``<prefix>/reports/`` for ``REPORTS_DIR`` and ``<prefix>/audio/`` for
+``AUDIO_DIR``. nginx then sends the file itself, including ranges, conditional
+requests and the ``.gz`` variant (``gzip_static``). The Python worker is free as soon
+as the headers are sent. Of the backend's headers nginx keeps ``Content-Type``,
+``Content-Disposition``, ``Cache-Control`` and ``Expires`` (see ``nginx.conf``).
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict
+from urllib.parse import quote
+
+from ..config import get_settings
+
+REPORTS_LOCATION = "reports"
+AUDIO_LOCATION = "audio"
+
+
+def accel_redirect_enabled() -> bool:
+    return bool(get_settings().accel_redirect_prefix)
+
+
+def accel_redirect_headers(location: str, root: Path, path: Path) -> Dict[str, str]:
+    """The ``X-Accel-Redirect`` header sending ``path`` from the nginx alias of ``root``.
+
+    Raises ``ValueError`` when ``path`` is not inside ``root``.
+    """
+
+    prefix = (get_settings().accel_redirect_prefix or "").rstrip("/")
+    relative = path.resolve().relative_to(root.resolve())
+    return {"X-Accel-Redirect": f"{prefix}/{location}/{quote(relative.as_posix())}"}
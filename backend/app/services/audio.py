@@ -9,11 +9,13 @@ import subprocess
 import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from fastapi import HTTPException, status
 
 from ..models import SessionAudioUploadRequest
+from . import reporting
+from .accel_redirect import AUDIO_LOCATION, accel_redirect_enabled, accel_redirect_headers
 from .session_store import get_store
 
 logger = logging.getLogger(__name__)
@@ -160,6 +162,7 @@ def store_session_audio(payload: SessionAudioUploadRequest) -> tuple[str, Path]:
 
     target_path.write_bytes(mp3_audio)
     session.audio_recording_path = target_path
+    reporting.register_recording(session.session_id, target_path)
     session.audio_recorded_at = report_date
 
     print(f"[AUDIO STORE] ✅ Stored audio recording for session {session.session_id}")
@@ -168,3 +171,23 @@ def store_session_audio(payload: SessionAudioUploadRequest) -> tuple[str, Path]:
     print(f"[AUDIO STORE] Session audio_recording_path set to: {session.audio_recording_path}")
     logger.info("Stored audio recording for session %s at %s", session.session_id, target_path)
     return filename, target_path
+
+
+def session_recording(session_id: str) -> Path | None:
+    """The stored MP3 of ``session_id``, if one was uploaded and still exists.
+
+    Looked up in the report index, so it is found after a restart and on any worker.
+    """
+
+    recording = reporting.recording_for_session(session_id)
+    if recording is None or not recording.exists():
+        return None
+    return recording
+
+
+def recording_accel_headers(recording: Path) -> Dict[str, str] | None:
+    """Headers letting nginx send ``recording``, or ``None`` to serve it here."""
+
+    if not accel_redirect_enabled():
+        return None
+    return accel_redirect_headers(AUDIO_LOCATION, AUDIO_DIR, recording)
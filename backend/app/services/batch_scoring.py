@@ -0,0 +1,250 @@
+"""Vectorised heuristic scoring for re-scoring many transcripts at once.
+
+The compiled scorers in :mod:`scoring` walk one transcript at a time. This module
+applies the same scorers as matrices: metric features for N transcripts form an
+``N × F`` array, each standard's criterion coefficients a ``C × F`` matrix and its
+rubric weights a ``C`` vector, so every standard's criteria, overall score and
+CEFR label come out of a few NumPy passes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+import numpy as np
+
+from .evaluation import SUPPORTED_STANDARDS
+from .lexicon import ADVANCED_FROM, OFF_LIST, get_lexicon
+from .metrics import scan_message
+from .relevance import score_pairs
+from .scoring import FEATURES, CEFRTable, StandardScorer, compile_scorer, get_scorer
+
+
+@dataclass(frozen=True)
+class FeatureArrays:
+    total_words: np.ndarray
+    unique_words: np.ndarray
+    avg_sentence_length: np.ndarray
+    advanced_word_share: np.ndarray
+    topic_relevance: np.ndarray
+    words_per_sentence: np.ndarray
+    connector_density: np.ndarray
+    turns: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.total_words.shape[0])
+
+
+@dataclass(frozen=True)
+class StandardScores:
+    standard_id: str
+    criteria_ids: List[str]
+    criteria: np.ndarray  # N × C
+    overall: np.ndarray  # N
+    cefr: np.ndarray  # N, dtype=object
+
+
+@dataclass(frozen=True)
+class BatchScores:
+    features: FeatureArrays
+    standards: Dict[str, StandardScores]
+
+    def to_records(self, ids: Sequence[str] | None = None) -> List[dict]:
+        count = len(self.features)
+        ids = list(ids) if ids is not None else [str(index) for index in range(count)]
+        records: List[dict] = [{"id": ids[index], "standards": {}} for index in range(count)]
+        for standard_id, scores in self.standards.items():
+            criteria = scores.criteria.tolist()
+            overall = scores.overall.tolist()
+            for index, record in enumerate(records):
+                record["standards"][standard_id] = {
+                    "overall": overall[index],
+                    "cefr": scores.cefr[index],
+                    "criteria": dict(zip(scores.criteria_ids, criteria[index])),
+                }
+        return records
+
+
+def _role_content(message: object) -> tuple[str, str]:
+    if isinstance(message, Mapping):
+        return str(message.get("role", "")), str(message.get("content", ""))
+    return getattr(message, "role", ""), getattr(message, "content", "")
+
+
+def extract_features(transcripts: Iterable[Iterable[object]]) -> FeatureArrays:
+    """Compute the heuristic metric features of every transcript in one sweep."""
+
+    vocabulary: Dict[str, int] = {}
+    message_words: List[int] = []
+    message_owner: List[int] = []
+    token_ids: List[int] = []
+    token_owner: List[int] = []
+    lexical_vocabulary: Dict[str, int] = {}
+    lexical_ids: List[int] = []
+    lexical_owner: List[int] = []
+    questions: List[str] = []
+    answers: List[str] = []
+    pair_owner: List[int] = []
+    sentence_words: List[int] = []
+    sentence_owner: List[int] = []
+    connector_owner: List[int] = []
+    count = 0
+    for index, transcript in enumerate(transcripts):
+        count = index + 1
+        last_prompt: str | None = None
+        for message in transcript:
+            role, content = _role_content(message)
+            if role != "user":
+                last_prompt = content
+                continue
+            if last_prompt is not None:
+                questions.append(last_prompt)
+                answers.append(content)
+                pair_owner.append(index)
+            words = content.split()
+            message_words.append(len(words))
+            message_owner.append(index)
+            for word in words:
+                token_ids.append(vocabulary.setdefault(word.lower().strip(",.?!"), len(vocabulary)))
+            token_owner.extend([index] * len(words))
+            scan = scan_message(content)
+            lexical_ids.extend(lexical_vocabulary.setdefault(token, len(lexical_vocabulary)) for token in scan.tokens)
+            lexical_owner.extend([index] * len(scan.tokens))
+            sentence_words.extend(scan.sentence_lengths)
+            sentence_owner.extend([index] * len(scan.sentence_lengths))
+            connector_owner.extend([index] * len(scan.connectors))
+
+    owners = np.asarray(message_owner, dtype=np.int64)
+    totals = np.bincount(owners, weights=np.asarray(message_words, dtype=np.float64), minlength=count)
+    turns = np.bincount(owners, minlength=count).astype(np.float64)
+    if token_ids:
+        keys = np.asarray(token_owner, dtype=np.int64) * len(vocabulary) + np.asarray(token_ids, dtype=np.int64)
+        unique = np.bincount(np.unique(keys) // len(vocabulary), minlength=count).astype(np.float64)
+    else:
+        unique = np.zeros(count, dtype=np.float64)
+
+    # One lexicon lookup per distinct token across the whole batch.
+    token_bands = get_lexicon().lookup(list(lexical_vocabulary))[np.asarray(lexical_ids, dtype=np.int64)]
+    owners = np.asarray(lexical_owner, dtype=np.int64)
+    listed = np.bincount(owners, weights=(token_bands < OFF_LIST).astype(np.float64), minlength=count)
+    advanced = np.bincount(
+        owners, weights=((token_bands >= ADVANCED_FROM) & (token_bands < OFF_LIST)).astype(np.float64), minlength=count
+    )
+    advanced_share = np.divide(advanced, listed, out=np.zeros(count, dtype=np.float64), where=listed > 0)
+
+    # Every question/answer pair of the batch is scored in a single vectorised call.
+    pairs = np.asarray(pair_owner, dtype=np.int64)
+    relevance_sum = np.bincount(pairs, weights=score_pairs(questions, answers), minlength=count)
+    paired_turns = np.bincount(pairs, minlength=count).astype(np.float64)
+    relevance = np.divide(relevance_sum, paired_turns, out=np.zeros(count, dtype=np.float64), where=paired_turns > 0)
+
+    # Rounded like TranscriptMetrics, so both scorers see the same feature values.
+    owners = np.asarray(sentence_owner, dtype=np.int64)
+    sentence_totals = np.bincount(owners, weights=np.asarray(sentence_words, dtype=np.float64), minlength=count)
+    sentences = np.bincount(owners, minlength=count).astype(np.float64)
+    per_sentence = np.divide(sentence_totals, sentences, out=np.zeros(count, dtype=np.float64), where=sentences > 0)
+    connectors = np.bincount(np.asarray(connector_owner, dtype=np.int64), minlength=count).astype(np.float64)
+    density = np.divide(connectors * 100, totals, out=np.zeros(count, dtype=np.float64), where=totals > 0)
+
+    return FeatureArrays(
+        total_words=totals,
+        unique_words=unique,
+        avg_sentence_length=totals / np.maximum(turns, 1.0),
+        advanced_word_share=advanced_share,
+        topic_relevance=relevance,
+        words_per_sentence=_round(per_sentence, 2),
+        connector_density=_round(density, 2),
+        turns=turns,
+    )
+
+
+def _round(values: np.ndarray, digits: int) -> np.ndarray:
+    """Round like the builtin ``round``, which the scalar scorers use.
+
+    ``np.round`` scales by ``10**digits`` first and can land on the other side of a
+    tie than Python's correctly rounded result; only those near-tie elements are
+    re-rounded one by one.
+    """
+
+    rounded = np.round(values, digits)
+    scaled = values * 10.0**digits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(float(value), digits) for value in values[near_tie]]
+    return rounded
+
+
+def _cefr_lookup(overall: np.ndarray, table: CEFRTable) -> np.ndarray:
+    labels = np.full(overall.shape, "Undetermined", dtype=object)
+    if not table.labels:
+        return labels
+    maxs = np.asarray(table.maxs, dtype=np.float64)
+    names = np.asarray(table.labels, dtype=object)
+    position = np.searchsorted(np.asarray(table.mins, dtype=np.float64), overall, side="right") - 1
+    clipped = np.clip(position, 0, len(names) - 1)
+    matched = (position >= 0) & (overall <= maxs[clipped])
+    labels[matched] = names[clipped[matched]]
+    return labels
+
+
+def score_with_scorer(features: FeatureArrays, scorer: StandardScorer) -> StandardScores:
+    """Vectorised equivalent of :meth:`StandardScorer.score_criteria`, ``overall`` and ``cefr``."""
+
+    raw = np.stack([getattr(features, feature) for feature in FEATURES], axis=1)
+    clipped_features = np.minimum(1.0, raw / np.asarray(scorer.normalizers, dtype=np.float64))
+    coefficients = np.asarray(scorer.coefficients, dtype=np.float64)  # C × F
+
+    # Accumulate feature by feature rather than with ``@`` so neither summation order nor
+    # fused multiply-add changes the rounding relative to the scalar scorer.
+    normalized = np.zeros((len(features), len(scorer.criteria_ids)), dtype=np.float64)
+    for index in range(coefficients.shape[1]):
+        normalized = normalized + coefficients[:, index] * clipped_features[:, index : index + 1]
+    scores = scorer.heuristic_min + normalized * scorer.heuristic_span
+    if scorer.step:
+        scores = np.round(scores / scorer.step) * scorer.step
+    low = scorer.scale_min if scorer.scale_min is not None else -np.inf
+    high = scorer.scale_max if scorer.scale_max is not None else np.inf
+    scores = _round(np.clip(scores, low, high), 2)
+
+    overall = np.zeros(len(features), dtype=np.float64)
+    for index, weight in enumerate(scorer.weights):
+        overall = overall + weight * scores[:, index]
+    overall = _round(overall, scorer.round_to)
+    if scorer.scale_min is not None:
+        overall = np.maximum(overall, scorer.scale_min)
+    if scorer.scale_max is not None:
+        overall = np.minimum(overall, scorer.scale_max)
+
+    return StandardScores(
+        standard_id=scorer.standard_id,
+        criteria_ids=list(scorer.criteria_ids),
+        criteria=scores,
+        overall=overall,
+        cefr=_cefr_lookup(overall, scorer.cefr_table),
+    )
+
+
+def score_features(
+    features: FeatureArrays,
+    standards: Sequence[str] = SUPPORTED_STANDARDS,
+    configs: Mapping[str, dict] | None = None,
+) -> BatchScores:
+    """Score precomputed features for every requested standard."""
+
+    results: Dict[str, StandardScores] = {}
+    for standard_id in standards:
+        override = (configs or {}).get(standard_id)
+        scorer = compile_scorer(override) if override else get_scorer(standard_id)
+        results[standard_id] = score_with_scorer(features, scorer)
+    return BatchScores(features=features, standards=results)
+
+
+def score_transcripts(
+    transcripts: Iterable[Iterable[object]],
+    standards: Sequence[str] = SUPPORTED_STANDARDS,
+    configs: Mapping[str, dict] | None = None,
+) -> BatchScores:
+    """Heuristically score many transcripts; ``configs`` overrides on-disk rubric configs."""
+
+    return score_features(extract_features(transcripts), standards=standards, configs=configs)
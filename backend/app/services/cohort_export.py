@@ -0,0 +1,91 @@
+"""Cohort export: one ZIP with the report, recording and evaluation of many sessions.
+
+For every selected session the newest unexpired report is exported as
+``<session_id>/<report filename>``, its evaluation as ``<session_id>/evaluation.json``
+and, when one was uploaded, the MP3 as ``<session_id>/<recording filename>``.
+The archive is planned from the report index and streamed by :mod:`.zip_stream`.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from typing import List, Sequence
+
+from ..models import DualEvaluationResponse
+from . import reporting
+from .audio import session_recording
+from .report_index import ReportRecord
+from .zip_stream import ZipArchive, ZipEntry, file_entry, generated_entry
+
+MAX_EXPORT_SESSIONS = 500
+_UNSAFE_NAME = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def _folder(session_id: str) -> str:
+    return _UNSAFE_NAME.sub("-", session_id).strip(".-") or "session"
+
+
+def _evaluation_json(record: ReportRecord) -> bytes:
+    document = reporting.load_evaluation_document(record)
+    evaluation = DualEvaluationResponse.model_validate(document["evaluation"])
+    return evaluation.model_dump_json(indent=2).encode("utf-8")
+
+
+def _session_entries(record: ReportRecord) -> List[ZipEntry]:
+    folder = _folder(record.session_id)
+    if record.path.suffix == ".html":
+        entries = [file_entry(f"{folder}/{record.filename}", record.path)]
+    else:
+        # Not keyed: the rendering also depends on the (reloadable) templates.
+        entries = [
+            generated_entry(f"{folder}/{record.filename}", lambda: reporting.read_report_html(record), record.created_at)
+        ]
+
+    source = reporting.evaluation_source(record)
+    if source.exists():
+        entries.append(
+            generated_entry(
+                f"{folder}/evaluation.json",
+                lambda: _evaluation_json(record),
+                record.created_at,
+                key=("evaluation", str(source), source.stat().st_mtime_ns),
+            )
+        )
+
+    recording = session_recording(record.session_id)
+    if recording is not None:
+        entries.append(file_entry(f"{folder}/{recording.name}", recording))
+    return entries
+
+
+def build_cohort_archive(
+    *,
+    session_ids: Sequence[str] | None = None,
+    tenant: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> ZipArchive:
+    """Plan the export.
+
+    Raises ``LookupError`` when no report matches and ``ValueError`` when more than
+    :data:`MAX_EXPORT_SESSIONS` sessions do.
+    """
+
+    records = reporting.reports_for_export(
+        session_ids=session_ids,
+        tenant=tenant,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    if len(records) > MAX_EXPORT_SESSIONS:
+        raise ValueError(f"More than {MAX_EXPORT_SESSIONS} sessions match; narrow the export filters")
+    entries: List[ZipEntry] = []
+    for record in records:
+        try:
+            entries.extend(_session_entries(record))
+        except FileNotFoundError:
+            continue  # reaped between the index lookup and now
+    if not entries:
+        raise LookupError("No reports match the export filters")
+    return ZipArchive(entries)
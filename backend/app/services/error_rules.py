@@ -0,0 +1,306 @@
+"""Config-driven common-error detection compiled into a single-pass scanner.
+
+Rules live in ``configs/error_rules.json``. Phrase rules are compiled into one
+Aho-Corasick automaton and regex / token-sequence rules into one combined regular
+expression, so a transcript is scanned once no matter how many rules exist:
+
+* ``phrase`` – case-insensitive substrings (``"word_boundary": true`` for whole words)
+* ``regex`` – a pattern applied to each lower-cased message (``^``/``$`` anchor per message);
+  matches never span two messages. Backreferences and named groups are rejected
+  because the pattern is embedded in the combined expression.
+* ``token_sequence`` – consecutive words, each token may list ``|``-separated alternatives
+* ``min_tokens`` – fires for messages shorter than ``min_tokens`` words
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from bisect import bisect_right
+from collections import Counter, deque
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from ..models import CommonError
+from .scoring import CONFIG_ROOT
+
+RULES_PATH = CONFIG_ROOT / "error_rules.json"
+RULE_TYPES = ("phrase", "regex", "token_sequence", "min_tokens")
+# ``\1`` or ``(?P=name)`` not preceded by an escaping backslash.
+_BACKREFERENCE = re.compile(r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\(\?P=)")
+
+
+@dataclass(frozen=True)
+class ErrorRule:
+    rule_id: str
+    kind: str
+    issue: str
+    fix: str
+    phrases: Tuple[str, ...] = ()
+    pattern: str | None = None
+    min_tokens: int = 0
+    word_boundary: bool = False
+
+    def to_error(self) -> CommonError:
+        return CommonError(issue=self.issue, fix=self.fix)
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char in "_'"
+
+
+class AhoCorasick:
+    """Multi-pattern substring matcher; ``iter_matches`` yields ``(end, payload)`` pairs."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, object]]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[object]] = [[]]
+        for pattern, payload in patterns:
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(payload)
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def __bool__(self) -> bool:
+        return len(self._goto) > 1
+
+    def iter_matches(self, text: str):  # noqa: ANN201 - generator of (end index, payload)
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for payload in output[state]:
+                    yield index, payload
+
+
+def _token_sequence_pattern(tokens: Sequence[str]) -> str:
+    parts = ["(?:" + "|".join(re.escape(option.strip().lower()) for option in token.split("|")) + ")" for token in tokens]
+    return r"(?<![\w'])" + r"[^\w\n]+".join(parts) + r"(?![\w'])"
+
+
+def _parse_rule(raw: dict, index: int) -> ErrorRule:
+    kind = raw.get("type", "phrase")
+    if kind not in RULE_TYPES:
+        raise ValueError(f"Error rule {raw.get('id', index)!r} has unknown type {kind!r}")
+    rule_id = str(raw.get("id") or f"rule_{index}")
+    common = {"rule_id": rule_id, "kind": kind, "issue": raw["issue"], "fix": raw["fix"]}
+    if kind == "phrase":
+        phrases = tuple(str(phrase).lower() for phrase in raw.get("phrases", []) if str(phrase))
+        if not phrases or any("\n" in phrase for phrase in phrases):
+            raise ValueError(f"Phrase rule {rule_id!r} needs single-line phrases")
+        return ErrorRule(**common, phrases=phrases, word_boundary=bool(raw.get("word_boundary", False)))
+    if kind == "regex":
+        pattern = str(raw["pattern"])
+        if re.compile(pattern).groupindex or _BACKREFERENCE.search(pattern):
+            raise ValueError(f"Regex rule {rule_id!r} must not use named groups or backreferences")
+        re.compile(f"(?P<_r{index}>{pattern})")  # e.g. a global flag not at the start
+        return ErrorRule(**common, pattern=pattern)
+    if kind == "token_sequence":
+        tokens = raw.get("tokens") or []
+        if not tokens:
+            raise ValueError(f"Token-sequence rule {rule_id!r} has no tokens")
+        return ErrorRule(**common, pattern=_token_sequence_pattern(tokens))
+    return ErrorRule(**common, min_tokens=int(raw["min_tokens"]))
+
+
+class RuleStats:
+    """Thread-safe per-rule hit counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset_unlocked()
+
+    def _reset_unlocked(self) -> None:
+        self._scans = 0
+        self._messages = 0
+        self._hits: Counter[str] = Counter()
+
+    def record_scan(self, messages: int, hits: Counter) -> None:
+        with self._lock:
+            self._scans += 1
+            self._messages += messages
+            self._hits.update(hits)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"scans": self._scans, "messages": self._messages, "hits": dict(self._hits)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset_unlocked()
+
+
+RULE_STATS = RuleStats()
+
+
+class ErrorRuleSet:
+    """Compiled rule set; ``detect`` keeps the historical ordering, dedupe and padding rules."""
+
+    def __init__(
+        self,
+        rules: Sequence[ErrorRule],
+        *,
+        max_detections: int = 5,
+        min_detections: int = 3,
+        fallback: Sequence[CommonError] = (),
+        defaults: Sequence[CommonError] = (),
+        stats: RuleStats | None = None,
+    ) -> None:
+        self.rules = tuple(rules)
+        self.max_detections = max_detections
+        self.min_detections = min_detections
+        self.fallback = tuple(fallback)
+        self.defaults = tuple(defaults)
+        self.stats = stats if stats is not None else RULE_STATS
+        # Reported errors are built once per rule and shared by every evaluation.
+        self._errors = tuple(rule.to_error() for rule in self.rules)
+
+        self._automaton = AhoCorasick(
+            (phrase, (index, len(phrase), rule.word_boundary))
+            for index, rule in enumerate(self.rules)
+            if rule.kind == "phrase"
+            for phrase in rule.phrases
+        )
+        self._pattern_rules = [index for index, rule in enumerate(self.rules) if rule.pattern is not None]
+        self._patterns = {
+            index: re.compile(self.rules[index].pattern, re.MULTILINE) for index in self._pattern_rules
+        }
+        self._combined = (
+            re.compile(
+                "(?=" + "|".join(f"(?P<_r{index}>{self.rules[index].pattern})" for index in self._pattern_rules) + ")",
+                re.MULTILINE,
+            )
+            if self._pattern_rules
+            else None
+        )
+        self._length_rules = [index for index, rule in enumerate(self.rules) if rule.kind == "min_tokens"]
+
+    @staticmethod
+    def from_config(config: dict, stats: RuleStats | None = None) -> "ErrorRuleSet":
+        return ErrorRuleSet(
+            [_parse_rule(raw, index) for index, raw in enumerate(config.get("rules", []))],
+            max_detections=int(config.get("max_detections", 5)),
+            min_detections=int(config.get("min_detections", 3)),
+            fallback=[CommonError(**item) for item in config.get("fallback", [])],
+            defaults=[CommonError(**item) for item in config.get("defaults", [])],
+            stats=stats,
+        )
+
+    def scan(self, messages: Sequence[str]) -> List[Set[int]]:
+        """Return, per message, the indexes of the rules that fire; the text is scanned once."""
+
+        fired: List[Set[int]] = [set() for _ in messages]
+        if not messages:
+            return fired
+        try:
+            self._scan_into(messages, fired)
+        finally:
+            hits: Counter[str] = Counter()
+            for rule_indexes in fired:
+                hits.update(self.rules[index].rule_id for index in rule_indexes)
+            self.stats.record_scan(len(messages), hits)
+        return fired
+
+    def _scan_into(self, messages: Sequence[str], fired: List[Set[int]]) -> None:
+        lowered = [message.lower().replace("\n", " ") for message in messages]
+        text = "\n".join(lowered) + "\n"
+        starts: List[int] = []
+        offset = 0
+        for message in lowered:
+            starts.append(offset)
+            offset += len(message) + 1
+
+        if self._automaton:
+            message_index = 0
+            for end, (rule_index, length, whole_word) in self._automaton.iter_matches(text):
+                while end >= starts[message_index] + len(lowered[message_index]):
+                    message_index += 1
+                if whole_word:
+                    start = end - length + 1
+                    if (start > 0 and _is_word_char(text[start - 1])) or _is_word_char(text[end + 1]):
+                        continue
+                fired[message_index].add(rule_index)
+
+        if self._combined is not None:
+            for match in self._combined.finditer(text):
+                position = match.start()
+                message_index = bisect_right(starts, position) - 1
+                end = starts[message_index] + len(lowered[message_index])
+                first = int(match.lastgroup[2:])
+                # A match running into the next message (e.g. via ``\s``) only counts
+                # if the rule also matches within this one.
+                if match.end(match.lastgroup) <= end or self._patterns[first].match(text, position, end):
+                    fired[message_index].add(first)
+                # Other rules may also match where the first alternative did.
+                for rule_index in self._pattern_rules:
+                    if rule_index > first and self._patterns[rule_index].match(text, position, end):
+                        fired[message_index].add(rule_index)
+
+        for rule_index in self._length_rules:
+            minimum = self.rules[rule_index].min_tokens
+            for message_index, message in enumerate(messages):
+                if len(message.split()) < minimum:
+                    fired[message_index].add(rule_index)
+
+    def detect(self, messages: Iterable[str]) -> List[CommonError]:
+        return self.select(self.scan(list(messages)))
+
+    def select(self, fired: Iterable[Set[int]]) -> List[CommonError]:
+        """Turn per-message scan results into the reported common errors."""
+
+        detections: List[CommonError] = []
+        for rule_indexes in fired:
+            detections.extend(self._errors[index] for index in sorted(rule_indexes))
+            if len(detections) >= self.max_detections:
+                break
+        if not detections:
+            detections.extend(self.fallback)
+
+        unique_errors: Dict[str, CommonError] = {}
+        for error in detections:
+            unique_errors.setdefault(error.issue, error)
+            if len(unique_errors) >= self.max_detections:
+                break
+        for default in self.defaults:
+            if len(unique_errors) >= self.min_detections:
+                break
+            unique_errors.setdefault(default.issue, default)
+        return list(unique_errors.values())[: self.max_detections]
+
+
+@lru_cache(maxsize=4)
+def load_rule_set(path: Path = RULES_PATH) -> ErrorRuleSet:
+    return ErrorRuleSet.from_config(json.loads(path.read_text(encoding="utf-8")))
+
+
+def detect_common_errors(messages: Iterable[str]) -> List[CommonError]:
+    return load_rule_set().detect(messages)
+
+
+def get_rule_stats() -> dict:
+    return RULE_STATS.snapshot()
@@ -1,193 +1,56 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
-from pathlib import Path
 from statistics import mean
+from time import perf_counter
 from typing import Dict, Iterable, List, Sequence
 
 from ..models import (
     ChatMessage,
     CommonError,
-    CriterionAssessment,
-    CrosswalkSummary,
     DualEvaluationResponse,
     SessionInfo,
-    StandardEvaluation,
     TranscriptMetadata,
 )
+from ..config import get_settings
+from .error_rules import detect_common_errors
 from .gpt5_client import GPT5APIError, get_gpt5_client
+from .metrics import TranscriptMetrics, compute_metrics
+from .results import CriterionResult, CrosswalkResult, StandardResult
+from .schema import compile_schema, prune
+from .scoring import (
+    ConfigNotFoundError,
+    StandardScorer,
+    discover_standards,
+    get_scorer,
+    load_standard_config,
+)
+from .tiering import (
+    TIER_FULL,
+    TIER_HEURISTIC,
+    TIER_LIGHT,
+    TIER_STATS,
+    TierAssessment,
+    cefr_spread,
+    heuristic_confidence,
+)
 
-CONFIG_ROOT = Path(__file__).resolve().parents[3] / "configs"
-SUPPORTED_STANDARDS: Sequence[str] = ("toefl", "itep", "ielts")
-DEFAULT_VERSION = "v1"
-
-
-@dataclass(frozen=True)
-class TranscriptMetrics:
-    total_words: int
-    unique_words: int
-    avg_sentence_length: float
-    turns: int
-    user_messages: List[str]
-
+logger = logging.getLogger(__name__)
 
-class ConfigNotFoundError(RuntimeError):
-    pass
+SUPPORTED_STANDARDS: Sequence[str] = discover_standards()
 
 
-def _load_standard_config(standard_id: str, version: str = DEFAULT_VERSION) -> dict:
-    config_path = CONFIG_ROOT / standard_id / f"{version}.json"
-    if not config_path.exists():
-        raise ConfigNotFoundError(f"Config for standard '{standard_id}' not found at {config_path}")
-    return json.loads(config_path.read_text(encoding="utf-8"))
+_load_standard_config = load_standard_config
 
 
 def _compute_metrics(transcript: List[ChatMessage]) -> TranscriptMetrics:
-    user_messages = [m.content for m in transcript if m.role == "user"]
-    total_words = sum(len(message.split()) for message in user_messages)
-    unique_words = len({word.lower().strip(",.?!") for message in user_messages for word in message.split()})
-    avg_sentence_length = total_words / max(len(user_messages), 1)
-    return TranscriptMetrics(
-        total_words=total_words,
-        unique_words=unique_words,
-        avg_sentence_length=avg_sentence_length,
-        turns=len(user_messages),
-        user_messages=user_messages,
-    )
-
-
-def _score_toefl_dimension(dimension_id: str, metrics: TranscriptMetrics) -> float:
-    base = min(4.0, (metrics.total_words / 120) * 4)
-    diversity = min(1.0, metrics.unique_words / 80) * 4
-    fluency = min(1.0, metrics.avg_sentence_length / 25) * 4
-
-    if dimension_id == "delivery":
-        score = 0.55 * base + 0.45 * fluency
-    elif dimension_id == "language_use":
-        score = 0.5 * base + 0.5 * diversity
-    elif dimension_id == "topic_dev":
-        score = 0.6 * base + 0.4 * fluency
-    else:  # task
-        score = 0.7 * base
-
-    return max(0.0, min(4.0, score))
-
-
-def _score_itep_dimension(dimension_id: str, metrics: TranscriptMetrics) -> float:
-    """Reuse TOEFL heuristics and scale to the iTEP 0–6 range."""
-
-    toefl_score = _score_toefl_dimension(dimension_id, metrics)
-    scaled = toefl_score * 1.5
-    return max(0.0, min(6.0, scaled))
-
-
-def _score_ielts_dimension(dimension_id: str, metrics: TranscriptMetrics) -> float:
-    base = min(1.0, metrics.total_words / 180)
-    diversity = min(1.0, metrics.unique_words / 110)
-    structure = min(1.0, metrics.avg_sentence_length / 20)
-
-    if dimension_id == "fluency_coherence":
-        normalized = 0.5 * base + 0.5 * structure
-    elif dimension_id == "lexical":
-        normalized = 0.4 * base + 0.6 * diversity
-    elif dimension_id == "grammar":
-        normalized = 0.45 * base + 0.55 * structure
-    else:  # pron
-        normalized = 0.6 * base + 0.4 * structure
-
-    band = 4.0 + normalized * 5.0
-    # Snap to nearest 0.5 band as per IELTS scoring practice
-    return max(0.0, min(9.0, round(band * 2) / 2))
-
-
-def _comment_for_score(score: float, standard_id: str) -> str:
-    if standard_id == "toefl":
-        if score >= 3.5:
-            return "Highly fluent with precise control and natural delivery."
-        if score >= 3.0:
-            return "Solid control with minor lapses; polish transitions."
-        if score >= 2.5:
-            return "Generally clear; add detail and smooth hesitations."
-        if score >= 1.5:
-            return "Develop longer turns with clearer structure."
-        return "Significant gaps—focus on intelligibility and completeness."
-
-    if standard_id == "itep":
-        if score >= 5.0:
-            return "Confident, polished delivery with professional nuance."
-        if score >= 4.0:
-            return "Strong communication; refine consistency and precision."
-        if score >= 3.0:
-            return "Developing control; expand support and smooth pacing."
-        if score >= 2.0:
-            return "Basic intelligibility; build range and fuller responses."
-        return "Severe breakdowns—focus on foundational speaking skills."
-
-    if score >= 7.5:
-        return "Confident, natural performance with advanced range."
-    if score >= 6.5:
-        return "Competent delivery; refine precision for higher bands."
-    if score >= 5.5:
-        return "Understandable but uneven; expand range and accuracy."
-    if score >= 4.5:
-        return "Frequent hesitation—build automaticity and accuracy."
-    return "Severe breakdowns—establish core control of grammar and lexis."
-
-
-def _map_score_to_cefr(score: float, mapping: List[dict]) -> str:
-    for band in mapping:
-        min_score = band.get("min", float("-inf"))
-        max_score = band.get("max", float("inf"))
-        if min_score <= score <= max_score:
-            return band.get("cefr", "Undetermined")
-    return "Undetermined"
+    return compute_metrics(transcript)
 
 
 def _detect_common_errors(messages: Iterable[str]) -> List[CommonError]:
-    detections: List[CommonError] = []
-    for message in messages:
-        lower = message.lower()
-        if "i am agree" in lower:
-            detections.append(CommonError(issue="Agreement phrase", fix="Use 'I agree' instead of 'I am agree'."))
-        if "a information" in lower:
-            detections.append(CommonError(issue="Article use", fix="'Information' is uncountable; say 'some information'."))
-        if "he go" in lower or "she go" in lower:
-            detections.append(CommonError(issue="Third-person verb", fix="Use third-person singular forms like 'he goes'."))
-        if len(message.split()) < 6:
-            detections.append(CommonError(issue="Short responses", fix="Extend answers with supporting details and examples."))
-        if lower.endswith("?"):
-            detections.append(CommonError(issue="Rising intonation", fix="Finish statements confidently without question intonation."))
-        if len(detections) >= 5:
-            break
-
-    if not detections:
-        detections.append(
-            CommonError(
-                issue="Limited elaboration",
-                fix="Add reasons, examples, and conclusions to each response.",
-            )
-        )
-
-    unique_errors: Dict[str, CommonError] = {}
-    for error in detections:
-        unique_errors.setdefault(error.issue, error)
-        if len(unique_errors) >= 5:
-            break
-
-    defaults = [
-        CommonError(issue="Linking phrases", fix="Use connectors such as 'however', 'moreover', and 'as a result'."),
-        CommonError(issue="Complex sentences", fix="Combine ideas with relative clauses and subordinating conjunctions."),
-        CommonError(issue="Pronunciation clarity", fix="Articulate final consonants and stress key words for emphasis."),
-    ]
-
-    for default in defaults:
-        if len(unique_errors) >= 3:
-            break
-        unique_errors.setdefault(default.issue, default)
-
-    return list(unique_errors.values())[:5]
+    return detect_common_errors(messages)
 
 
 ACTION_PLAN: Dict[str, List[str]] = {
@@ -257,93 +120,56 @@ def _evidence_quotes(messages: List[str]) -> List[str]:
 
 
 def _validate_output(output: dict, schema: dict) -> None:
-    if schema.get("type") != "object":
-        return
-    required = schema.get("required", [])
-    for key in required:
-        if key not in output:
-            raise ValueError(f"Missing required field '{key}' in evaluator output")
-
-    properties = schema.get("properties", {})
-    for key, subschema in properties.items():
-        if key not in output:
-            continue
-        value = output[key]
-        expected_type = subschema.get("type")
-        if expected_type == "object" and isinstance(value, dict):
-            _validate_output(value, subschema)
-        elif expected_type == "array" and isinstance(value, list):
-            min_items = subschema.get("minItems")
-            max_items = subschema.get("maxItems")
-            if min_items is not None and len(value) < min_items:
-                raise ValueError(f"Array '{key}' shorter than required minimum {min_items}")
-            if max_items is not None and len(value) > max_items:
-                raise ValueError(f"Array '{key}' longer than allowed maximum {max_items}")
-
-
-def _build_standard_result(standard_id: str, config: dict, metrics: TranscriptMetrics) -> StandardEvaluation:
-    rubric = {item["id"]: item for item in config["rubric"]["criteria"]}
-    weights: Dict[str, float] = config["rubric"]["weights"]
-
-    criteria: Dict[str, CriterionAssessment] = {}
-    criterion_labels: Dict[str, str] = {}
-
-    if standard_id == "toefl":
-        scorer = _score_toefl_dimension
-        scale_max = 4.0
-    elif standard_id == "itep":
-        scorer = _score_itep_dimension
-        scale_max = 6.0
-    else:
-        scorer = _score_ielts_dimension
-        scale_max = 9.0
-
-    for criterion_id in weights:
-        score = scorer(criterion_id, metrics)
-        comment = _comment_for_score(score, standard_id)
-        criteria[criterion_id] = CriterionAssessment(score=round(score, 2), comment=comment)
-        criterion_labels[criterion_id] = rubric.get(criterion_id, {}).get("label", criterion_id.title())
-
-    overall = sum(weights[cid] * criteria[cid].score for cid in weights)
-    round_to = config.get("scoring", {}).get("round_to", 2 if standard_id == "toefl" else 1)
-    overall = round(overall, round_to)
-    scale_info = config.get("scoring", {}).get("overall_scale", {})
-    min_overall = scale_info.get("min")
-    max_overall = scale_info.get("max")
-    if isinstance(min_overall, (int, float)):
-        overall = max(min_overall, overall)
-    if isinstance(max_overall, (int, float)):
-        overall = min(max_overall, overall)
-    cefr = _map_score_to_cefr(overall, config.get("mapping", {}).get("to_cefr", []))
-
-    evaluator_output = {
-        "criteria": {cid: {"score": crit.score, "comment": crit.comment} for cid, crit in criteria.items()},
-        "overall": overall,
-        "cefr": cefr,
-        "common_errors": [error.model_dump() for error in _detect_common_errors(metrics.user_messages)],
-        "recommendations": _recommendations_for_cefr(cefr),
-        "evidence_quotes": _evidence_quotes(metrics.user_messages),
-    }
-
-    _validate_output(evaluator_output, config.get("evaluator_output_schema", {}))
-
-    return StandardEvaluation(
-        standard_id=standard_id,
-        label=config["meta"]["label"],
+    """Validate ``output`` against an uncompiled schema; scorers keep a compiled copy instead."""
+
+    compile_schema(schema).validate(output)
+
+
+def _build_standard_result(
+    scorer: StandardScorer,
+    metrics: TranscriptMetrics,
+    common_errors: List[CommonError] | None = None,
+    evidence_quotes: List[str] | None = None,
+) -> StandardResult:
+    criteria: Dict[str, CriterionResult] = {}
+    for criterion_id, score in zip(scorer.criteria_ids, scorer.score_criteria(metrics)):
+        criteria[criterion_id] = CriterionResult(round(score, 2), scorer.comment(score))
+
+    overall = scorer.overall([criterion.score for criterion in criteria.values()])
+    cefr = scorer.cefr(overall)
+    if common_errors is None:
+        common_errors = _detect_common_errors(metrics.user_messages)
+    evidence_quotes = list(evidence_quotes) if evidence_quotes is not None else _evidence_quotes(metrics.user_messages)
+    recommendations = _recommendations_for_cefr(cefr)
+
+    scorer.output_schema.validate(
+        {
+            "criteria": {cid: {"score": crit.score, "comment": crit.comment} for cid, crit in criteria.items()},
+            "overall": overall,
+            "cefr": cefr,
+            "common_errors": [{"issue": error.issue, "fix": error.fix} for error in common_errors],
+            "recommendations": recommendations,
+            "evidence_quotes": evidence_quotes,
+        }
+    )
+
+    return StandardResult(
+        standard_id=scorer.standard_id,
+        label=scorer.label,
         overall=overall,
         cefr=cefr,
         criteria=criteria,
-        criterion_labels=criterion_labels,
-        common_errors=[CommonError(**error) for error in evaluator_output["common_errors"]],
-        recommendations=evaluator_output["recommendations"],
-        evidence_quotes=evaluator_output["evidence_quotes"],
+        criterion_labels=scorer.criterion_labels,
+        common_errors=common_errors,
+        recommendations=recommendations,
+        evidence_quotes=evidence_quotes,
         status="ok",
     )
 
 
-def _failed_standard(standard_id: str, config: dict | None, error: Exception) -> StandardEvaluation:
+def _failed_standard(standard_id: str, config: dict | None, error: Exception) -> StandardResult:
     label = config.get("meta", {}).get("label", standard_id.upper()) if config else standard_id.upper()
-    return StandardEvaluation(
+    return StandardResult(
         standard_id=standard_id,
         label=label,
         status="failed",
@@ -375,7 +201,14 @@ def _rank_to_cefr(rank: float) -> str:
     return "C2"
 
 
-def _summarise_crosswalk(standards: List[StandardEvaluation]) -> CrosswalkSummary:
+def _scorer_for(standard_id: str) -> StandardScorer | None:
+    try:
+        return get_scorer(standard_id)
+    except (ConfigNotFoundError, KeyError, ValueError):
+        return None
+
+
+def _summarise_crosswalk(standards: List[StandardResult]) -> CrosswalkResult:
     valid = [s for s in standards if s.status == "ok" and s.cefr]
     if valid:
         ranks = [r for r in (_cefr_rank(s.cefr) for s in valid) if r is not None]
@@ -392,12 +225,11 @@ def _summarise_crosswalk(standards: List[StandardEvaluation]) -> CrosswalkSummar
         if standard.status != "ok" or standard.overall is None or not standard.cefr:
             notes_parts.append(f"{standard.label} unavailable")
             continue
-        if standard.standard_id == "toefl":
-            notes_parts.append(f"TOEFL {standard.overall:.2f}≈{standard.cefr}")
-        elif standard.standard_id == "itep":
-            notes_parts.append(f"iTEP {standard.overall:.1f}≈{standard.cefr}")
+        scorer = _scorer_for(standard.standard_id)
+        if scorer is None:
+            notes_parts.append(f"{standard.label} {standard.overall}≈{standard.cefr}")
         else:
-            notes_parts.append(f"IELTS {standard.overall:.1f}≈{standard.cefr}")
+            notes_parts.append(f"{scorer.short_label} {scorer.format_score(standard.overall)}≈{standard.cefr}")
 
     if len({s.cefr for s in valid}) <= 1 and valid:
         notes_suffix = "; consistent."
@@ -410,12 +242,8 @@ def _summarise_crosswalk(standards: List[StandardEvaluation]) -> CrosswalkSummar
 
     strengths: List[str] = []
     for standard in valid:
-        if standard.standard_id == "toefl":
-            scale_max = 4.0
-        elif standard.standard_id == "itep":
-            scale_max = 6.0
-        else:
-            scale_max = 9.0
+        scorer = _scorer_for(standard.standard_id)
+        scale_max = scorer.scale_max if scorer is not None else None
         sorted_criteria = sorted(
             standard.criteria.items(),
             key=lambda item: item[1].score / scale_max if scale_max else 0,
@@ -445,7 +273,7 @@ def _summarise_crosswalk(standards: List[StandardEvaluation]) -> CrosswalkSummar
     if not focus:
         focus = ["Develop longer answers", "Grammar range"]
 
-    return CrosswalkSummary(
+    return CrosswalkResult(
         consensus_cefr=consensus_cefr,
         notes=notes,
         strengths=strengths[:2],
@@ -483,45 +311,218 @@ def _build_session_info(
     )
 
 
+def _heuristic_results(
+    metrics: TranscriptMetrics,
+    common_errors: List[CommonError] | None = None,
+    evidence_quotes: List[str] | None = None,
+) -> tuple[Dict[str, StandardResult], Dict[str, dict | None]]:
+    if common_errors is None:
+        common_errors = _detect_common_errors(metrics.user_messages)
+    if evidence_quotes is None:
+        evidence_quotes = _evidence_quotes(metrics.user_messages)
+    base_results: Dict[str, StandardResult] = {}
+    configs: Dict[str, dict | None] = {}
+    for standard_id in SUPPORTED_STANDARDS:
+        scorer = None
+        try:
+            scorer = get_scorer(standard_id)
+            configs[standard_id] = scorer.config
+            base_results[standard_id] = _build_standard_result(scorer, metrics, common_errors, evidence_quotes)
+        except Exception as exc:  # noqa: BLE001
+            configs[standard_id] = scorer.config if scorer else None
+            base_results[standard_id] = _failed_standard(standard_id, configs[standard_id], exc)
+    return base_results, configs
+
+
+def _mean_rank(ranks: List[float | None]) -> float | None:
+    values = [rank for rank in ranks if rank is not None]
+    return mean(values) if values else None
+
+
+def _heuristic_assessment(metrics: TranscriptMetrics, base_results: Dict[str, StandardResult]) -> TierAssessment:
+    ranks = [_cefr_rank(result.cefr) for result in base_results.values() if result.status == "ok"]
+    return TierAssessment(
+        confidence=heuristic_confidence(metrics.total_words, metrics.turns),
+        cefr_spread=cefr_spread(ranks),
+    )
+
+
+def _llm_assessment(payload: dict, base_results: Dict[str, StandardResult]) -> TierAssessment:
+    """Derive a confidence signal from an LLM payload and its agreement with the heuristics."""
+
+    entries = payload.get("standards")
+    llm_ranks = [
+        _cefr_rank(entry.get("cefr")) if isinstance(entry.get("cefr"), str) else None
+        for entry in (entries if isinstance(entries, list) else [])
+        if isinstance(entry, dict)
+    ]
+    spread = cefr_spread(llm_ranks)
+
+    llm_mean = _mean_rank(llm_ranks)
+    heuristic_mean = _mean_rank([_cefr_rank(r.cefr) for r in base_results.values() if r.status == "ok"])
+    if llm_mean is not None and heuristic_mean is not None:
+        spread = max(spread, abs(llm_mean - heuristic_mean))
+
+    reported = payload.get("confidence")
+    if isinstance(reported, (int, float)) and 0 <= reported <= 1:
+        confidence = float(reported)
+    elif llm_mean is None:
+        confidence = 0.0
+    else:
+        confidence = max(0.0, 1.0 - spread / len(CEFR_ORDER))
+    return TierAssessment(confidence=confidence, cefr_spread=spread)
+
+
+def _request_llm_evaluation(
+    tier: str,
+    transcript: List[ChatMessage],
+    metadata: TranscriptMetadata,
+    metrics_payload: dict,
+    model: str | None = None,
+) -> tuple[dict | None, GPT5APIError | None]:
+    started = perf_counter()
+    try:
+        client = get_gpt5_client(model) if model else get_gpt5_client()
+        payload = client.generate_evaluation(transcript, metadata, metrics_payload)
+    except GPT5APIError as exc:
+        TIER_STATS.record_run(tier, perf_counter() - started, failed=True)
+        return None, exc
+    TIER_STATS.record_run(tier, perf_counter() - started)
+    return payload, None
+
+
+def _resolve_llm_payload(
+    transcript: List[ChatMessage],
+    metadata: TranscriptMetadata,
+    metrics: TranscriptMetrics,
+    metrics_payload: dict,
+    base_results: Dict[str, StandardResult],
+    warnings: List[str],
+    *,
+    tenant: str | None = None,
+    require_full_model: bool = False,
+) -> dict | None:
+    """Walk the evaluation tiers and return the LLM payload to merge, if any.
+
+    Tier 0 is the heuristic result already held in ``base_results``; tier 1 is the
+    optional cheaper model and tier 2 the full GPT-5 model. Lower tiers are accepted
+    only when confident and consistent across standards.
+    """
+
+    settings = get_settings()
+    tiering = settings.evaluation_tiering
+    full_model_required = require_full_model or (tenant is not None and tenant in settings.full_model_tenants)
+    escalation: str | None = None
+
+    if tiering and full_model_required:
+        escalation = "full_model_requested"
+    elif tiering:
+        heuristic = _heuristic_assessment(metrics, base_results)
+        if heuristic.is_acceptable(settings.tier0_min_confidence, settings.tier_max_cefr_spread):
+            TIER_STATS.record_decision(TIER_HEURISTIC)
+            return None
+        if heuristic.cefr_spread > settings.tier_max_cefr_spread:
+            escalation = "tier0_disagreement"
+        else:
+            escalation = "tier0_low_confidence"
+
+    light_payload: dict | None = None
+    if escalation is not None and not full_model_required and settings.gpt5_tier1_model:
+        TIER_STATS.record_escalation(escalation)
+        light_payload, _ = _request_llm_evaluation(
+            TIER_LIGHT, transcript, metadata, metrics_payload, model=settings.gpt5_tier1_model
+        )
+        if light_payload is not None:
+            light = _llm_assessment(light_payload, base_results)
+            if light.is_acceptable(settings.tier1_min_confidence, settings.tier_max_cefr_spread):
+                TIER_STATS.record_decision(TIER_LIGHT)
+                return light_payload
+            if light.cefr_spread > settings.tier_max_cefr_spread:
+                escalation = "tier1_disagreement"
+            else:
+                escalation = "tier1_low_confidence"
+        else:
+            escalation = "tier1_error"
+
+    if escalation is not None:
+        TIER_STATS.record_escalation(escalation)
+
+    full_payload, full_error = _request_llm_evaluation(TIER_FULL, transcript, metadata, metrics_payload)
+    if full_error is not None:
+        warnings.append(f"GPT-5 evaluation unavailable: {full_error}")
+
+    if full_payload is not None:
+        TIER_STATS.record_decision(TIER_FULL)
+        return full_payload
+    if light_payload is not None:
+        TIER_STATS.record_decision(TIER_LIGHT)
+        return light_payload
+    TIER_STATS.record_decision(TIER_HEURISTIC)
+    return None
+
+
+@dataclass(frozen=True)
+class HeuristicStage:
+    """Heuristic part of an evaluation; picklable so it can be computed in a worker process."""
+
+    metrics: TranscriptMetrics
+    metrics_payload: dict
+    base_results: Dict[str, StandardResult]
+    configs: Dict[str, dict | None]
+
+
+def run_heuristic_stage(
+    transcript: List[ChatMessage],
+    *,
+    metrics: TranscriptMetrics | None = None,
+    common_errors: List[CommonError] | None = None,
+    evidence_quotes: List[str] | None = None,
+) -> HeuristicStage:
+    """Run the heuristic stage; precomputed partials (e.g. from a live session) skip their passes."""
+
+    metrics = metrics or _compute_metrics(transcript)
+    metrics_payload = metrics.to_payload()
+
+    started = perf_counter()
+    base_results, configs = _heuristic_results(metrics, common_errors, evidence_quotes)
+    TIER_STATS.record_run(TIER_HEURISTIC, perf_counter() - started)
+    return HeuristicStage(metrics, metrics_payload, base_results, configs)
+
+
 def evaluate_transcript(
     transcript: List[ChatMessage],
     session_id: str | None = None,
     metadata: TranscriptMetadata | None = None,
+    *,
+    tenant: str | None = None,
+    require_full_model: bool = False,
+    heuristics: HeuristicStage | None = None,
 ) -> DualEvaluationResponse:
+    """Evaluate ``transcript``; pass ``heuristics`` when the heuristic stage already ran."""
+
     if not session_id:
         session_id = "adhoc"
 
     metadata = metadata or TranscriptMetadata()
-    metrics = _compute_metrics(transcript)
-    metrics_payload = {
-        "total_words": metrics.total_words,
-        "unique_words": metrics.unique_words,
-        "avg_sentence_length": metrics.avg_sentence_length,
-        "turns": metrics.turns,
-        "sample_user_messages": metrics.user_messages[:5],
-    }
-
-    base_results: Dict[str, StandardEvaluation] = {}
-    configs: Dict[str, dict | None] = {}
-    for standard_id in SUPPORTED_STANDARDS:
-        config = None
-        try:
-            config = _load_standard_config(standard_id)
-            configs[standard_id] = config
-            base_results[standard_id] = _build_standard_result(standard_id, config, metrics)
-        except Exception as exc:  # noqa: BLE001
-            configs[standard_id] = config
-            base_results[standard_id] = _failed_standard(standard_id, config, exc)
+    stage = heuristics or run_heuristic_stage(transcript)
+    metrics = stage.metrics
+    metrics_payload = stage.metrics_payload
+    base_results = stage.base_results
+    configs = stage.configs
 
     warnings: List[str] = []
-    gpt_payload: dict | None = None
-    try:
-        client = get_gpt5_client()
-        gpt_payload = client.generate_evaluation(transcript, metadata, metrics_payload)
-    except GPT5APIError as exc:
-        warnings.append(f"GPT-5 evaluation unavailable: {exc}")
+    gpt_payload = _resolve_llm_payload(
+        transcript,
+        metadata,
+        metrics,
+        metrics_payload,
+        base_results,
+        warnings,
+        tenant=tenant,
+        require_full_model=require_full_model,
+    )
 
-    standards: List[StandardEvaluation] = []
+    standards: List[StandardResult] = []
     gpt_standards = gpt_payload.get("standards") if isinstance(gpt_payload, dict) else None
     for standard_id in SUPPORTED_STANDARDS:
         base = base_results[standard_id]
@@ -563,53 +564,69 @@ def evaluate_transcript(
 
     return DualEvaluationResponse(
         session=session_info,
-        standards=standards,
-        crosswalk=crosswalk,
+        standards=[standard.to_model() for standard in standards],
+        crosswalk=crosswalk.to_model(),
         warnings=unique_warnings or None,
         session_id=session_info.id,
         cefr_level=crosswalk.consensus_cefr,
     )
 
 
-def _merge_standard_with_gpt(base: StandardEvaluation, payload: dict) -> StandardEvaluation:
+def _merge_standard_with_gpt(base: StandardResult, payload: dict) -> StandardResult:
+    """Overlay a GPT-5 standard entry on ``base``; untouched fields stay shared with it."""
+
     if base.status != "ok" or not isinstance(payload, dict):
         return base
 
-    merged = base.model_copy(deep=True)
+    scorer = _scorer_for(base.standard_id)
+    if scorer is not None:
+        violations = scorer.output_schema.violations(payload, partial=True)
+        if violations:
+            logger.info(
+                "Dropping GPT-5 fields for %s that violate the output schema: %s",
+                base.standard_id,
+                "; ".join(str(violation) for violation in violations),
+            )
+            payload = prune(payload, violations)
+
+    changes: dict = {}
 
     label = payload.get("label")
     if isinstance(label, str) and label.strip():
-        merged.label = label.strip()
+        changes["label"] = label.strip()
 
     overall = payload.get("overall")
     if overall is not None:
         try:
-            merged.overall = float(overall)
+            changes["overall"] = float(overall)
         except (TypeError, ValueError):
             pass
 
     cefr = payload.get("cefr")
     if isinstance(cefr, str) and cefr.strip():
-        merged.cefr = cefr.strip()
+        changes["cefr"] = cefr.strip()
 
     criteria_payload = payload.get("criteria")
     if isinstance(criteria_payload, dict):
-        for criterion_id, assessment in merged.criteria.items():
+        criteria = dict(base.criteria)
+        for criterion_id, assessment in base.criteria.items():
             criterion_update = criteria_payload.get(criterion_id)
             if not isinstance(criterion_update, dict):
                 continue
-            score = criterion_update.get("score")
+            score = assessment.score
             comment = criterion_update.get("comment")
-            if score is not None:
+            if criterion_update.get("score") is not None:
                 try:
-                    assessment.score = float(score)
+                    score = float(criterion_update["score"])
                 except (TypeError, ValueError):
                     pass
-            if comment is not None:
-                assessment.comment = str(comment)
+            criteria[criterion_id] = CriterionResult(
+                score, str(comment) if comment is not None else assessment.comment
+            )
 
+        labels = base.criterion_labels
         for criterion_id, criterion_update in criteria_payload.items():
-            if criterion_id in merged.criteria or not isinstance(criterion_update, dict):
+            if criterion_id in base.criteria or not isinstance(criterion_update, dict):
                 continue
             score = criterion_update.get("score")
             comment = criterion_update.get("comment", "")
@@ -619,8 +636,13 @@ def _merge_standard_with_gpt(base: StandardEvaluation, payload: dict) -> Standar
                 score_value = float(score)
             except (TypeError, ValueError):
                 continue
-            merged.criteria[criterion_id] = CriterionAssessment(score=score_value, comment=str(comment))
-            merged.criterion_labels.setdefault(criterion_id, criterion_id.replace("_", " ").title())
+            criteria[criterion_id] = CriterionResult(score_value, str(comment))
+            if criterion_id not in labels:
+                if labels is base.criterion_labels:
+                    labels = dict(labels)
+                labels[criterion_id] = criterion_id.replace("_", " ").title()
+        changes["criteria"] = criteria
+        changes["criterion_labels"] = labels
 
     errors_payload = payload.get("common_errors")
     parsed_errors: List[CommonError] = []
@@ -633,7 +655,7 @@ def _merge_standard_with_gpt(base: StandardEvaluation, payload: dict) -> Standar
             if issue and fix:
                 parsed_errors.append(CommonError(issue=str(issue), fix=str(fix)))
     if parsed_errors:
-        merged.common_errors = parsed_errors
+        changes["common_errors"] = parsed_errors
 
     recommendations_payload = payload.get("recommendations")
     if isinstance(recommendations_payload, list):
@@ -641,10 +663,10 @@ def _merge_standard_with_gpt(base: StandardEvaluation, payload: dict) -> Standar
             str(rec).strip() for rec in recommendations_payload if isinstance(rec, str) and rec.strip()
         ]
         if len(cleaned_recommendations) >= 5:
-            merged.recommendations = cleaned_recommendations[:5]
+            changes["recommendations"] = cleaned_recommendations[:5]
         elif cleaned_recommendations:
-            additions = [rec for rec in cleaned_recommendations if rec not in merged.recommendations]
-            merged.recommendations = (merged.recommendations + additions)[:5]
+            additions = [rec for rec in cleaned_recommendations if rec not in base.recommendations]
+            changes["recommendations"] = (base.recommendations + additions)[:5]
 
     evidence_payload = payload.get("evidence_quotes")
     if isinstance(evidence_payload, list):
@@ -652,35 +674,35 @@ def _merge_standard_with_gpt(base: StandardEvaluation, payload: dict) -> Standar
         if cleaned_quotes:
             while len(cleaned_quotes) < 2 and cleaned_quotes:
                 cleaned_quotes.append(cleaned_quotes[0])
-            merged.evidence_quotes = cleaned_quotes[:2]
+            changes["evidence_quotes"] = cleaned_quotes[:2]
 
-    return merged
+    return replace(base, **changes) if changes else base
 
 
-def _merge_crosswalk_payload(payload: dict | None, fallback: CrosswalkSummary) -> CrosswalkSummary:
+def _merge_crosswalk_payload(payload: dict | None, fallback: CrosswalkResult) -> CrosswalkResult:
     if not isinstance(payload, dict):
         return fallback
 
-    merged = fallback.model_copy(deep=True)
+    changes: dict = {}
 
     consensus = payload.get("consensus_cefr")
     if isinstance(consensus, str) and consensus.strip():
-        merged.consensus_cefr = consensus.strip()
+        changes["consensus_cefr"] = consensus.strip()
 
     notes = payload.get("notes")
     if isinstance(notes, str) and notes.strip():
-        merged.notes = notes.strip()
+        changes["notes"] = notes.strip()
 
     strengths = payload.get("strengths")
     if isinstance(strengths, list) and strengths:
         cleaned_strengths = [str(item).strip() for item in strengths if isinstance(item, str) and item.strip()]
         if cleaned_strengths:
-            merged.strengths = cleaned_strengths[:2]
+            changes["strengths"] = cleaned_strengths[:2]
 
     focus = payload.get("focus")
     if isinstance(focus, list) and focus:
         cleaned_focus = [str(item).strip() for item in focus if isinstance(item, str) and item.strip()]
         if cleaned_focus:
-            merged.focus = cleaned_focus[:2]
+            changes["focus"] = cleaned_focus[:2]
 
-    return merged
+    return replace(fallback, **changes) if changes else fallback
@@ -3,13 +3,16 @@ from __future__ import annotations
 import json
 from functools import lru_cache
 from textwrap import dedent
-from typing import Iterable, Mapping
+from typing import TYPE_CHECKING, Iterable, Mapping
 
 import httpx
 
 from ..config import get_settings
 from ..models import ChatMessage, TranscriptMetadata
 
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .llm_router import LLMRouter
+
 
 class GPT5APIError(RuntimeError):
     """Raised when GPT-5 evaluation could not be obtained."""
@@ -41,7 +44,15 @@ class GPT5Client:
     ) -> dict:
         """Request an evaluation from GPT-5 and parse the JSON response."""
 
-        transcript_payload = [m.model_dump(mode="json") for m in transcript]
+        transcript_payload = [
+            {
+                "role": m.role,
+                "content": m.content,
+                "timestamp": m.timestamp.isoformat(),
+                "audio_meta": m.audio_meta,
+            }
+            for m in transcript
+        ]
         metadata_payload = metadata.model_dump(mode="json")
 
         messages_payload = [
@@ -201,15 +212,25 @@ class GPT5Client:
         ).strip()
 
 
-@lru_cache(maxsize=1)
-def get_gpt5_client() -> GPT5Client:
+@lru_cache(maxsize=4)
+def get_gpt5_client(model: str | None = None) -> GPT5Client | "LLMRouter":
+    """Return a cached client for ``model``, defaulting to the configured GPT-5 model.
+
+    When ``LLM_PROVIDERS`` is configured the returned object is an :class:`LLMRouter`
+    exposing the same ``generate_evaluation`` interface.
+    """
+
     settings = get_settings()
+    if settings.llm_providers:
+        from .llm_router import build_router  # local import to avoid circular dependency
+
+        return build_router(settings, model=model)
     if not settings.gpt5_api_key:
         raise GPT5APIError("GPT-5 API key is not configured")
     return GPT5Client(
         api_key=settings.gpt5_api_key,
         base_url=settings.gpt5_api_base_url,
-        model=settings.gpt5_model,
+        model=model or settings.gpt5_model,
         temperature=settings.gpt5_temperature,
     )
 
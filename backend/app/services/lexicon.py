@@ -0,0 +1,196 @@
+"""CEFR word-band lexicon backed by a memory-mapped sorted hash table.
+
+``configs/lexicon/cefr_words.tsv`` is the editable source (``word<TAB>band``). It is
+compiled into ``cefr_words.bin``: a 16-byte header (magic, entry count, CRC32 of the
+source) followed by the sorted 64-bit BLAKE2b hashes of the words and one band byte
+per hash. The binary is opened with ``numpy.memmap``, so loading costs milliseconds
+and worker processes share the same page-cache pages. Lookups hash every candidate
+form (the word plus suffix-stripped lemmas) and resolve them with one
+``searchsorted`` call. Rebuild after editing the TSV with::
+
+    python -m backend.app.services.lexicon
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import sys
+import zlib
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .scoring import CONFIG_ROOT
+
+logger = logging.getLogger(__name__)
+
+LEXICON_DIR = CONFIG_ROOT / "lexicon"
+SOURCE_PATH = LEXICON_DIR / "cefr_words.tsv"
+BINARY_PATH = LEXICON_DIR / "cefr_words.bin"
+
+BANDS: Tuple[str, ...] = ("A1", "A2", "B1", "B2", "C1", "C2")
+OFF_LIST = len(BANDS)
+ADVANCED_FROM = BANDS.index("B2")
+
+_MAGIC = b"CEFRLEX1"
+_HEADER = struct.Struct("<8sII")
+
+
+def word_hash(word: str) -> int:
+    return int.from_bytes(blake2b(word.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def lemma_candidates(word: str) -> List[str]:
+    """The word followed by base forms produced by common English inflection rules."""
+
+    word = word.replace("’", "'")
+    if word.endswith("'s"):
+        word = word[:-2]
+    candidates = [word]
+    if len(word) > 3:
+        if word.endswith("ies") or word.endswith("ied"):
+            candidates.append(word[:-3] + "y")
+        if word.endswith("es") or word.endswith("ed") or word.endswith("er"):
+            candidates.extend((word[:-2], word[:-1]))
+        if word.endswith("s"):
+            candidates.append(word[:-1])
+        if word.endswith("ing") or word.endswith("est"):
+            candidates.extend((word[:-3], word[:-3] + "e"))
+        if word.endswith("ly"):
+            candidates.append(word[:-2])
+        if word.endswith("ily"):
+            candidates.append(word[:-3] + "y")
+        if len(word) > 5 and word[-3:] in ("ing", "est") and word[-4] == word[-5]:
+            candidates.append(word[:-4])
+        if len(word) > 4 and word[-2:] in ("ed", "er") and word[-3] == word[-4]:
+            candidates.append(word[:-3])
+    return candidates
+
+
+def _read_source(path: Path) -> Dict[str, int]:
+    entries: Dict[str, int] = {}
+    for line_number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        if not line.strip() or line.startswith("#"):
+            continue
+        try:
+            word, band = line.split("\t")[:2]
+            level = BANDS.index(band.strip())
+        except ValueError as exc:
+            raise ValueError(f"{path}:{line_number}: expected 'word<TAB>band' with a CEFR band") from exc
+        word = word.strip().lower()
+        entries[word] = min(level, entries.get(word, level))
+    return entries
+
+
+def _compile(entries: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    hashes = np.fromiter((word_hash(word) for word in entries), dtype=np.uint64, count=len(entries))
+    bands = np.fromiter(entries.values(), dtype=np.uint8, count=len(entries))
+    order = np.argsort(hashes, kind="stable")
+    hashes, bands = hashes[order], bands[order]
+    if len(hashes) > 1 and (hashes[1:] == hashes[:-1]).any():
+        raise ValueError("Lexicon hash collision; rename or drop one of the colliding words")
+    return hashes, bands
+
+
+class Lexicon:
+    def __init__(self, hashes: np.ndarray, bands: np.ndarray) -> None:
+        self.hashes = hashes
+        self.bands = bands
+
+    def __len__(self) -> int:
+        return int(self.hashes.shape[0])
+
+    @staticmethod
+    def from_source(path: Path = SOURCE_PATH) -> "Lexicon":
+        return Lexicon(*_compile(_read_source(path)))
+
+    @staticmethod
+    def open(path: Path = BINARY_PATH) -> "Lexicon":
+        with path.open("rb") as handle:
+            magic, count, _ = _HEADER.unpack(handle.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a compiled lexicon")
+        hashes = np.memmap(path, dtype=np.uint64, mode="r", offset=_HEADER.size, shape=(count,))
+        bands = np.memmap(path, dtype=np.uint8, mode="r", offset=_HEADER.size + 8 * count, shape=(count,))
+        return Lexicon(hashes, bands)
+
+    def lookup(self, words: Sequence[str]) -> np.ndarray:
+        """Band index per word (``OFF_LIST`` when neither the word nor a lemma is listed)."""
+
+        result = np.full(len(words), OFF_LIST, dtype=np.uint8)
+        if not len(words) or not len(self):
+            return result
+        owners: List[int] = []
+        candidate_hashes: List[int] = []
+        for index, word in enumerate(words):
+            for candidate in lemma_candidates(word):
+                owners.append(index)
+                candidate_hashes.append(word_hash(candidate))
+        keys = np.asarray(candidate_hashes, dtype=np.uint64)
+        positions = np.minimum(np.searchsorted(self.hashes, keys), len(self) - 1)
+        found = np.flatnonzero(self.hashes[positions] == keys)
+        # Candidates are grouped per word in priority order; keep each word's first hit.
+        hit_owners, first = np.unique(np.asarray(owners, dtype=np.int64)[found], return_index=True)
+        result[hit_owners] = np.asarray(self.bands)[positions[found[first]]]
+        return result
+
+    def band(self, word: str) -> int:
+        return int(self.lookup([word])[0])
+
+
+def source_checksum(path: Path = SOURCE_PATH) -> int:
+    return zlib.crc32(path.read_bytes())
+
+
+def build_binary(source: Path = SOURCE_PATH, target: Path = BINARY_PATH) -> int:
+    """Compile ``source`` into ``target`` atomically; returns the number of entries."""
+
+    hashes, bands = _compile(_read_source(source))
+    temporary = target.with_suffix(target.suffix + ".tmp")
+    with temporary.open("wb") as handle:
+        handle.write(_HEADER.pack(_MAGIC, len(hashes), source_checksum(source)))
+        handle.write(hashes.astype("<u8").tobytes())
+        handle.write(bands.tobytes())
+    os.replace(temporary, target)
+    return len(hashes)
+
+
+def binary_is_current(source: Path = SOURCE_PATH, target: Path = BINARY_PATH) -> bool:
+    if not target.exists():
+        return False
+    with target.open("rb") as handle:
+        magic, _, checksum = _HEADER.unpack(handle.read(_HEADER.size))
+    return magic == _MAGIC and (not source.exists() or checksum == source_checksum(source))
+
+
+@lru_cache(maxsize=1)
+def get_lexicon() -> Lexicon:
+    if binary_is_current():
+        return Lexicon.open()
+    if SOURCE_PATH.exists():
+        logger.warning("Compiled lexicon %s is missing or stale; loading %s instead", BINARY_PATH, SOURCE_PATH)
+        return Lexicon.from_source()
+    logger.warning("No CEFR lexicon found under %s; lexical profiles will be empty", LEXICON_DIR)
+    return Lexicon(np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.uint8))
+
+
+def lexical_profile(band_counts: Iterable[int]) -> Dict[str, int]:
+    counts = list(band_counts)
+    profile = {band: int(counts[index]) for index, band in enumerate(BANDS)}
+    profile["off_list"] = int(counts[OFF_LIST])
+    return profile
+
+
+def main(argv: Sequence[str] | None = None) -> int:  # pragma: no cover - thin CLI wrapper
+    count = build_binary()
+    print(f"Wrote {count} entries to {BINARY_PATH}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
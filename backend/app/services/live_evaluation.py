@@ -0,0 +1,101 @@
+"""Evaluation state maintained turn by turn while an interview runs.
+
+Every message appended to a session feeds :class:`LiveEvaluationState`: the metrics
+accumulator, the compiled error rules (one scan per user message) and the evidence
+quote candidates. Finishing the session then only merges these partials into a
+:class:`~.evaluation.HeuristicStage`, and :meth:`LiveEvaluationState.provisional`
+serves a cheap provisional level while the interview is still running.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import List, Set
+
+from ..models import ChatMessage, ProvisionalLevelResponse, ProvisionalStandardScore
+from .error_rules import load_rule_set
+from .evaluation import (
+    SUPPORTED_STANDARDS,
+    HeuristicStage,
+    _cefr_rank,
+    _evidence_quotes,
+    _rank_to_cefr,
+    run_heuristic_stage,
+)
+from .metrics import MetricsAccumulator, TranscriptMetrics
+from .scoring import get_scorer
+
+EVIDENCE_CANDIDATES = 2
+EVIDENCE_MIN_WORDS = 4
+
+
+class LiveEvaluationState:
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+        self._lock = threading.Lock()
+        self._metrics = MetricsAccumulator()
+        self._fired: List[Set[int]] = []
+        self._substantive: List[str] = []
+        self._first: List[str] = []
+        self._provisional: ProvisionalLevelResponse | None = None
+
+    def add(self, message: ChatMessage) -> None:
+        with self._lock:
+            self._metrics.add(message)
+            if message.role != "user":
+                return
+            self._fired.extend(load_rule_set().scan([message.content]))
+            if len(self._first) < EVIDENCE_CANDIDATES:
+                self._first.append(message.content)
+            if len(self._substantive) < EVIDENCE_CANDIDATES and len(message.content.split()) >= EVIDENCE_MIN_WORDS:
+                self._substantive.append(message.content)
+            self._provisional = None
+
+    @property
+    def total_words(self) -> int:
+        return self._metrics.total_words
+
+    def metrics(self) -> TranscriptMetrics:
+        with self._lock:
+            return self._metrics.snapshot()
+
+    def heuristic_stage(self, transcript: List[ChatMessage]) -> HeuristicStage:
+        """Merge the precomputed partials into the heuristic stage of ``evaluate_transcript``."""
+
+        with self._lock:
+            metrics = self._metrics.snapshot()
+            common_errors = load_rule_set().select(self._fired)
+            evidence_quotes = _evidence_quotes(self._substantive or self._first)
+        return run_heuristic_stage(
+            transcript,
+            metrics=metrics,
+            common_errors=common_errors,
+            evidence_quotes=evidence_quotes,
+        )
+
+    def provisional(self) -> ProvisionalLevelResponse:
+        """Heuristic scores for the transcript so far; cached until the next user message."""
+
+        with self._lock:
+            if self._provisional is not None:
+                return self._provisional
+            metrics = self._metrics.snapshot()
+            standards: List[ProvisionalStandardScore] = []
+            for standard_id in SUPPORTED_STANDARDS:
+                scorer = get_scorer(standard_id)
+                criteria = [round(score, 2) for score in scorer.score_criteria(metrics)]
+                overall = scorer.overall(criteria)
+                standards.append(
+                    ProvisionalStandardScore(
+                        standard_id=standard_id, label=scorer.label, overall=overall, cefr=scorer.cefr(overall)
+                    )
+                )
+            ranks = [rank for rank in (_cefr_rank(standard.cefr) for standard in standards) if rank is not None]
+            self._provisional = ProvisionalLevelResponse(
+                session_id=self.session_id,
+                turns=metrics.turns,
+                total_words=metrics.total_words,
+                consensus_cefr=_rank_to_cefr(sum(ranks) / len(ranks)) if ranks and metrics.turns else "Undetermined",
+                standards=standards,
+            )
+            return self._provisional
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, List, Mapping, Optional, Protocol, Sequence, Tuple
+
+from ..models import ChatMessage, TranscriptMetadata
+from .gpt5_client import GPT5APIError, GPT5Client
+from .llm_stub import StubProvider
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..config import AppSettings, LLMProviderSettings
+
+_HEALTH_WINDOW = 100
+
+# Health is tracked per provider and model: the tier-1 and full-model routers share
+# provider names but not their latency or failure modes.
+HealthKey = Tuple[str, Optional[str]]
+
+
+class EvaluationProvider(Protocol):
+    name: str
+
+    def generate_evaluation(
+        self,
+        transcript: Iterable[ChatMessage],
+        metadata: TranscriptMetadata,
+        metrics: Mapping[str, object],
+    ) -> dict:
+        ...
+
+
+class OpenAICompatibleProvider:
+    """Named wrapper around :class:`GPT5Client` for one OpenAI-compatible endpoint."""
+
+    def __init__(self, name: str, client: GPT5Client, model: str | None = None) -> None:
+        self.name = name
+        self.model = model
+        self._client = client
+
+    def generate_evaluation(
+        self,
+        transcript: Iterable[ChatMessage],
+        metadata: TranscriptMetadata,
+        metrics: Mapping[str, object],
+    ) -> dict:
+        return self._client.generate_evaluation(transcript, metadata, metrics)
+
+
+class ProviderHealth:
+    """Rolling latency and error statistics for a single provider."""
+
+    def __init__(self, window: int = _HEALTH_WINDOW) -> None:
+        self._lock = threading.Lock()
+        self._samples: Deque[tuple[float, bool]] = deque(maxlen=window)
+        self._consecutive_failures = 0
+        self._last_attempt = 0.0
+        self._probing = False
+        self.cooldown_until = 0.0
+
+    def claim_probe(self, interval_seconds: float) -> bool:
+        """Let one request through to this degraded provider per ``interval_seconds``."""
+
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_attempt < interval_seconds:
+                return False
+            self._probing = True
+            self._last_attempt = now
+            return True
+
+    def record(self, latency_seconds: float, ok: bool, cooldown_seconds: float = 0.0) -> None:
+        with self._lock:
+            self._last_attempt = time.monotonic()
+            if ok and self._probing:
+                # A successful probe means the provider recovered: forget the old failures.
+                self._samples.clear()
+            self._probing = False
+            self._samples.append((latency_seconds, ok))
+            if ok:
+                self._consecutive_failures = 0
+                self.cooldown_until = 0.0
+            else:
+                self._consecutive_failures += 1
+                if self._consecutive_failures >= 3 and cooldown_seconds:
+                    self.cooldown_until = time.monotonic() + cooldown_seconds
+
+    @property
+    def error_rate(self) -> float:
+        with self._lock:
+            if not self._samples:
+                return 0.0
+            return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+    @property
+    def p95_latency(self) -> float:
+        with self._lock:
+            latencies = sorted(latency for latency, ok in self._samples if ok)
+        if not latencies:
+            return 0.0
+        return latencies[min(len(latencies) - 1, round(0.95 * (len(latencies) - 1)))]
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            requests = len(self._samples)
+        return {
+            "requests": requests,
+            "error_rate": round(self.error_rate, 4),
+            "p95_latency_ms": round(self.p95_latency * 1000, 2),
+            "cooling_down": self.cooldown_until > time.monotonic(),
+        }
+
+
+PROVIDER_HEALTH: Dict[HealthKey, ProviderHealth] = {}
+_HEALTH_LOCK = threading.Lock()
+
+
+def _health_for(key: HealthKey, registry: Dict[HealthKey, ProviderHealth]) -> ProviderHealth:
+    with _HEALTH_LOCK:
+        if key not in registry:
+            registry[key] = ProviderHealth()
+        return registry[key]
+
+
+def _health_label(key: HealthKey) -> str:
+    name, model = key
+    return name if model is None else f"{name}:{model}"
+
+
+class LLMRouter:
+    """Route evaluations to the healthy provider with the lowest recent p95 latency.
+
+    Providers whose recent error rate exceeds ``max_error_rate`` or which are cooling
+    down after repeated failures are only tried once every healthy provider failed,
+    except for one probe request per ``cooldown_seconds`` that goes to them first; a
+    successful probe clears their failure history.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[EvaluationProvider],
+        *,
+        max_error_rate: float = 0.5,
+        cooldown_seconds: float = 30.0,
+        health: Dict[HealthKey, ProviderHealth] | None = None,
+    ) -> None:
+        if not providers:
+            raise ValueError("LLMRouter requires at least one provider")
+        self._providers = list(providers)
+        self._max_error_rate = max_error_rate
+        self._cooldown_seconds = cooldown_seconds
+        self._health = health if health is not None else {}
+
+    @property
+    def providers(self) -> List[EvaluationProvider]:
+        return list(self._providers)
+
+    def health(self, name: str, model: str | None = None) -> ProviderHealth:
+        return _health_for((name, model), self._health)
+
+    def _provider_health(self, provider: EvaluationProvider) -> ProviderHealth:
+        return self.health(provider.name, getattr(provider, "model", None))
+
+    def ranked_providers(self) -> List[EvaluationProvider]:
+        now = time.monotonic()
+        probes: List[EvaluationProvider] = []
+        healthy: List[tuple[float, int, EvaluationProvider]] = []
+        degraded: List[tuple[float, int, EvaluationProvider]] = []
+        for index, provider in enumerate(self._providers):
+            health = self._provider_health(provider)
+            if health.cooldown_until > now or health.error_rate > self._max_error_rate:
+                if health.claim_probe(self._cooldown_seconds):
+                    probes.append(provider)
+                else:
+                    degraded.append((health.error_rate, index, provider))
+            else:
+                healthy.append((health.p95_latency, index, provider))
+        return probes + [item[2] for item in sorted(healthy)] + [item[2] for item in sorted(degraded)]
+
+    def generate_evaluation(
+        self,
+        transcript: Iterable[ChatMessage],
+        metadata: TranscriptMetadata,
+        metrics: Mapping[str, object],
+    ) -> dict:
+        transcript = list(transcript)
+        failures: List[str] = []
+        for provider in self.ranked_providers():
+            started = time.perf_counter()
+            try:
+                payload = provider.generate_evaluation(transcript, metadata, metrics)
+            except GPT5APIError as exc:
+                self._provider_health(provider).record(time.perf_counter() - started, False, self._cooldown_seconds)
+                failures.append(f"{provider.name}: {exc}")
+                continue
+            self._provider_health(provider).record(time.perf_counter() - started, True)
+            return payload
+
+        raise GPT5APIError("All LLM providers failed: " + "; ".join(failures))
+
+    def snapshot(self) -> dict:
+        return {
+            _health_label((provider.name, getattr(provider, "model", None))): self._provider_health(provider).snapshot()
+            for provider in self._providers
+        }
+
+
+def build_provider(config: "LLMProviderSettings", settings: "AppSettings", model: str | None = None) -> EvaluationProvider:
+    if config.kind == "stub":
+        return StubProvider(
+            config.name,
+            latency_ms=config.latency_ms,
+            jitter_ms=config.jitter_ms,
+            error_rate=config.error_rate,
+        )
+
+    api_key = config.api_key or settings.gpt5_api_key
+    if not api_key:
+        raise GPT5APIError(f"API key is not configured for LLM provider '{config.name}'")
+    # The caller's model (e.g. the tier-1 model) wins; the provider model replaces the default.
+    model = model or config.model or settings.gpt5_model
+    client = GPT5Client(
+        api_key=api_key,
+        base_url=config.base_url or settings.gpt5_api_base_url,
+        model=model,
+        temperature=settings.gpt5_temperature,
+        timeout=config.timeout,
+    )
+    return OpenAICompatibleProvider(config.name, client, model=model)
+
+
+def build_router(settings: "AppSettings", model: str | None = None) -> LLMRouter:
+    providers = [build_provider(config, settings, model) for config in settings.llm_providers]
+    return LLMRouter(
+        providers,
+        max_error_rate=settings.llm_max_error_rate,
+        cooldown_seconds=settings.llm_cooldown_seconds,
+        health=PROVIDER_HEALTH,
+    )
+
+
+def get_provider_stats() -> dict:
+    with _HEALTH_LOCK:
+        items = list(PROVIDER_HEALTH.items())
+    return {_health_label(key): health.snapshot() for key, health in items}
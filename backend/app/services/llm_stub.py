@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import random
+import time
+import zlib
+from typing import Iterable, Mapping, Sequence
+
+from ..models import ChatMessage, TranscriptMetadata
+from .gpt5_client import GPT5APIError
+from .scoring import discover_standards, get_scorer
+
+STUB_STANDARDS: Sequence[str] = discover_standards()
+
+_STUB_RECOMMENDATIONS = [
+    "Extend each answer with a reason and a concrete example.",
+    "Practice linking ideas with connectors such as 'however' and 'as a result'.",
+    "Record short answers daily and review pacing and pauses.",
+    "Build topic vocabulary lists and reuse them in speaking drills.",
+    "Rehearse past-tense narratives using the STAR structure.",
+]
+_STUB_ERRORS = [
+    {"issue": "Limited elaboration", "fix": "Add reasons, examples, and conclusions to each response."},
+    {"issue": "Linking phrases", "fix": "Use connectors such as 'however', 'moreover', and 'as a result'."},
+    {"issue": "Complex sentences", "fix": "Combine ideas with relative clauses and subordinating conjunctions."},
+]
+
+
+def _evidence_level(metrics: Mapping[str, object]) -> float:
+    """Map the transcript metrics onto a 0–1 proficiency estimate."""
+
+    total_words = float(metrics.get("total_words") or 0)
+    unique_words = float(metrics.get("unique_words") or 0)
+    avg_length = float(metrics.get("avg_sentence_length") or 0)
+    return min(1.0, 0.45 * min(1.0, total_words / 200) + 0.35 * min(1.0, unique_words / 100) + 0.2 * min(1.0, avg_length / 22))
+
+
+def _criterion_offset(standard_id: str, criterion_id: str) -> float:
+    # Deterministic per-criterion variation so stub scores are not all identical.
+    return (zlib.crc32(f"{standard_id}:{criterion_id}".encode("utf-8")) % 11 - 5) / 100
+
+
+def build_stub_evaluation(
+    metrics: Mapping[str, object],
+    standards: Sequence[str] = STUB_STANDARDS,
+) -> dict:
+    """Return a deterministic, schema-valid evaluation payload derived from ``metrics``."""
+
+    level = _evidence_level(metrics)
+    samples = [str(m) for m in metrics.get("sample_user_messages") or [] if str(m).strip()]
+    quotes = (samples + ["No substantive learner responses captured.", "Provide longer answers for evidence."])[:2]
+
+    entries = []
+    for standard_id in standards:
+        scorer = get_scorer(standard_id)
+        scale_min = scorer.scale_min if scorer.scale_min is not None else 0.0
+        scale_max = scorer.scale_max if scorer.scale_max is not None else 1.0
+
+        criteria = {}
+        for criterion_id in scorer.criteria_ids:
+            normalized = max(0.0, min(1.0, level + _criterion_offset(standard_id, criterion_id)))
+            score = round(scale_min + normalized * (scale_max - scale_min), scorer.round_to)
+            criteria[criterion_id] = {"score": score, "comment": "Stub evaluation derived from transcript metrics."}
+        overall = scorer.overall([criteria[cid]["score"] for cid in scorer.criteria_ids])
+
+        entries.append(
+            {
+                "standard_id": standard_id,
+                "label": scorer.label,
+                "overall": overall,
+                "cefr": scorer.cefr(overall),
+                "criteria": criteria,
+                "common_errors": [dict(error) for error in _STUB_ERRORS],
+                "recommendations": list(_STUB_RECOMMENDATIONS),
+                "evidence_quotes": quotes,
+            }
+        )
+
+    consensus = entries[0]["cefr"] if entries else "Undetermined"
+    return {
+        "standards": entries,
+        "crosswalk": {
+            "consensus_cefr": consensus,
+            "notes": "Stub provider evaluation.",
+            "strengths": ["Fluency", "Coherence"],
+            "focus": ["Develop longer answers", "Grammar range"],
+        },
+    }
+
+
+class StubProvider:
+    """Offline evaluation backend returning schema-valid payloads with configurable latency."""
+
+    def __init__(
+        self,
+        name: str = "stub",
+        *,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.name = name
+        self._latency_ms = latency_ms
+        self._jitter_ms = jitter_ms
+        self._error_rate = error_rate
+        self._random = random.Random(seed)
+
+    def generate_evaluation(
+        self,
+        transcript: Iterable[ChatMessage],
+        metadata: TranscriptMetadata,
+        metrics: Mapping[str, object],
+    ) -> dict:
+        delay_ms = self._latency_ms
+        if self._jitter_ms:
+            delay_ms = max(0.0, self._random.gauss(self._latency_ms, self._jitter_ms))
+        if delay_ms:
+            time.sleep(delay_ms / 1000)
+        if self._error_rate and self._random.random() < self._error_rate:
+            raise GPT5APIError(f"Stub provider '{self.name}' simulated a failure")
+        return build_stub_evaluation(metrics)
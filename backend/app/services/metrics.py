@@ -0,0 +1,351 @@
+"""Single-pass linguistic metrics over the candidate's messages.
+
+:class:`MetricsAccumulator` consumes a transcript message by message and keeps only
+running state: word and vocabulary counts, sentence lengths, a forward MTLD factor
+count, a sliding MATTR window, connector hits and response latencies. Each user
+message is tokenised once; :meth:`MetricsAccumulator.snapshot` turns the state into
+:class:`TranscriptMetrics` at any point, so it can run after every chat turn.
+
+``total_words``, ``unique_words`` and ``avg_sentence_length`` (words per turn) keep
+their historical definitions because the heuristic scorers are calibrated on them;
+the segmented ``words_per_sentence`` and ``connector_density`` are scorer features too.
+Segmentation and connector counting live in :func:`scan_message`, which the
+vectorised batch scorer shares.
+Each new vocabulary entry is looked up once in the CEFR lexicon (:mod:`.lexicon`) to
+build the lexical sophistication profile. Question/answer pairs are scored for
+topic relevance (:mod:`.relevance`) in one vectorised call per snapshot.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from statistics import median
+from typing import Deque, Dict, Iterable, List, Mapping, Tuple
+
+from ..models import ChatMessage
+from .lexicon import ADVANCED_FROM, OFF_LIST, get_lexicon, lexical_profile
+from .relevance import score_pairs
+
+MTLD_THRESHOLD = 0.72
+MATTR_WINDOW = 50
+SAMPLE_MESSAGES = 5
+
+_WORD = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*|\d+(?:[.,]\d+)*")
+_SENTENCE_END = re.compile(r"([.!?…]+)[\"')\]]*$")
+# A single "." after these never ends a sentence ("Dr. Smith", "e.g. this").
+NON_TERMINAL_ABBREVIATIONS = frozenset({"mr", "mrs", "ms", "dr", "prof", "vs", "e.g", "i.e"})
+# After these it does, unless the sentence visibly goes on in lower case ("Main St. It").
+ABBREVIATIONS = frozenset({"st", "etc", "approx"})
+
+CONNECTORS: Tuple[str, ...] = (
+    "however", "moreover", "furthermore", "therefore", "although", "though", "because", "since",
+    "unless", "whereas", "meanwhile", "consequently", "nevertheless", "besides", "instead", "otherwise",
+    "firstly", "secondly", "finally", "additionally", "overall", "actually", "basically", "anyway",
+    "in addition", "for example", "for instance", "as a result", "on the other hand", "in contrast",
+    "in conclusion", "to sum up", "first of all", "in my opinion", "as well as", "even though",
+    "due to", "such as", "apart from", "as long as",
+)
+_CONNECTOR_SPANS: Dict[int, frozenset] = {}
+for _marker in CONNECTORS:
+    _words = tuple(_marker.split())
+    _CONNECTOR_SPANS[len(_words)] = _CONNECTOR_SPANS.get(len(_words), frozenset()) | {_words}
+# Longest span first so "even though" is counted once rather than also as "though".
+_CONNECTOR_TUPLES = sorted(_CONNECTOR_SPANS.items(), reverse=True)
+_CONNECTOR_SPAN = _CONNECTOR_TUPLES[0][0]
+
+
+@dataclass(frozen=True)
+class TranscriptMetrics:
+    total_words: int
+    unique_words: int
+    avg_sentence_length: float
+    turns: int
+    user_messages: List[str]
+    sentences: int = 0
+    words_per_sentence: float = 0.0
+    mtld: float = 0.0
+    mattr: float = 0.0
+    connectors: int = 0
+    distinct_connectors: int = 0
+    connector_density: float = 0.0  # per 100 words
+    latency_mean_sec: float | None = None
+    latency_median_sec: float | None = None
+    latency_p90_sec: float | None = None
+    speaking_time_sec: float | None = None
+    speech_rate_wpm: float | None = None
+    lexical_profile: Dict[str, int] = field(default_factory=dict)  # tokens per CEFR band
+    advanced_word_share: float = 0.0  # B2+ share of tokens found in the lexicon
+    topic_relevance: float = 0.0  # mean answer relevance to the preceding question
+
+    def to_payload(self) -> dict:
+        """Metrics block sent to the evaluator LLM."""
+
+        return {
+            "total_words": self.total_words,
+            "unique_words": self.unique_words,
+            "avg_sentence_length": self.avg_sentence_length,
+            "turns": self.turns,
+            "sentences": self.sentences,
+            "words_per_sentence": self.words_per_sentence,
+            "mtld": self.mtld,
+            "mattr": self.mattr,
+            "connectors": self.connectors,
+            "distinct_connectors": self.distinct_connectors,
+            "connector_density": self.connector_density,
+            "latency_mean_sec": self.latency_mean_sec,
+            "latency_median_sec": self.latency_median_sec,
+            "latency_p90_sec": self.latency_p90_sec,
+            "speaking_time_sec": self.speaking_time_sec,
+            "speech_rate_wpm": self.speech_rate_wpm,
+            "lexical_profile": self.lexical_profile,
+            "advanced_word_share": round(self.advanced_word_share, 4),
+            "topic_relevance": round(self.topic_relevance, 4),
+            "sample_user_messages": self.user_messages[:SAMPLE_MESSAGES],
+        }
+
+
+@dataclass(frozen=True)
+class MessageScan:
+    tokens: List[str]
+    sentence_lengths: List[int]  # in whitespace-separated words
+    connectors: List[str]
+
+
+def _ends_sentence(word: str, next_word: str | None) -> bool:
+    match = _SENTENCE_END.search(word)
+    if match is None:
+        return False
+    if match.group(1) != ".":
+        return True  # "?", "!", "..." always end one, whatever the word
+    bare = word[: match.start()].lower()
+    if bare in NON_TERMINAL_ABBREVIATIONS:
+        return False
+    if bare == "no":  # "No. 5"
+        return not (next_word and next_word[0].isdigit())
+    if bare in ABBREVIATIONS:
+        return not (next_word and next_word[0].islower())
+    return True
+
+
+def scan_message(content: str) -> MessageScan:
+    """Tokens, sentence lengths and connector hits of one message, in one pass."""
+
+    words = content.split()
+    tokens: List[str] = []
+    sentence_lengths: List[int] = []
+    connectors: List[str] = []
+    sentence_words = 0
+    recent: Deque[str] = deque(maxlen=_CONNECTOR_SPAN)
+    for position, word in enumerate(words):
+        sentence_words += 1
+        for token in _WORD.findall(word.lower()):
+            tokens.append(token)
+            recent.append(token)
+            window = tuple(recent)
+            for span, markers in _CONNECTOR_TUPLES:
+                if len(window) >= span and window[-span:] in markers:
+                    connectors.append(" ".join(window[-span:]))
+                    break
+        if _ends_sentence(word, words[position + 1] if position + 1 < len(words) else None):
+            sentence_lengths.append(sentence_words)
+            sentence_words = 0
+            recent.clear()
+    if sentence_words:
+        sentence_lengths.append(sentence_words)
+    return MessageScan(tokens=tokens, sentence_lengths=sentence_lengths, connectors=connectors)
+
+
+def word_tokens(text: str) -> List[str]:
+    """Lower-cased word tokens as used for lexical diversity and the lexicon profile."""
+
+    return _WORD.findall(text.lower())
+
+
+def _audio_seconds(audio_meta: Mapping[str, object] | None, *keys: str) -> float | None:
+    if not audio_meta:
+        return None
+    for key in keys:
+        value = audio_meta.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+            return float(value) / 1000.0 if key.endswith("_ms") else float(value)
+    return None
+
+
+def _mtld_factors(token_ids: Iterable[int]) -> Tuple[float, int]:
+    factors = 0.0
+    types: set = set()
+    count = 0
+    for token_id in token_ids:
+        count += 1
+        types.add(token_id)
+        if len(types) / count <= MTLD_THRESHOLD:
+            factors += 1
+            types = set()
+            count = 0
+    if count:
+        factors += (1 - len(types) / count) / (1 - MTLD_THRESHOLD)
+    return factors, count
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+@dataclass
+class MetricsAccumulator:
+    """Incremental metrics state; feed messages with :meth:`add` and read :meth:`snapshot`."""
+
+    user_messages: List[str] = field(default_factory=list)
+    total_words: int = 0
+    legacy_vocabulary: set = field(default_factory=set)
+    vocabulary: Dict[str, int] = field(default_factory=dict)
+    token_ids: List[int] = field(default_factory=list)
+    token_bands: List[int] = field(default_factory=list)  # CEFR band index per vocabulary id
+    band_counts: List[int] = field(default_factory=lambda: [0] * (OFF_LIST + 1))
+    sentence_lengths: List[int] = field(default_factory=list)
+    connector_hits: Counter = field(default_factory=Counter)
+    latencies: List[float] = field(default_factory=list)
+    speaking_time: float = 0.0
+    spoken_words: int = 0
+    last_prompt_at: datetime | None = None
+    last_prompt: str | None = None
+    relevance_scores: List[float] = field(default_factory=list)
+    _pending_pairs: List[Tuple[str, str]] = field(default_factory=list)
+    _mtld_factors: float = 0.0
+    _mtld_types: set = field(default_factory=set)
+    _mtld_count: int = 0
+    _window: Deque[int] = field(default_factory=deque)
+    _window_counts: Counter = field(default_factory=Counter)
+    _mattr_sum: float = 0.0
+    _mattr_windows: int = 0
+
+    def add(self, message: ChatMessage, audio_meta: Mapping[str, object] | None = None) -> None:
+        if message.role != "user":
+            self.last_prompt_at = message.timestamp
+            self.last_prompt = message.content
+            return
+        if self.last_prompt is not None:
+            self._pending_pairs.append((self.last_prompt, message.content))
+        audio_meta = audio_meta if audio_meta is not None else message.audio_meta
+        latency = _audio_seconds(audio_meta, "response_latency_ms", "response_latency_sec")
+        if latency is None and self.last_prompt_at is not None:
+            delta = (message.timestamp - self.last_prompt_at).total_seconds()
+            latency = delta if delta >= 0 else None
+        self.add_user_text(
+            message.content,
+            latency_sec=latency,
+            speaking_sec=_audio_seconds(audio_meta, "duration_ms", "duration_sec"),
+        )
+        self.last_prompt_at = None
+
+    def add_user_text(self, content: str, *, latency_sec: float | None = None, speaking_sec: float | None = None) -> None:
+        self.user_messages.append(content)
+        words = content.split()
+        self.total_words += len(words)
+        if latency_sec is not None:
+            self.latencies.append(latency_sec)
+        if speaking_sec:
+            self.speaking_time += speaking_sec
+            self.spoken_words += len(words)
+
+        self.legacy_vocabulary.update(word.lower().strip(",.?!") for word in words)
+        scan = scan_message(content)
+        for token in scan.tokens:
+            self._add_token(token)
+        self.sentence_lengths.extend(scan.sentence_lengths)
+        self.connector_hits.update(scan.connectors)
+
+    def _add_token(self, token: str) -> None:
+        token_id = self.vocabulary.setdefault(token, len(self.vocabulary))
+        if token_id == len(self.token_bands):
+            self.token_bands.append(get_lexicon().band(token))
+        self.token_ids.append(token_id)
+        self.band_counts[self.token_bands[token_id]] += 1
+
+        self._mtld_count += 1
+        self._mtld_types.add(token_id)
+        if len(self._mtld_types) / self._mtld_count <= MTLD_THRESHOLD:
+            self._mtld_factors += 1
+            self._mtld_types = set()
+            self._mtld_count = 0
+
+        self._window.append(token_id)
+        self._window_counts[token_id] += 1
+        if len(self._window) > MATTR_WINDOW:
+            dropped = self._window.popleft()
+            self._window_counts[dropped] -= 1
+            if not self._window_counts[dropped]:
+                del self._window_counts[dropped]
+        if len(self._window) == MATTR_WINDOW:
+            self._mattr_sum += len(self._window_counts) / MATTR_WINDOW
+            self._mattr_windows += 1
+
+    def _mtld(self) -> float:
+        tokens = len(self.token_ids)
+        if not tokens:
+            return 0.0
+        forward = self._mtld_factors
+        if self._mtld_count:
+            forward += (1 - len(self._mtld_types) / self._mtld_count) / (1 - MTLD_THRESHOLD)
+        backward, _ = _mtld_factors(reversed(self.token_ids))
+        scores = [tokens / factors if factors else float(tokens) for factors in (forward, backward)]
+        return round(sum(scores) / 2, 2)
+
+    def _mattr(self) -> float:
+        if self._mattr_windows:
+            return round(self._mattr_sum / self._mattr_windows, 4)
+        if self.token_ids:
+            return round(len(set(self.token_ids)) / len(self.token_ids), 4)
+        return 0.0
+
+    def _score_pending_pairs(self) -> None:
+        if self._pending_pairs:
+            questions, answers = zip(*self._pending_pairs)
+            self.relevance_scores.extend(score_pairs(questions, answers).tolist())
+            self._pending_pairs.clear()
+
+    def snapshot(self) -> TranscriptMetrics:
+        self._score_pending_pairs()
+        turns = len(self.user_messages)
+        connectors = sum(self.connector_hits.values())
+        latencies = self.latencies
+        listed = sum(self.band_counts[:OFF_LIST])
+        advanced = sum(self.band_counts[ADVANCED_FROM:OFF_LIST])
+        return TranscriptMetrics(
+            total_words=self.total_words,
+            unique_words=len(self.legacy_vocabulary),
+            avg_sentence_length=self.total_words / max(turns, 1),
+            turns=turns,
+            user_messages=list(self.user_messages),
+            sentences=len(self.sentence_lengths),
+            words_per_sentence=round(sum(self.sentence_lengths) / len(self.sentence_lengths), 2)
+            if self.sentence_lengths
+            else 0.0,
+            mtld=self._mtld(),
+            mattr=self._mattr(),
+            connectors=connectors,
+            distinct_connectors=len(self.connector_hits),
+            connector_density=round(connectors * 100 / self.total_words, 2) if self.total_words else 0.0,
+            latency_mean_sec=round(sum(latencies) / len(latencies), 2) if latencies else None,
+            latency_median_sec=round(median(latencies), 2) if latencies else None,
+            latency_p90_sec=round(_percentile(latencies, 0.9), 2) if latencies else None,
+            speaking_time_sec=round(self.speaking_time, 2) if self.speaking_time else None,
+            speech_rate_wpm=round(self.spoken_words * 60 / self.speaking_time, 1) if self.speaking_time else None,
+            lexical_profile=lexical_profile(self.band_counts),
+            advanced_word_share=advanced / listed if listed else 0.0,
+            topic_relevance=sum(self.relevance_scores) / len(self.relevance_scores) if self.relevance_scores else 0.0,
+        )
+
+
+def compute_metrics(transcript: Iterable[ChatMessage]) -> TranscriptMetrics:
+    accumulator = MetricsAccumulator()
+    for message in transcript:
+        accumulator.add(message)
+    return accumulator.snapshot()
@@ -0,0 +1,113 @@
+"""Bounded process pool for PDF rendering.
+
+PDF layout is CPU-bound, so jobs run in worker processes instead of the API thread
+pool. At most ``max_pending`` jobs are queued or running; further submissions are
+refused rather than piling up. Jobs are keyed (by the report's content-addressed
+storage name), so a report requested twice is rendered once, and finished PDFs are
+written next to the report atomically — a file that exists is always complete.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class PdfRenderQueue:
+    def __init__(self, workers: int, max_pending: int) -> None:
+        self.workers = workers
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: Dict[str, Future] = {}
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # "spawn" keeps worker processes clear of the server's threads and open SQLite handles.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def is_pending(self, key: str) -> bool:
+        with self._lock:
+            return key in self._pending
+
+    def submit(self, key: str, target: Path, render: Callable[..., bytes], *args: Any) -> bool:
+        """Queue ``render(*args)`` to be written to ``target``; ``False`` when the queue is full."""
+
+        with self._lock:
+            if key in self._pending:
+                return True
+            if not self.enabled or len(self._pending) >= self.max_pending:
+                self._rejected += 1
+                return False
+            future = self._pool().submit(render, *args)
+            self._pending[key] = future
+            self._submitted += 1
+        future.add_done_callback(lambda done: self._finish(key, target, done))
+        return True
+
+    def _finish(self, key: str, target: Path, future: Future) -> None:
+        failed = True
+        try:
+            pdf = future.result()
+            partial = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            partial.write_bytes(pdf)
+            os.replace(partial, target)
+            failed = False
+        except Exception:  # noqa: BLE001 - a failed job must not take the queue down
+            logger.exception("PDF rendering failed for %s", key)
+        with self._lock:
+            self._pending.pop(key, None)
+            if failed:
+                self._failed += 1
+            else:
+                self._completed += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "pending": len(self._pending),
+                "max_pending": self.max_pending,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+@lru_cache
+def get_pdf_queue() -> PdfRenderQueue:
+    settings = get_settings()
+    return PdfRenderQueue(settings.report_pdf_workers, settings.report_pdf_queue_size)
+
+
+def get_pdf_stats() -> dict:
+    return get_pdf_queue().snapshot()
@@ -0,0 +1,121 @@
+"""Minimal pure-Python PDF writer for text reports.
+
+Lays out titles, headings, paragraphs and list items on A4 pages with the standard
+Helvetica fonts, which every PDF viewer provides, so no font is embedded and no
+third-party library is needed. Text is encoded as WinAnsi; characters outside it are
+reduced to their base letter (``ş`` -> ``s``). Line breaking uses approximate glyph
+widths, which is accurate enough for flowing report text. Output is deterministic:
+the same content always produces the same bytes.
+"""
+
+from __future__ import annotations
+
+import textwrap
+import unicodedata
+import zlib
+from typing import List, Tuple
+
+PAGE_WIDTH = 595.28
+PAGE_HEIGHT = 841.89
+MARGIN = 50.0
+
+# style -> (font resource, size, space before)
+_STYLES = {
+    "title": ("F2", 18.0, 0.0),
+    "heading": ("F2", 13.0, 14.0),
+    "subheading": ("F2", 10.5, 8.0),
+    "body": ("F1", 10.0, 3.0),
+}
+_FONTS = {"F1": "Helvetica", "F2": "Helvetica-Bold"}
+_AVERAGE_GLYPH_WIDTH = 0.52  # of the font size, for Helvetica running text
+_LINE_HEIGHT = 1.3
+_TRANSLITERATIONS = str.maketrans({"ı": "i", "İ": "I"})
+
+
+def _encode(text: str) -> bytes:
+    encoded = bytearray()
+    for char in text.translate(_TRANSLITERATIONS):
+        try:
+            encoded += char.encode("cp1252")
+        except UnicodeEncodeError:
+            base = unicodedata.normalize("NFKD", char).encode("cp1252", "ignore")
+            encoded += base or b"?"
+    return bytes(encoded).replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+class PdfDocument:
+    def __init__(self, title: str = "") -> None:
+        self.title = title
+        self._pages: List[List[bytes]] = []
+        self._y = 0.0
+        self._new_page()
+
+    def _new_page(self) -> None:
+        self._pages.append([])
+        self._y = PAGE_HEIGHT - MARGIN
+
+    def text(self, text: str, style: str = "body", *, indent: float = 0.0, hanging: str = "") -> None:
+        """Append a wrapped paragraph; ``hanging`` (e.g. a bullet) prefixes its first line."""
+
+        font, size, before = _STYLES[style]
+        line_height = size * _LINE_HEIGHT
+        width = PAGE_WIDTH - 2 * MARGIN - indent
+        columns = max(20, int(width / (size * _AVERAGE_GLYPH_WIDTH)))
+        lines = textwrap.wrap(
+            " ".join(text.split()),
+            columns,
+            initial_indent=hanging,
+            subsequent_indent=" " * (2 * len(hanging)),
+        ) or [hanging]
+        self._y -= before
+        for line in lines:
+            if self._y - line_height < MARGIN:
+                self._new_page()
+            self._y -= line_height
+            self._pages[-1].append(
+                b"BT /%s %.1f Tf %.2f %.2f Td (%s) Tj ET"
+                % (font.encode(), size, MARGIN + indent, self._y, _encode(line))
+            )
+
+    def bullet(self, text: str, marker: str = "•") -> None:
+        self.text(text, indent=12.0, hanging=f"{marker} ")
+
+    def render(self) -> bytes:
+        objects: List[bytes] = [b"", b""]  # catalog and page tree, filled in below
+        fonts: List[Tuple[str, int]] = []
+        for resource, name in _FONTS.items():
+            objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>" % name.encode())
+            fonts.append((resource, len(objects)))
+        font_refs = b" ".join(b"/%s %d 0 R" % (resource.encode(), number) for resource, number in fonts)
+
+        page_numbers: List[int] = []
+        for commands in self._pages:
+            stream = zlib.compress(b"\n".join(commands), 9)
+            objects.append(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(stream), stream))
+            content_number = len(objects)
+            objects.append(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] /Resources << /Font << %s >> >> /Contents %d 0 R >>"
+                % (PAGE_WIDTH, PAGE_HEIGHT, font_refs, content_number)
+            )
+            page_numbers.append(len(objects))
+        objects.append(b"<< /Title (%s) /Producer (Foreign Language Assessment) >>" % _encode(self.title))
+        info_number = len(objects)
+
+        objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+        kids = b" ".join(b"%d 0 R" % number for number in page_numbers)
+        objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_numbers))
+
+        output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets: List[int] = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        xref = len(output)
+        output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+        output += b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+            len(objects) + 1,
+            info_number,
+            xref,
+        )
+        return bytes(output)
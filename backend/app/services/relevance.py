@@ -0,0 +1,77 @@
+"""Local question–answer relevance from hashed bag-of-words and character n-grams.
+
+Each user turn is paired with the assistant question before it. Both sides are
+turned into sparse hashed feature sets (content words plus character trigrams,
+hashed with CRC32 into ``DIMENSIONS`` buckets) and all pairs are scored together
+with NumPy: the cosine similarity of the two sets and their coverage, the share of
+the question's features the answer picks up. Overlaps are counted as integers until
+the final division, so a pair scores the same alone or inside a large batch.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from typing import List, Sequence
+
+import numpy as np
+
+DIMENSIONS = 1 << 20
+NGRAM = 3
+COSINE_WEIGHT = 0.5
+
+_WORD = re.compile(r"[^\W\d_]+")
+# Function words and the interview's own prompt vocabulary carry no topic signal.
+STOPWORDS = frozenset(
+    """a about after all also am an and any are as at be because been being but by can could describe did do
+    does english explain for from had has have how i if in into is it its just like me more most my no not of on
+    one or our please so some such talk tell than that the their them then there these they think this those
+    time to too up us very was we were what when where which who why will with would you your yours yourself""".split()
+)
+
+
+def _hash(feature: str) -> int:
+    return zlib.crc32(feature.encode("utf-8")) % DIMENSIONS
+
+
+def text_features(text: str) -> List[int]:
+    """Hashed content words and character trigrams of ``text``."""
+
+    features: List[int] = []
+    for word in _WORD.findall(text.lower()):
+        if word in STOPWORDS:
+            continue
+        features.append(_hash("w:" + word))
+        padded = f"<{word}>"
+        features.extend(_hash("c:" + padded[index : index + NGRAM]) for index in range(len(padded) - NGRAM + 1))
+    return features
+
+
+def _feature_keys(rows: Sequence[List[int]]) -> np.ndarray:
+    """Sorted unique ``row * DIMENSIONS + bucket`` keys (one per feature present in a row)."""
+
+    owners = np.repeat(np.arange(len(rows), dtype=np.int64), [len(row) for row in rows])
+    buckets = np.fromiter((bucket for row in rows for bucket in row), dtype=np.int64, count=len(owners))
+    return np.unique(owners * DIMENSIONS + buckets)
+
+
+def _per_row(keys: np.ndarray, rows: int) -> np.ndarray:
+    return np.bincount(keys // DIMENSIONS, minlength=rows).astype(np.float64)
+
+
+def score_pairs(questions: Sequence[str], answers: Sequence[str]) -> np.ndarray:
+    """Relevance in ``[0, 1]`` of every answer to its question, scored in one vectorised pass."""
+
+    rows = len(answers)
+    if not rows:
+        return np.zeros(0, dtype=np.float64)
+    question_keys = _feature_keys([text_features(question) for question in questions])
+    answer_keys = _feature_keys([text_features(answer) for answer in answers])
+
+    shared = _per_row(np.intersect1d(question_keys, answer_keys, assume_unique=True), rows)
+    asked = _per_row(question_keys, rows)
+    answered = _per_row(answer_keys, rows)
+    norm = np.sqrt(asked * answered)
+    cosine = np.divide(shared, norm, out=np.zeros(rows), where=norm > 0)
+    coverage = np.divide(shared, asked, out=np.zeros(rows), where=asked > 0)
+    return COSINE_WEIGHT * cosine + (1 - COSINE_WEIGHT) * coverage
@@ -0,0 +1,261 @@
+"""Serving stored reports: pre-compressed variants, ETags and a hot body cache.
+
+``persist_report`` writes a gzip copy (and a brotli copy when the optional
+``brotli`` package is installed) next to every report, so downloads never compress
+on the request path; :func:`negotiate_encoding` picks the variant matching
+``Accept-Encoding``. Lazily rendered reports have no files to serve; they are
+rendered and compressed on a cache miss instead. Each variant gets a strong ETag derived from the SHA-256 of the
+HTML (for rendered reports, of the source plus the template version), and recently served bodies are kept in a byte-bounded LRU because report links
+are typically opened several times right after the email goes out.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Tuple
+from urllib.parse import quote
+
+from ..config import get_settings
+from .report_index import ReportRecord
+
+try:  # Optional: brotli variants are only written when the package is available.
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None
+
+# Content-Encoding -> file suffix, in server preference order.
+VARIANT_SUFFIXES: Dict[str, str] = {"br": ".br", "gzip": ".gz"}
+
+
+def content_digest(data: bytes) -> str:
+    return base64.urlsafe_b64encode(hashlib.sha256(data).digest()).decode("ascii").rstrip("=")
+
+
+@lru_cache(maxsize=1024)
+def stored_digest(path: Path, size: int, mtime_ns: int) -> str:
+    # Keyed by size and mtime so a rewritten file is hashed again.
+    return content_digest(path.read_bytes())
+
+
+def variant_path(path: Path, encoding: str) -> Path:
+    return path.with_name(path.name + VARIANT_SUFFIXES[encoding])
+
+
+def variant_paths(path: Path) -> List[Path]:
+    return [variant_path(path, encoding) for encoding in VARIANT_SUFFIXES]
+
+
+def derived_paths(path: Path) -> List[Path]:
+    """Files stored alongside ``path`` that go when it does.
+
+    That is its compressed copies, its PDF and, for rendered HTML, the evaluation JSON
+    it was built from.
+    """
+
+    derived = [*variant_paths(path), path.with_suffix(".pdf")]
+    if path.suffix == ".html":
+        derived.append(path.with_suffix(".json"))
+    return derived
+
+
+def available_encodings() -> List[str]:
+    return [encoding for encoding in VARIANT_SUFFIXES if encoding != "br" or brotli is not None]
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=9)
+    # mtime=0 keeps the gzip bytes, and so their ETag, reproducible.
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def write_variants(path: Path, body: bytes) -> None:
+    for encoding in available_encodings():
+        variant_path(path, encoding).write_bytes(compress(body, encoding))
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str | None, encodings: Iterable[str]) -> str | None:
+    """First of ``encodings`` allowed by ``Accept-Encoding``; ``None`` serves the plain HTML."""
+
+    if not accept_encoding:
+        return None
+    accepted = _accepted_encodings(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    for encoding in encodings:
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class ReportBody:
+    content: bytes
+    encoding: str | None
+    etag: str
+
+
+class ReportBodyCache:
+    """Thread-safe LRU of report bodies bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str | None, int], ReportBody]" = OrderedDict()
+        self._reset_unlocked()
+
+    def _reset_unlocked(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Tuple[str, str | None, int]) -> ReportBody | None:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return body
+
+    def put(self, key: Tuple[str, str | None, int], body: ReportBody) -> None:
+        size = len(body.content)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous.content)
+            self._entries[key] = body
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted.content)
+                self._evictions += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset_unlocked()
+
+
+@lru_cache
+def get_report_cache() -> ReportBodyCache:
+    return ReportBodyCache(get_settings().report_cache_max_bytes)
+
+
+def load_report_body(
+    record: ReportRecord,
+    accept_encoding: str | None,
+    *,
+    render: Callable[[Path], bytes] | None = None,
+    render_version: str = "",
+) -> ReportBody:
+    """The body to send for ``record``; raises ``FileNotFoundError`` once it is gone.
+
+    Stored HTML is served from its pre-compressed files. With ``render``, ``record.path``
+    is a source document instead: it is rendered, and compressed if negotiated, only
+    when the cache misses, so the cache doubles as the bounded render cache.
+    ``render_version`` identifies the templates ``render`` uses; it is part of the
+    cache key and the ETag, so a template change is never answered with a stale 304.
+    """
+
+    stat = record.path.stat()
+    if render is None:
+        stored = [encoding for encoding in VARIANT_SUFFIXES if variant_path(record.path, encoding).exists()]
+        encoding = negotiate_encoding(accept_encoding, stored)
+    else:
+        encoding = negotiate_encoding(accept_encoding, available_encodings())
+    cache = get_report_cache()
+    source_key = f"{record.path}@{render_version}" if render_version else str(record.path)
+    key = (source_key, encoding, stat.st_mtime_ns)
+    body = cache.get(key)
+    if body is None:
+        digest = stored_digest(record.path, stat.st_size, stat.st_mtime_ns)
+        if render_version:
+            digest = f"{digest}.{render_version}"
+        if render is None:
+            source = record.path if encoding is None else variant_path(record.path, encoding)
+            content = source.read_bytes()
+        else:
+            content = render(record.path)
+            if encoding is not None:
+                content = compress(content, encoding)
+        body = ReportBody(
+            content=content,
+            encoding=encoding,
+            etag=f'"{digest}"' if encoding is None else f'"{digest}-{encoding}"',
+        )
+        cache.put(key, body)
+    return body
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # If-None-Match uses the weak comparison, so a ``W/`` prefix still matches.
+    return any(candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def download_headers(filename: str, expires_at: datetime, now: datetime) -> Dict[str, str]:
+    """Caching and file name headers for a download that stays valid until ``expires_at``."""
+
+    max_age = max(0, int((expires_at - now).total_seconds()))
+    quoted = quote(filename)
+    disposition = (
+        f'attachment; filename="{filename}"' if quoted == filename else f"attachment; filename*=utf-8''{quoted}"
+    )
+    return {"Cache-Control": f"private, max-age={max_age}", "Content-Disposition": disposition}
+
+
+def report_headers(record: ReportRecord, body: ReportBody, now: datetime) -> Dict[str, str]:
+    headers = {
+        "ETag": body.etag,
+        "Vary": "Accept-Encoding",
+        **download_headers(record.filename, record.expires_at, now),
+    }
+    if body.encoding is not None:
+        headers["Content-Encoding"] = body.encoding
+    return headers
+
+
+def get_report_cache_stats() -> dict:
+    return get_report_cache().snapshot()
@@ -0,0 +1,214 @@
+"""Background expiry of stored reports.
+
+Every registered report is pushed onto a min-heap ordered by ``expires_at``. A daemon
+reaper thread sleeps until the earliest expiry (or at most the sweep interval) and
+then removes due reports in batches — index rows first, then the stored files with
+their compressed copies and PDFs — so
+requests never scan or delete anything. The heap only holds reports registered by
+this process and those loaded when the reaper starts, so every pass also asks the
+index for expired rows left behind by other workers.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from .report_delivery import derived_paths
+from .report_index import ReportIndex, ReportRecord, _to_epoch
+
+logger = logging.getLogger(__name__)
+
+
+class ExpiryStats:
+    """Thread-safe counters for the report reaper."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset_unlocked()
+
+    def _reset_unlocked(self) -> None:
+        self._scheduled = 0
+        self._sweeps = 0
+        self._reaped = 0
+        self._bytes_freed = 0
+        self._delete_errors = 0
+
+    def record_scheduled(self, count: int = 1) -> None:
+        with self._lock:
+            self._scheduled += count
+
+    def record_sweep(self, reaped: int, bytes_freed: int, delete_errors: int) -> None:
+        with self._lock:
+            self._sweeps += 1
+            self._reaped += reaped
+            self._bytes_freed += bytes_freed
+            self._delete_errors += delete_errors
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "scheduled": self._scheduled,
+                "sweeps": self._sweeps,
+                "reaped_reports": self._reaped,
+                "bytes_freed": self._bytes_freed,
+                "delete_errors": self._delete_errors,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset_unlocked()
+
+
+EXPIRY_STATS = ExpiryStats()
+
+HeapEntry = Tuple[float, str, str]  # (expires_at epoch, report_id, file path)
+
+
+class ExpiryScheduler:
+    def __init__(
+        self,
+        index: ReportIndex,
+        *,
+        interval: float = 60.0,
+        batch_size: int = 200,
+        stats: ExpiryStats | None = None,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ) -> None:
+        self.index = index
+        self.interval = interval
+        self.batch_size = batch_size
+        self.stats = stats if stats is not None else EXPIRY_STATS
+        self._clock = clock
+        self._heap: List[HeapEntry] = []
+        self._wakeup = threading.Condition()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        with self._wakeup:
+            return len(self._heap)
+
+    def schedule(self, report_id: str, record: ReportRecord) -> None:
+        entry = (_to_epoch(record.expires_at), report_id, str(record.path))
+        with self._wakeup:
+            heapq.heappush(self._heap, entry)
+            if self._heap[0] is entry:
+                self._wakeup.notify()
+        self.stats.record_scheduled()
+
+    def load(self) -> int:
+        """Seed the heap with every report already in the index (e.g. after a restart)."""
+
+        entries = [(_to_epoch(expires_at), report_id, path) for report_id, path, expires_at in self.index.expiries()]
+        with self._wakeup:
+            self._heap.extend(entries)
+            heapq.heapify(self._heap)
+            self._wakeup.notify()
+        self.stats.record_scheduled(len(entries))
+        return len(entries)
+
+    def _pop_due(self, cutoff: float) -> List[HeapEntry]:
+        due: List[HeapEntry] = []
+        with self._wakeup:
+            while self._heap and self._heap[0][0] < cutoff and len(due) < self.batch_size:
+                due.append(heapq.heappop(self._heap))
+        return due
+
+    def run_due(self, now: datetime | None = None) -> int:
+        """Reap every report expired by ``now`` in batches; returns how many files were deleted."""
+
+        cutoff = _to_epoch(now or self._clock())
+        total = 0
+        while True:
+            due = self._pop_due(cutoff)
+            if due:
+                self.index.delete_many([report_id for _, report_id, _ in due])
+            # Rows registered by other workers are not on this heap; the expiry index finds them.
+            swept = self.index.pop_expired(now or self._clock(), limit=self.batch_size)
+            paths = {Path(path) for _, _, path in due} | {record.path for record in swept}
+            if paths:
+                # Deduplicated sources are shared by several reports; keep them until the last one
+                # expires. Checked and deleted under the write lock persist_report takes to reuse one.
+                with self.index.exclusive():
+                    in_use = self.index.paths_in_use(str(path) for path in paths)
+                    total += self._delete_files({path for path in paths if str(path) not in in_use})
+            if len(due) < self.batch_size and len(swept) < self.batch_size:
+                return total
+
+    def _delete_files(self, paths: set[Path]) -> int:
+        reaped = freed = errors = 0
+        for path in paths:
+            size = self._unlink(path)
+            if size is None:
+                errors += 1
+                continue
+            if size < 0:
+                continue  # already removed by an earlier batch or another worker's reaper
+            reaped += 1
+            freed += size
+            for variant in derived_paths(path):
+                size = self._unlink(variant)
+                if size is None:
+                    errors += 1
+                elif size > 0:
+                    freed += size
+        self.stats.record_sweep(reaped, freed, errors)
+        return reaped
+
+    @staticmethod
+    def _unlink(path: Path) -> int | None:
+        """Bytes freed by deleting ``path``; -1 if it was already gone, ``None`` on failure."""
+
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            return -1
+        except OSError as exc:
+            logger.warning("Unable to delete expired report %s: %s", path, exc)
+            return None
+        return size
+
+    def _seconds_until_next(self) -> float:
+        if not self._heap:
+            return self.interval
+        remaining = self._heap[0][0] - _to_epoch(self._clock())
+        return max(0.0, min(self.interval, remaining))
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                if self._stopping:
+                    return
+                self._wakeup.wait(self._seconds_until_next())
+                if self._stopping:
+                    return
+            try:
+                self.run_due()
+            except Exception:  # noqa: BLE001 - keep the reaper alive across transient failures
+                logger.exception("Report reaper pass failed")
+
+    def start(self) -> None:
+        with self._wakeup:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="report-reaper", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        with self._wakeup:
+            self._stopping = True
+            self._wakeup.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout)
+
+
+def get_expiry_stats() -> dict:
+    return EXPIRY_STATS.snapshot()
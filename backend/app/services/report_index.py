@@ -0,0 +1,242 @@
+"""Persistent report index shared by every worker process.
+
+Issued report links must resolve after a restart and on any worker, so the index
+lives in a SQLite database next to the stored reports, opened in WAL mode so readers
+never block the writer. ``report_id`` is the primary key and ``session_id`` /
+``expires_at`` are indexed, so every lookup is a B-tree search instead of a scan.
+Session recordings are indexed alongside, so exports and audio downloads find them
+on any worker.
+Connections are per thread; SQLite serialises writers across processes.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    report_id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    session_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_session ON reports (session_id, created_at);
+CREATE INDEX IF NOT EXISTS reports_expiry ON reports (expires_at);
+CREATE INDEX IF NOT EXISTS reports_path ON reports (path);
+CREATE TABLE IF NOT EXISTS recordings (
+    session_id TEXT PRIMARY KEY,
+    path TEXT NOT NULL
+);
+"""
+# Columns added after the first release; existing databases are migrated on open.
+_MIGRATIONS = (
+    ("tenant", "ALTER TABLE reports ADD COLUMN tenant TEXT"),
+)
+_INDEXES_AFTER_MIGRATION = "CREATE INDEX IF NOT EXISTS reports_tenant ON reports (tenant, created_at);"
+_COLUMNS = "path, filename, created_at, expires_at, session_id, tenant"
+
+
+@dataclass
+class ReportRecord:
+    path: Path
+    filename: str
+    created_at: datetime
+    expires_at: datetime
+    session_id: str
+    tenant: str | None = None
+
+
+def _to_epoch(value: datetime) -> float:
+    """Naive datetimes are UTC throughout the reporting module."""
+
+    return value.replace(tzinfo=timezone.utc).timestamp() if value.tzinfo is None else value.timestamp()
+
+
+def _from_epoch(value: float) -> datetime:
+    return datetime.fromtimestamp(value, tz=timezone.utc).replace(tzinfo=None)
+
+
+def _record(row: tuple) -> ReportRecord:
+    path, filename, created_at, expires_at, session_id, tenant = row
+    return ReportRecord(
+        path=Path(path),
+        filename=filename,
+        created_at=_from_epoch(created_at),
+        expires_at=_from_epoch(expires_at),
+        session_id=session_id,
+        tenant=tenant,
+    )
+
+
+class ReportIndex:
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        connection = self._connection()
+        connection.executescript(_SCHEMA)
+        # Workers open the index concurrently: only one of them may add a column.
+        with self.exclusive():
+            existing = {row[1] for row in connection.execute("PRAGMA table_info(reports)")}
+            for column, statement in _MIGRATIONS:
+                if column not in existing:
+                    connection.execute(statement)
+        connection.executescript(_INDEXES_AFTER_MIGRATION)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """Hold the database write lock, across processes, for file changes that must agree with the rows.
+
+        Index calls made inside the block join its transaction.
+        """
+
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def add(self, report_id: str, record: ReportRecord) -> None:
+        self._connection().execute(
+            f"INSERT OR REPLACE INTO reports (report_id, {_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                report_id,
+                str(record.path),
+                record.filename,
+                _to_epoch(record.created_at),
+                _to_epoch(record.expires_at),
+                record.session_id,
+                record.tenant,
+            ),
+        )
+
+    def get(self, report_id: str) -> ReportRecord | None:
+        row = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM reports WHERE report_id = ?", (report_id,)
+        ).fetchone()
+        return _record(row) if row else None
+
+    def for_session(self, session_id: str, now: datetime) -> List[ReportRecord]:
+        """Unexpired reports of ``session_id``, newest first."""
+
+        rows = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM reports WHERE session_id = ? AND expires_at >= ? ORDER BY created_at DESC",
+            (session_id, _to_epoch(now)),
+        ).fetchall()
+        return [_record(row) for row in rows]
+
+    def latest_per_session(
+        self,
+        now: datetime,
+        *,
+        session_ids: Sequence[str] | None = None,
+        tenant: str | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> List[ReportRecord]:
+        """Newest unexpired report of every session matching the filters, by session id."""
+
+        conditions, params = ["expires_at >= ?"], [_to_epoch(now)]
+        if session_ids is not None:
+            conditions.append(f"session_id IN ({', '.join('?' * len(session_ids))})")
+            params.extend(session_ids)
+        if tenant is not None:
+            conditions.append("tenant = ?")
+            params.append(tenant)
+        if created_from is not None:
+            conditions.append("created_at >= ?")
+            params.append(_to_epoch(created_from))
+        if created_to is not None:
+            conditions.append("created_at <= ?")
+            params.append(_to_epoch(created_to))
+        rows = self._connection().execute(
+            f"SELECT {_COLUMNS} FROM reports WHERE {' AND '.join(conditions)} ORDER BY session_id, created_at DESC",
+            params,
+        ).fetchall()
+        latest: dict[str, ReportRecord] = {}
+        for row in rows:
+            record = _record(row)
+            latest.setdefault(record.session_id, record)
+        return list(latest.values())
+
+    def delete(self, report_id: str) -> None:
+        self._connection().execute("DELETE FROM reports WHERE report_id = ?", (report_id,))
+
+    def delete_many(self, report_ids: Iterable[str]) -> None:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany("DELETE FROM reports WHERE report_id = ?", [(report_id,) for report_id in report_ids])
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+    def set_recording(self, session_id: str, path: Path) -> None:
+        self._connection().execute(
+            "INSERT OR REPLACE INTO recordings (session_id, path) VALUES (?, ?)", (session_id, str(path))
+        )
+
+    def recording(self, session_id: str) -> Path | None:
+        row = self._connection().execute("SELECT path FROM recordings WHERE session_id = ?", (session_id,)).fetchone()
+        return Path(row[0]) if row else None
+
+    def paths_in_use(self, paths: Iterable[str]) -> set[str]:
+        """Those of ``paths`` still referenced by a report, e.g. a deduplicated evaluation."""
+
+        connection = self._connection()
+        return {
+            path
+            for path in paths
+            if connection.execute("SELECT 1 FROM reports WHERE path = ? LIMIT 1", (path,)).fetchone() is not None
+        }
+
+    def expiries(self) -> List[Tuple[str, str, datetime]]:
+        """``(report_id, path, expires_at)`` for every indexed report, soonest expiry first."""
+
+        rows = self._connection().execute("SELECT report_id, path, expires_at FROM reports ORDER BY expires_at").fetchall()
+        return [(report_id, path, _from_epoch(expires_at)) for report_id, path, expires_at in rows]
+
+    def pop_expired(self, now: datetime, limit: int = 500) -> List[ReportRecord]:
+        """Remove up to ``limit`` expired entries and return them, oldest expiry first."""
+
+        connection = self._connection()
+        cutoff = _to_epoch(now)
+        # Cheap indexed read first so the common "nothing expired" case never takes the write lock.
+        if connection.execute("SELECT 1 FROM reports WHERE expires_at < ? LIMIT 1", (cutoff,)).fetchone() is None:
+            return []
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            rows = connection.execute(
+                f"SELECT report_id, {_COLUMNS} FROM reports WHERE expires_at < ? ORDER BY expires_at LIMIT ?",
+                (cutoff, limit),
+            ).fetchall()
+            connection.executemany("DELETE FROM reports WHERE report_id = ?", [(row[0],) for row in rows])
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return [_record(row[1:]) for row in rows]
+
+    def __len__(self) -> int:
+        return int(self._connection().execute("SELECT COUNT(*) FROM reports").fetchone()[0])
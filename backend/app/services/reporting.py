@@ -6,19 +6,40 @@ import base64
 import hashlib
 import hmac
 import json
+import os
 import secrets
-from html import escape
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Sequence
+
+from jinja2 import ChoiceLoader, Environment, FileSystemLoader, StrictUndefined, Template
+from markupsafe import Markup
 
 from ..config import get_settings
 from ..models import DualEvaluationResponse, StandardEvaluation
+from . import report_delivery
+from .accel_redirect import REPORTS_LOCATION, accel_redirect_enabled, accel_redirect_headers
+from .report_delivery import ReportBody, content_digest, stored_digest, write_variants
+from .pdf_queue import get_pdf_queue
+from .pdf_writer import PdfDocument
+from .report_expiry import ExpiryScheduler
+from .report_index import ReportIndex, ReportRecord, _from_epoch, _to_epoch
+from .scoring import CONFIG_ROOT, ConfigNotFoundError, StandardScorer, get_scorer
 
 REPORTS_DIR = Path("backend/protected_reports")
 REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+INDEX_FILENAME = "reports.sqlite3"
+
+# Default report templates and stylesheet; a tenant may override any of these files
+# by placing a file with the same name under ``configs/tenants/<tenant>/report/``.
+TEMPLATES_DIR = Path(__file__).resolve().parents[1] / "templates" / "report"
+TENANT_TEMPLATES_DIR = CONFIG_ROOT / "tenants"
+_TENANT_SLUG = re.compile(r"^[a-z0-9][a-z0-9_-]{0,63}$")
 
-_REPORT_INDEX: dict[str, "ReportRecord"] = {}
 _TOKEN_TTL_MINUTES = 60 * 24 * 7
+_STATELESS_TOKEN_VERSION = 2
+_STORAGE_KEY = re.compile(r"^[A-Za-z0-9_-]{1,64}\.(html|json)$")
 
 
 def _now() -> datetime:
@@ -34,40 +55,93 @@ def _urlsafe_b64decode(raw: str) -> bytes:
     return base64.urlsafe_b64decode(raw + padding)
 
 
-@dataclass
-class ReportRecord:
-    path: Path
-    filename: str
-    created_at: datetime
-    expires_at: datetime
-    session_id: str
+def _report_index() -> ReportIndex:
+    return _open_index(REPORTS_DIR / INDEX_FILENAME)
+
+
+@lru_cache(maxsize=8)
+def _open_index(path: Path) -> ReportIndex:
+    return ReportIndex(path)
+
+
+def _expiry_scheduler() -> ExpiryScheduler:
+    return _open_scheduler(REPORTS_DIR / INDEX_FILENAME)
+
+
+@lru_cache(maxsize=8)
+def _open_scheduler(path: Path) -> ExpiryScheduler:
+    settings = get_settings()
+    return ExpiryScheduler(
+        _open_index(path),
+        interval=settings.report_reaper_interval_seconds,
+        batch_size=settings.report_reaper_batch_size,
+    )
+
+
+def start_report_reaper() -> None:
+    """Load the stored reports onto the expiry heap and start the background reaper."""
+
+    scheduler = _expiry_scheduler()
+    scheduler.load()
+    scheduler.start()
+
+
+def stop_report_reaper() -> None:
+    _expiry_scheduler().stop()
 
 
 def _register_report(record: ReportRecord, report_id: str) -> None:
-    _REPORT_INDEX[report_id] = record
+    _report_index().add(report_id, record)
+    _expiry_scheduler().schedule(report_id, record)
 
 
-def _cleanup_expired_reports(reference: datetime | None = None) -> None:
-    now = reference or _now()
-    expired_keys = [key for key, record in _REPORT_INDEX.items() if record.expires_at < now]
-    for key in expired_keys:
-        record = _REPORT_INDEX.pop(key)
-        if record.path.exists():
-            try:
-                record.path.unlink()
-            except OSError:
-                pass
+def register_recording(session_id: str, path: Path) -> None:
+    """Remember the MP3 of ``session_id`` for exports and audio downloads on any worker."""
 
+    _report_index().set_recording(session_id, path)
 
-def _build_signed_token(report_id: str, expires_at: datetime) -> str:
+
+def recording_for_session(session_id: str) -> Path | None:
+    return _report_index().recording(session_id)
+
+
+def _sign_payload(payload: dict) -> str:
     settings = get_settings()
-    payload = {"rid": report_id, "exp": int(expires_at.timestamp())}
     serialized = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
     signature = hmac.new(settings.secret_token.encode("utf-8"), serialized, hashlib.sha256).digest()
     return f"{_urlsafe_b64encode(serialized)}.{_urlsafe_b64encode(signature)}"
 
 
-def _parse_signed_token(token: str) -> tuple[str, datetime]:
+def _build_signed_token(report_id: str, expires_at: datetime) -> str:
+    """Index-backed (version 1) token; still accepted, no longer issued."""
+
+    return _sign_payload({"rid": report_id, "exp": int(expires_at.timestamp())})
+
+
+def _build_stateless_token(report_id: str, record: ReportRecord, digest: str) -> str:
+    """Version 2 token: everything needed to serve the report is signed into the link.
+
+    Besides the report id and expiry it carries the storage key (the file name under
+    ``REPORTS_DIR``), the SHA-256 of the stored file (the HTML, or the evaluation JSON
+    of a lazily rendered report), the download filename and the session id, so any
+    replica that shares the report storage can serve it without the index.
+    """
+
+    return _sign_payload(
+        {
+            "v": _STATELESS_TOKEN_VERSION,
+            "rid": report_id,
+            "exp": _to_epoch(record.expires_at),
+            "iat": _to_epoch(record.created_at),
+            "key": record.path.name,
+            "sha": digest,
+            "fn": record.filename,
+            "sid": record.session_id,
+        }
+    )
+
+
+def _parse_signed_token(token: str) -> dict:
     try:
         payload_b64, signature_b64 = token.split(".", 1)
     except ValueError as exc:
@@ -85,34 +159,62 @@ def _parse_signed_token(token: str) -> tuple[str, datetime]:
         raise ValueError("Invalid token signature")
 
     payload = json.loads(payload_bytes)
+    if not isinstance(payload, dict):
+        raise ValueError("Malformed token payload")
     report_id = payload.get("rid")
     expires_ts = payload.get("exp")
     if not isinstance(report_id, str) or not isinstance(expires_ts, (int, float)):
         raise ValueError("Malformed token payload")
+    return payload
+
+
+def _resolve_stateless_token(payload: dict) -> ReportRecord:
+    key, digest, filename = payload.get("key"), payload.get("sha"), payload.get("fn")
+    session_id, issued_ts = payload.get("sid", ""), payload.get("iat")
+    if (
+        not isinstance(key, str)
+        or not _STORAGE_KEY.match(key)
+        or not isinstance(digest, str)
+        or not isinstance(filename, str)
+        or not isinstance(session_id, str)
+        or not isinstance(issued_ts, (int, float))
+    ):
+        raise ValueError("Malformed token payload")
+
+    expires_at = _from_epoch(float(payload["exp"]))
+    if expires_at < _now():
+        raise ValueError("Report link expired")
 
-    expires_at = datetime.utcfromtimestamp(float(expires_ts))
-    return report_id, expires_at
+    path = REPORTS_DIR / key
+    try:
+        stat = path.stat()
+    except FileNotFoundError as exc:
+        raise ValueError("Report not found") from exc
+    if not hmac.compare_digest(stored_digest(path, stat.st_size, stat.st_mtime_ns), digest):
+        raise ValueError("Report content does not match its link")
+
+    return ReportRecord(
+        path=path,
+        filename=filename,
+        created_at=_from_epoch(float(issued_ts)),
+        expires_at=expires_at,
+        session_id=session_id,
+    )
 
 
 def resolve_report_token(token: str) -> ReportRecord:
-    _cleanup_expired_reports()
-    report_id, expires_at = _parse_signed_token(token)
+    payload = _parse_signed_token(token)
+    if payload.get("v") == _STATELESS_TOKEN_VERSION:
+        return _resolve_stateless_token(payload)
 
-    record = _REPORT_INDEX.get(report_id)
+    report_id = payload["rid"]
+    expires_at = datetime.utcfromtimestamp(float(payload["exp"]))
+    record = _report_index().get(report_id)
     if not record:
         raise ValueError("Report not found")
 
     if expires_at < _now() or record.expires_at < _now():
-        # Token expired; clean up and deny access.
-        try:
-            del _REPORT_INDEX[report_id]
-        except KeyError:
-            pass
-        if record.path.exists():
-            try:
-                record.path.unlink()
-            except OSError:
-                pass
+        # Deny access; the background reaper deletes the file and index row.
         raise ValueError("Report link expired")
 
     return record
@@ -124,16 +226,10 @@ def get_latest_report_for_session(session_id: str) -> ReportRecord | None:
     if not session_id:
         return None
 
-    _cleanup_expired_reports()
-    matching_records = [
-        record
-        for record in _REPORT_INDEX.values()
-        if record.session_id == session_id and record.path.exists()
-    ]
-    if not matching_records:
-        return None
-
-    return max(matching_records, key=lambda record: record.created_at)
+    for record in _report_index().for_session(session_id, _now()):
+        if record.path.exists():
+            return record
+    return None
 
 
 def _parse_iso_datetime(raw: str) -> datetime | None:
@@ -148,78 +244,131 @@ def _parse_iso_datetime(raw: str) -> datetime | None:
         return None
 
 
-def _format_criteria_rows(standard: StandardEvaluation) -> str:
-    rows = []
-    for criterion_id, criterion in standard.criteria.items():
-        label = standard.criterion_labels.get(criterion_id, criterion_id.replace("_", " ").title())
-        if standard.standard_id == "toefl":
-            max_scale = 4
-        elif standard.standard_id == "itep":
-            max_scale = 6
-        else:
-            max_scale = 9
-        rows.append(
-            "<tr>"
-            f"<td>{label}</td>"
-            f"<td>{criterion.score:.2f} / {max_scale}</td>"
-            f"<td>{criterion.comment}</td>"
-            "</tr>"
-        )
-    return "".join(rows)
+def _scorer_for(standard: StandardEvaluation) -> StandardScorer | None:
+    try:
+        return get_scorer(standard.standard_id)
+    except (ConfigNotFoundError, KeyError, ValueError):
+        return None
+
+
+def _template_tenant(tenant: str | None) -> str | None:
+    """``tenant`` when it has template overrides on disk, otherwise ``None`` (the defaults)."""
+
+    if not tenant or not _TENANT_SLUG.match(tenant):
+        return None
+    return tenant if _tenant_has_overrides(tenant) else None
+
+
+@lru_cache(maxsize=256)
+def _tenant_has_overrides(tenant: str) -> bool:
+    return (TENANT_TEMPLATES_DIR / tenant / "report").is_dir()
+
+
+@lru_cache(maxsize=64)
+def _environment(tenant: str | None) -> Environment:
+    """One Jinja2 environment per tenant with overrides; templates compile on first use and stay cached."""
+
+    loaders = [FileSystemLoader(TEMPLATES_DIR)]
+    if tenant is not None:
+        loaders.insert(0, FileSystemLoader(TENANT_TEMPLATES_DIR / tenant / "report"))
+    return Environment(
+        loader=ChoiceLoader(loaders),
+        autoescape=True,
+        auto_reload=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        undefined=StrictUndefined,
+    )
+
+
+@lru_cache(maxsize=64)
+def _report_template(tenant: str | None) -> Template:
+    return _environment(tenant).get_template("report.html.j2")
+
+
+@lru_cache(maxsize=64)
+def _stylesheet(tenant: str | None) -> Markup:
+    environment = _environment(tenant)
+    source, _, _ = environment.loader.get_source(environment, "report.css")
+    return Markup(source)
+
+
+@lru_cache(maxsize=64)
+def _template_version(tenant: str | None, language: str) -> str:
+    """Short digest of the templates and stylesheet a render for ``tenant`` reads."""
+
+    environment = _environment(tenant)
+    digest = hashlib.sha256(language.encode("utf-8"))
+    for name in sorted(environment.list_templates()):
+        source, _, _ = environment.loader.get_source(environment, name)
+        digest.update(b"\0" + name.encode("utf-8") + b"\0" + source.encode("utf-8"))
+    return content_digest(digest.digest())[:16]
+
 
+def clear_template_cache() -> None:
+    """Forget compiled templates and stylesheets, e.g. after deploying new tenant overrides."""
 
-def _format_errors_list(standard: StandardEvaluation) -> str:
-    return "".join(f"<li><strong>{error.issue}:</strong> {error.fix}</li>" for error in standard.common_errors)
+    for cached in (_tenant_has_overrides, _environment, _report_template, _stylesheet, _template_version):
+        cached.cache_clear()
 
 
-def _format_quotes(quotes: list[str]) -> str:
-    return "".join(f"<blockquote>“{quote}”</blockquote>" for quote in quotes)
+@dataclass(frozen=True, slots=True)
+class _CriterionRow:
+    label: str
+    score: str
+    comment: str
 
 
-def _render_standard_section(standard: StandardEvaluation) -> str:
+@dataclass(frozen=True, slots=True)
+class _StandardView:
+    """What ``standard.html.j2`` renders; attribute access keeps Jinja lookups cheap."""
+
+    label: str
+    status: str
+    error: str | None
+    cefr: str | None
+    overall_caption: str
+    criteria: list[_CriterionRow]
+    common_errors: list
+    recommendations: list[str]
+    evidence_quotes: list[str]
+
+
+def _standard_view(standard: StandardEvaluation) -> _StandardView:
+    scorer = _scorer_for(standard)
+    max_suffix = f" / {scorer.scale_max:g}" if scorer and scorer.scale_max is not None else ""
     if standard.status != "ok":
-        return f"""
-        <section class=\"card\">
-            <h2>{standard.label}</h2>
-            <div class=\"alert alert-error\">Evaluation failed: {standard.error or 'Unknown error'}.</div>
-        </section>
-        """
-
-    criteria_rows = _format_criteria_rows(standard)
-    errors_list = _format_errors_list(standard)
-    recs_list = "".join(f"<li>{item}</li>" for item in standard.recommendations)
-    quotes_html = _format_quotes(standard.evidence_quotes)
-    if standard.standard_id == "toefl":
-        overall_caption = f"{standard.overall:.2f} / 4"
-    elif standard.standard_id == "itep":
-        overall_caption = f"{standard.overall:.1f} / 6"
+        overall_caption = ""
     else:
-        overall_caption = f"Band {standard.overall:.1f}"
-
-    return f"""
-    <section class=\"card\">
-        <div class=\"card-header\">
-            <h2>{standard.label}</h2>
-            <div class=\"score\">{overall_caption}</div>
-            <div class=\"cefr\">Approx. CEFR: {standard.cefr or '—'}</div>
-        </div>
-        <h3>Criteria Breakdown</h3>
-        <table>
-            <thead>
-                <tr><th>Criterion</th><th>Score</th><th>Comment</th></tr>
-            </thead>
-            <tbody>
-                {criteria_rows}
-            </tbody>
-        </table>
-        <h3>Common Errors</h3>
-        <ul>{errors_list}</ul>
-        <h3>Recommendations</h3>
-        <ol>{recs_list}</ol>
-        <h3>Evidence Quotes</h3>
-        <div class=\"quotes\">{quotes_html}</div>
-    </section>
-    """
+        overall_caption = scorer.format_overall(standard.overall) if scorer else f"{standard.overall}"
+    return _StandardView(
+        label=standard.label,
+        status=standard.status,
+        error=standard.error,
+        cefr=standard.cefr,
+        overall_caption=overall_caption,
+        criteria=[
+            _CriterionRow(
+                label=standard.criterion_labels.get(criterion_id, criterion_id.replace("_", " ").title()),
+                score=f"{criterion.score:.2f}{max_suffix}",
+                comment=criterion.comment,
+            )
+            for criterion_id, criterion in standard.criteria.items()
+        ],
+        common_errors=standard.common_errors,
+        recommendations=standard.recommendations,
+        evidence_quotes=standard.evidence_quotes,
+    )
+
+
+def _badge_text(standard: StandardEvaluation) -> str:
+    scorer = _scorer_for(standard)
+    name = scorer.short_label if scorer else standard.label
+    if standard.status != "ok" or standard.overall is None:
+        return f"{name} unavailable"
+    if scorer is None:
+        return f"{name} {standard.overall} (~{standard.cefr})"
+    return scorer.format_badge(standard.overall, standard.cefr)
 
 
 def _format_participant_sentence(evaluation: DualEvaluationResponse, session_metadata: Optional[dict]) -> str:
@@ -256,9 +405,9 @@ def _format_participant_sentence(evaluation: DualEvaluationResponse, session_met
 
     identity_parts: list[str] = []
     if full_name:
-        identity_parts.append(escape(full_name))
+        identity_parts.append(full_name)
     if email:
-        identity_parts.append(f"({escape(email)})" if full_name else escape(email))
+        identity_parts.append(f"({email})" if full_name else email)
 
     identity = " ".join(identity_parts).strip()
 
@@ -267,43 +416,12 @@ def _format_participant_sentence(evaluation: DualEvaluationResponse, session_met
     return f"Bu rapor {formatted_timestamp}{timezone_suffix} tarihinde oluşturuldu."
 
 
-
-
-def build_html_report(evaluation: DualEvaluationResponse, session_metadata: Optional[dict] = None) -> str:
-    settings = get_settings()
-    warnings_html = "".join(f"<div class=\"alert alert-warning\">{w}</div>" for w in (evaluation.warnings or []))
-
-    standard_sections = "".join(_render_standard_section(std) for std in evaluation.standards)
-
-    toefl_badge = next((s for s in evaluation.standards if s.standard_id == "toefl"), None)
-    itep_badge = next((s for s in evaluation.standards if s.standard_id == "itep"), None)
-    ielts_badge = next((s for s in evaluation.standards if s.standard_id == "ielts"), None)
-
-    def badge_text(standard: StandardEvaluation | None, denom: str) -> str:
-        if not standard or standard.status != "ok" or standard.overall is None:
-            return f"{denom} unavailable"
-        if standard.standard_id == "toefl":
-            return f"TOEFL {standard.overall:.2f}/4 (~{standard.cefr})"
-        if standard.standard_id == "itep":
-            return f"iTEP {standard.overall:.1f}/6 (~{standard.cefr})"
-        return f"IELTS {standard.overall:.1f}/9 (~{standard.cefr})"
-
-    badges = "".join(
-        f"<span class=\"badge\">{text}</span>"
-        for text in (
-            badge_text(toefl_badge, "TOEFL"),
-            badge_text(itep_badge, "iTEP"),
-            badge_text(ielts_badge, "IELTS"),
-        )
-    )
-
-    participant_sentence = _format_participant_sentence(evaluation, session_metadata)
-    participant_summary_html = f"<p class=\"metadata\">{participant_sentence}</p>"
-    session_summary_html = ""
+def _report_context(evaluation: DualEvaluationResponse, session_metadata: Optional[dict]) -> dict:
+    session_summary = ""
     if session_metadata and isinstance(session_metadata, dict):
         raw_summary = session_metadata.get("summary")
-        if isinstance(raw_summary, str) and raw_summary.strip():
-            session_summary_html = f"<p class=\"metadata\"><strong>Session Summary:</strong> {escape(raw_summary.strip())}</p>"
+        if isinstance(raw_summary, str):
+            session_summary = raw_summary.strip()
 
     report_timestamp = evaluation.generated_at
     timestamp_suffix = " (UTC)"
@@ -319,67 +437,204 @@ def build_html_report(evaluation: DualEvaluationResponse, session_metadata: Opti
                 else:
                     timestamp_suffix = ""
 
-    report_generated_display = f"{report_timestamp.strftime('%Y-%m-%d %H:%M:%S')}{timestamp_suffix}"
-
-    report_html = f"""
-    <html lang=\"{settings.report_language}\">
-    <head>
-        <meta charset=\"utf-8\" />
-        <title>Dual Speaking Assessment Report</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 2rem; color: #1f2933; }}
-            h1, h2, h3 {{ color: #0f172a; }}
-            .summary {{ background: #eef2ff; padding: 1.5rem; border-radius: 0.75rem; margin-bottom: 2rem; }}
-            .summary .badge {{ display: inline-block; background: #4338ca; color: #fff; padding: 0.4rem 0.8rem; border-radius: 999px; font-size: 0.9rem; margin-right: 0.5rem; }}
-            .card {{ background: #fff; border: 1px solid #cbd5e1; border-radius: 1rem; padding: 1.5rem; margin-bottom: 2rem; box-shadow: 0 10px 30px rgba(15, 23, 42, 0.08); }}
-            .card-header {{ display: flex; align-items: baseline; justify-content: space-between; gap: 1rem; margin-bottom: 1rem; }}
-            table {{ width: 100%; border-collapse: collapse; margin-bottom: 1rem; }}
-            th, td {{ border: 1px solid #e2e8f0; padding: 0.75rem; text-align: left; }}
-            th {{ background: #f8fafc; text-transform: uppercase; font-size: 0.75rem; letter-spacing: 0.08em; }}
-            ul, ol {{ margin-left: 1.5rem; }}
-            blockquote {{ border-left: 4px solid #6366f1; padding-left: 1rem; margin: 0.5rem 0; font-style: italic; color: #4338ca; }}
-            .alert {{ padding: 0.75rem 1rem; border-radius: 0.75rem; margin-bottom: 1rem; }}
-            .alert-warning {{ background: #fef3c7; color: #92400e; }}
-            .alert-error {{ background: #fee2e2; color: #b91c1c; }}
-            .metadata {{ font-size: 0.9rem; color: #475569; margin-top: 1rem; }}
-            .crosswalk {{ background: #ecfdf5; border-radius: 0.75rem; padding: 1.5rem; border: 1px solid #d1fae5; margin-bottom: 2rem; }}
-            .crosswalk h2 {{ margin-top: 0; }}
-        </style>
-    </head>
-    <body>
-        <h1>English Speaking Assessment Report</h1>
-        <div class=\"summary\">
-            <p>{badges}</p>
-            {participant_summary_html}
-            {session_summary_html}
-            <p><strong>Cross-standard note:</strong> {evaluation.crosswalk.notes}</p>
-        </div>
-        {warnings_html}
-        <section class=\"crosswalk\">
-            <h2>Crosswalk Insights</h2>
-            <p><strong>Strengths:</strong> {', '.join(evaluation.crosswalk.strengths)}</p>
-            <p><strong>Focus Areas:</strong> {', '.join(evaluation.crosswalk.focus)}</p>
-        </section>
-        {standard_sections}
-        <h2>Session Notes</h2>
-        <p><strong>Session ID:</strong> {evaluation.session.id}</p>
-        <p><strong>Started At:</strong> {evaluation.session.started_at.isoformat()}</p>
-        <p><strong>Ended At:</strong> {evaluation.session.ended_at.isoformat()}</p>
-        <p><strong>Duration:</strong> {evaluation.session.duration_sec} seconds</p>
-        <p><strong>Turns:</strong> {evaluation.session.turns}</p>
-        <p><strong>Report Generated:</strong> {report_generated_display}</p>
-    </body>
-    </html>
+    return {
+        "language": get_settings().report_language,
+        "badges": [_badge_text(standard) for standard in evaluation.standards],
+        "participant_sentence": _format_participant_sentence(evaluation, session_metadata),
+        "session_summary": session_summary,
+        "crosswalk": evaluation.crosswalk,
+        "warnings": evaluation.warnings or [],
+        "standards": [_standard_view(standard) for standard in evaluation.standards],
+        "session": evaluation.session,
+        "report_generated": f"{report_timestamp.strftime('%Y-%m-%d %H:%M:%S')}{timestamp_suffix}",
+    }
+
+
+def build_html_report(
+    evaluation: DualEvaluationResponse,
+    session_metadata: Optional[dict] = None,
+    *,
+    tenant: str | None = None,
+) -> str:
+    template_tenant = _template_tenant(tenant)
+    return _report_template(template_tenant).render(
+        stylesheet=_stylesheet(template_tenant),
+        **_report_context(evaluation, session_metadata),
+    )
+
+
+def build_pdf_report(evaluation: DualEvaluationResponse, session_metadata: Optional[dict] = None) -> bytes:
+    """The report as a PDF, laid out from the same context as the HTML template."""
+
+    context = _report_context(evaluation, session_metadata)
+    crosswalk = context["crosswalk"]
+    session = context["session"]
+    document = PdfDocument(title="English Speaking Assessment Report")
+    document.text("English Speaking Assessment Report", "title")
+    document.text(" | ".join(context["badges"]), "subheading")
+    document.text(context["participant_sentence"])
+    if context["session_summary"]:
+        document.text(f"Session Summary: {context['session_summary']}")
+    document.text(f"Cross-standard note: {crosswalk.notes}")
+    for warning in context["warnings"]:
+        document.text(f"Warning: {warning}")
+
+    document.text("Crosswalk Insights", "heading")
+    document.text(f"Strengths: {', '.join(crosswalk.strengths)}")
+    document.text(f"Focus Areas: {', '.join(crosswalk.focus)}")
+
+    for standard in context["standards"]:
+        document.text(standard.label, "heading")
+        if standard.status != "ok":
+            document.text(f"Evaluation failed: {standard.error or 'Unknown error'}.")
+            continue
+        document.text(f"{standard.overall_caption} | Approx. CEFR: {standard.cefr or '—'}", "subheading")
+        document.text("Criteria Breakdown", "subheading")
+        for row in standard.criteria:
+            document.bullet(f"{row.label} ({row.score}): {row.comment}")
+        document.text("Common Errors", "subheading")
+        for error in standard.common_errors:
+            document.bullet(f"{error.issue}: {error.fix}")
+        document.text("Recommendations", "subheading")
+        for number, item in enumerate(standard.recommendations, start=1):
+            document.bullet(item, marker=f"{number}.")
+        document.text("Evidence Quotes", "subheading")
+        for quote in standard.evidence_quotes:
+            document.bullet(f"“{quote}”")
+
+    document.text("Session Notes", "heading")
+    document.text(f"Session ID: {session.id}")
+    document.text(f"Started At: {session.started_at.isoformat()}")
+    document.text(f"Ended At: {session.ended_at.isoformat()}")
+    document.text(f"Duration: {session.duration_sec} seconds")
+    document.text(f"Turns: {session.turns}")
+    document.text(f"Report Generated: {context['report_generated']}")
+    return document.render()
+
+
+def _evaluation_document(
+    evaluation: DualEvaluationResponse,
+    session_metadata: Optional[dict],
+    tenant: str | None,
+) -> dict:
+    return {
+        "evaluation": evaluation.model_dump(mode="json", exclude_defaults=True),
+        "session_metadata": session_metadata,
+        "tenant": tenant,
+    }
+
+
+def _render_pdf_document(document: dict) -> bytes:
+    """Process-pool entry point: rebuilds the report model from its JSON document."""
+
+    evaluation = DualEvaluationResponse.model_validate(document["evaluation"])
+    return build_pdf_report(evaluation, document.get("session_metadata"))
+
+
+def _evaluation_payload(
+    evaluation: DualEvaluationResponse,
+    session_metadata: Optional[dict],
+    tenant: str | None,
+) -> bytes:
+    document = _evaluation_document(evaluation, session_metadata, tenant)
+    # Keys keep their order (criteria and standards render in it), which model_dump makes stable.
+    return json.dumps(document, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _store_evaluation(path: Path, payload: bytes) -> None:
+    """Write the compact render input once per distinct content (``path`` names its hash).
+
+    Call under the index write lock, with the report row added in the same block: the
+    reaper deletes unreferenced sources under that lock, so it cannot remove a file
+    between this existence check and the new row.
     """
-    return report_html
 
+    if not path.exists():
+        partial = path.with_name(f"{path.name}.{secrets.token_hex(4)}.tmp")
+        partial.write_bytes(payload)
+        os.replace(partial, path)
+
+
+def evaluation_source(record: ReportRecord) -> Path:
+    """The stored evaluation JSON behind ``record``.
+
+    Rendered reports keep it alongside only with ``REPORT_KEEP_EVALUATION_JSON``.
+    """
+
+    return record.path if record.path.suffix == ".json" else record.path.with_suffix(".json")
+
+
+def load_evaluation_document(record: ReportRecord) -> dict:
+    """The evaluation, session metadata and tenant a report was built from."""
+
+    return json.loads(evaluation_source(record).read_bytes())
+
+
+def _render_stored_evaluation(path: Path) -> bytes:
+    document = json.loads(path.read_bytes())
+    evaluation = DualEvaluationResponse.model_validate(document["evaluation"])
+    html = build_html_report(evaluation, document.get("session_metadata"), tenant=document.get("tenant"))
+    return html.encode("utf-8")
+
+
+def load_report_body(record: ReportRecord, accept_encoding: str | None) -> ReportBody:
+    """Body for a download; lazily stored reports are rendered on a cache miss."""
+
+    if record.path.suffix != ".json":
+        return report_delivery.load_report_body(record, accept_encoding)
+    version = _template_version(_template_tenant(record.tenant), get_settings().report_language)
+    return report_delivery.load_report_body(
+        record, accept_encoding, render=_render_stored_evaluation, render_version=version
+    )
+
+
+def read_report_html(record: ReportRecord) -> bytes:
+    return load_report_body(record, None).content
 
-def persist_report(evaluation: DualEvaluationResponse, session_metadata: Optional[dict] = None) -> tuple[str, str]:
-    report_html = build_html_report(evaluation, session_metadata=session_metadata)
+
+def report_accel_headers(record: ReportRecord) -> Dict[str, str] | None:
+    """Headers letting nginx send the file of ``record``, or ``None`` to serve it here.
+
+    Lazily stored reports exist only as evaluation JSON and are always rendered here.
+    """
+
+    if not accel_redirect_enabled() or record.path.suffix not in (".html", ".pdf"):
+        return None
+    return accel_redirect_headers(REPORTS_LOCATION, REPORTS_DIR, record.path)
+
+
+def persist_report(
+    evaluation: DualEvaluationResponse,
+    session_metadata: Optional[dict] = None,
+    *,
+    tenant: str | None = None,
+    lazy: bool | None = None,
+) -> tuple[str | None, str]:
+    """Store a report and return its HTML and signed download URL.
+
+    In lazy mode (``REPORT_LAZY_RENDER``, or ``lazy=True``) only the compact evaluation
+    JSON is stored, deduplicated by its content hash, and ``None`` is returned for the
+    HTML: it is rendered on the first download instead.
+    """
+
+    if lazy is None:
+        lazy = get_settings().report_lazy_render
     report_id = secrets.token_urlsafe(16)
-    storage_filename = f"{report_id}.html"
-    filepath = REPORTS_DIR / storage_filename
-    filepath.write_text(report_html, encoding="utf-8")
+    payload = _evaluation_payload(evaluation, session_metadata, tenant)
+    if lazy:
+        report_html = None
+        digest = content_digest(payload)
+        filepath = REPORTS_DIR / f"{digest}.json"
+    else:
+        report_html = build_html_report(evaluation, session_metadata=session_metadata, tenant=tenant)
+        filepath = REPORTS_DIR / f"{report_id}.html"
+        report_bytes = report_html.encode("utf-8")
+        filepath.write_bytes(report_bytes)
+        write_variants(filepath, report_bytes)
+        if get_settings().report_keep_evaluation_json:
+            # For exports and PDF re-rendering; removed with the report.
+            filepath.with_suffix(".json").write_bytes(payload)
+        digest = content_digest(report_bytes)
 
     now = _now()
     expires_at = now + timedelta(minutes=_TOKEN_TTL_MINUTES)
@@ -395,10 +650,96 @@ def persist_report(evaluation: DualEvaluationResponse, session_metadata: Optiona
         created_at=now,
         expires_at=expires_at,
         session_id=str(getattr(getattr(evaluation, "session", None), "id", "")),
+        tenant=tenant,
     )
-    _register_report(record, report_id)
+    if lazy:
+        with _report_index().exclusive():
+            _store_evaluation(filepath, payload)
+            _register_report(record, report_id)
+    else:
+        _register_report(record, report_id)
 
-    token = _build_signed_token(report_id, expires_at)
+    token = _build_stateless_token(report_id, record, digest)
     base_url = get_settings().app_base_url.rstrip("/")
     report_url = f"{base_url}/api/reports/{token}"
     return report_html, report_url
+
+
+def _pdf_path(record: ReportRecord) -> Path:
+    # Lazily stored reports are named by content hash, so their PDFs are shared too.
+    return record.path.with_suffix(".pdf")
+
+
+def _pdf_record(record: ReportRecord, path: Path) -> ReportRecord:
+    return ReportRecord(
+        path=path,
+        filename=str(Path(record.filename).with_suffix(".pdf")),
+        created_at=record.created_at,
+        expires_at=record.expires_at,
+        session_id=record.session_id,
+    )
+
+
+def schedule_report_pdf(
+    report_url: str,
+    evaluation: DualEvaluationResponse,
+    session_metadata: Optional[dict] = None,
+    *,
+    tenant: str | None = None,
+) -> str | None:
+    """Queue the PDF of a persisted report and return its signed URL.
+
+    ``None`` when PDF rendering is disabled or its queue is full. The URL reuses the
+    report token, so it carries the same expiry and tamper checks.
+    """
+
+    queue = get_pdf_queue()
+    if not queue.enabled:
+        return None
+    record = resolve_report_token(report_url.rsplit("/", 1)[-1])
+    target = _pdf_path(record)
+    if not target.exists():
+        document = _evaluation_document(evaluation, session_metadata, tenant)
+        if not queue.submit(target.stem, target, _render_pdf_document, document):
+            return None
+    return f"{report_url}/pdf"
+
+
+def resolve_report_pdf(record: ReportRecord) -> ReportRecord | None:
+    """The finished PDF of ``record``, or ``None`` while it is still rendering.
+
+    A report whose PDF is missing (e.g. it was requested on another replica) is
+    queued from its stored evaluation; raises ``ValueError`` when no PDF
+    can be produced.
+    """
+
+    target = _pdf_path(record)
+    if target.exists():
+        return _pdf_record(record, target)
+    queue = get_pdf_queue()
+    if queue.is_pending(target.stem):
+        return None
+    if evaluation_source(record).exists() and queue.enabled:
+        if queue.submit(target.stem, target, _render_pdf_document, load_evaluation_document(record)):
+            return None
+        raise ValueError("PDF rendering queue is full")
+    raise ValueError("PDF not available")
+
+
+def reports_for_export(
+    *,
+    session_ids: Sequence[str] | None = None,
+    tenant: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> List[ReportRecord]:
+    """Newest unexpired report of every matching session whose stored file still exists."""
+
+    records = _report_index().latest_per_session(
+        _now(),
+        session_ids=session_ids,
+        tenant=tenant,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    return [record for record in records if record.path.exists()]
@@ -0,0 +1,72 @@
+"""Lightweight internal records for the evaluation pipeline.
+
+Heuristic scoring, the GPT-5 merge and the crosswalk summary pass these slotted
+dataclasses around instead of pydantic models; the response models are built once,
+by :meth:`StandardResult.to_model` and :meth:`CrosswalkResult.to_model`, when
+``evaluate_transcript`` returns. Records are frozen and treated as immutable, so a
+merged standard shares every untouched criterion, list and error with its heuristic
+base instead of deep-copying it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from ..models import CommonError, CriterionAssessment, CrosswalkSummary, StandardEvaluation
+
+
+@dataclass(frozen=True, slots=True)
+class CriterionResult:
+    score: float
+    comment: str
+
+
+@dataclass(frozen=True, slots=True)
+class StandardResult:
+    standard_id: str
+    label: str
+    overall: float | None = None
+    cefr: str | None = None
+    criteria: Dict[str, CriterionResult] = field(default_factory=dict)
+    criterion_labels: Dict[str, str] = field(default_factory=dict)
+    # ``CommonError`` instances come pre-built from the error rule set and are shared.
+    common_errors: List[CommonError] = field(default_factory=list)
+    recommendations: List[str] = field(default_factory=list)
+    evidence_quotes: List[str] = field(default_factory=list)
+    status: str = "ok"
+    error: str | None = None
+
+    def to_model(self) -> StandardEvaluation:
+        return StandardEvaluation(
+            standard_id=self.standard_id,
+            label=self.label,
+            overall=self.overall,
+            cefr=self.cefr,
+            criteria={
+                criterion_id: CriterionAssessment(score=criterion.score, comment=criterion.comment)
+                for criterion_id, criterion in self.criteria.items()
+            },
+            criterion_labels=self.criterion_labels,
+            common_errors=self.common_errors,
+            recommendations=self.recommendations,
+            evidence_quotes=self.evidence_quotes,
+            status=self.status,
+            error=self.error,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CrosswalkResult:
+    consensus_cefr: str
+    notes: str
+    strengths: List[str]
+    focus: List[str]
+
+    def to_model(self) -> CrosswalkSummary:
+        return CrosswalkSummary(
+            consensus_cefr=self.consensus_cefr,
+            notes=self.notes,
+            strengths=self.strengths,
+            focus=self.focus,
+        )
@@ -0,0 +1,275 @@
+"""Evaluator output schemas compiled once into validator closures.
+
+``evaluator_output_schema`` in a standard config is a small JSON Schema subset:
+``type`` (a name or a list of names), ``required``, ``properties``,
+``additionalProperties``, ``items``, ``minItems``/``maxItems``, ``enum`` and
+``minimum``/``maximum``. :func:`compile_schema` turns it into two validators so
+checking an output only walks the data, never the schema: a boolean fast path
+generated as one Python function for the common case of a valid output, and a tree
+of closures that, only when the fast path fails, reports every violation with its
+path instead of stopping at the first one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple
+
+Path = Tuple[Any, ...]
+Check = Callable[[Any, Path, List["SchemaViolation"], bool], None]
+Predicate = Callable[[Any], bool]
+
+_PY_TYPES: Dict[str, Tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "number": (int, float),
+    "integer": (int,),
+    "boolean": (bool,),
+    "null": (type(None),),
+}
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+
+@dataclass(frozen=True)
+class SchemaViolation:
+    path: Path
+    keyword: str
+    message: str
+
+    def __str__(self) -> str:
+        location = ".".join(str(part) for part in self.path) or "<root>"
+        return f"{location}: {self.message}"
+
+
+class SchemaValidationError(ValueError):
+    def __init__(self, violations: List[SchemaViolation]) -> None:
+        self.violations = violations
+        super().__init__("Evaluator output violates its schema: " + "; ".join(str(v) for v in violations))
+
+
+def _type_names(expected: Any) -> List[str]:
+    names = [expected] if isinstance(expected, str) else list(expected or [])
+    unknown = [name for name in names if name not in _TYPES]
+    if unknown:
+        raise ValueError(f"Unsupported schema type(s): {', '.join(map(str, unknown))}")
+    return names
+
+
+def _compile_type(expected: Any) -> Check | None:
+    names = _type_names(expected)
+    if not names:
+        return None
+    predicates = tuple(_TYPES[name] for name in names)
+    label = " or ".join(names)
+
+    def check(value: Any, path: Path, errors: List[SchemaViolation], partial: bool) -> None:
+        if not any(predicate(value) for predicate in predicates):
+            errors.append(SchemaViolation(path, "type", f"expected {label}, got {type(value).__name__}"))
+
+    return check
+
+
+def _compile(schema: dict) -> Check:
+    type_check = _compile_type(schema.get("type"))
+    required = tuple(schema.get("required", ()))
+    properties = {key: _compile(subschema) for key, subschema in schema.get("properties", {}).items()}
+    additional = schema.get("additionalProperties", True)
+    additional_check = _compile(additional) if isinstance(additional, dict) else None
+    items = _compile(schema["items"]) if isinstance(schema.get("items"), dict) else None
+    min_items = schema.get("minItems")
+    max_items = schema.get("maxItems")
+    enum = tuple(schema["enum"]) if "enum" in schema else None
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+
+    def check(value: Any, path: Path, errors: List[SchemaViolation], partial: bool) -> None:
+        if type_check is not None:
+            before = len(errors)
+            type_check(value, path, errors, partial)
+            if len(errors) > before:
+                return
+        if enum is not None and value not in enum:
+            errors.append(SchemaViolation(path, "enum", f"{value!r} is not one of {list(enum)}"))
+        if isinstance(value, dict):
+            if not partial:
+                for key in required:
+                    if key not in value:
+                        errors.append(SchemaViolation(path + (key,), "required", "missing required field"))
+            for key, item in value.items():
+                sub = properties.get(key, additional_check)
+                if sub is not None:
+                    sub(item, path + (key,), errors, partial)
+                elif additional is False:
+                    errors.append(SchemaViolation(path + (key,), "additionalProperties", "unexpected field"))
+        elif isinstance(value, list):
+            if not partial:
+                if min_items is not None and len(value) < min_items:
+                    errors.append(SchemaViolation(path, "minItems", f"shorter than required minimum {min_items}"))
+                if max_items is not None and len(value) > max_items:
+                    errors.append(SchemaViolation(path, "maxItems", f"longer than allowed maximum {max_items}"))
+            if items is not None:
+                for index, item in enumerate(value):
+                    items(item, path + (index,), errors, partial)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            if minimum is not None and value < minimum:
+                errors.append(SchemaViolation(path, "minimum", f"{value} is below {minimum}"))
+            if maximum is not None and value > maximum:
+                errors.append(SchemaViolation(path, "maximum", f"{value} is above {maximum}"))
+
+    return check
+
+
+class _FastPathWriter:
+    """Generates the source of a single boolean function for one schema.
+
+    Nested properties and items are inlined rather than called, so a valid output is
+    checked without any Python function call per node; constants (required sets,
+    enums) are bound into the function's globals.
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.constants: Dict[str, Any] = {"_MISSING": object()}
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{self._counter}"
+
+    def _constant(self, value: Any) -> str:
+        name = self._name("_c")
+        self.constants[name] = value
+        return name
+
+    def emit(self, schema: dict, var: str, indent: int) -> None:
+        # Every opened block starts with ``pass`` so subschemas that emit nothing stay valid.
+        pad = "    " * indent
+        names = _type_names(schema.get("type"))
+        py_types = tuple(t for name in names for t in _PY_TYPES[name])
+        if py_types:
+            condition = f"not isinstance({var}, {self._constant(py_types)})"
+            # ``bool`` subclasses ``int``; reject it unless the schema allows booleans.
+            if "boolean" not in names and int in py_types:
+                condition += f" or {var}.__class__ is bool"
+            self.lines.append(f"{pad}if {condition}: return False")
+        if "enum" in schema:
+            self.lines.append(f"{pad}if {var} not in {self._constant(tuple(schema['enum']))}: return False")
+
+        properties = schema.get("properties", {})
+        additional = schema.get("additionalProperties", True)
+        if schema.get("required") or properties or additional is not True:
+            self.lines.append(f"{pad}if isinstance({var}, dict):")
+            inner = pad + "    "
+            self.lines.append(f"{inner}pass")
+            if schema.get("required"):
+                required = self._constant(frozenset(schema["required"]))
+                self.lines.append(f"{inner}if not {required} <= {var}.keys(): return False")
+            for key, subschema in properties.items():
+                item = self._name("v")
+                self.lines.append(f"{inner}{item} = {var}.get({key!r}, _MISSING)")
+                self.lines.append(f"{inner}if {item} is not _MISSING:")
+                self.lines.append(f"{inner}    pass")
+                self.emit(subschema, item, indent + 2)
+            if additional is False or isinstance(additional, dict):
+                key_name, item = self._name("k"), self._name("v")
+                known = self._constant(frozenset(properties))
+                self.lines.append(f"{inner}for {key_name}, {item} in {var}.items():")
+                self.lines.append(f"{inner}    if {key_name} in {known}: continue")
+                if additional is False:
+                    self.lines.append(f"{inner}    return False")
+                else:
+                    self.emit(additional, item, indent + 2)
+
+        items = schema.get("items")
+        if isinstance(items, dict) or "minItems" in schema or "maxItems" in schema:
+            self.lines.append(f"{pad}if isinstance({var}, list):")
+            inner = pad + "    "
+            self.lines.append(f"{inner}pass")
+            if "minItems" in schema:
+                self.lines.append(f"{inner}if len({var}) < {int(schema['minItems'])}: return False")
+            if "maxItems" in schema:
+                self.lines.append(f"{inner}if len({var}) > {int(schema['maxItems'])}: return False")
+            if isinstance(items, dict):
+                item = self._name("v")
+                self.lines.append(f"{inner}for {item} in {var}:")
+                self.lines.append(f"{inner}    pass")
+                self.emit(items, item, indent + 2)
+
+        if schema.get("minimum") is not None or schema.get("maximum") is not None:
+            self.lines.append(f"{pad}if isinstance({var}, (int, float)) and {var}.__class__ is not bool:")
+            if schema.get("minimum") is not None:
+                self.lines.append(f"{pad}    if {var} < {self._constant(schema['minimum'])}: return False")
+            if schema.get("maximum") is not None:
+                self.lines.append(f"{pad}    if {var} > {self._constant(schema['maximum'])}: return False")
+
+
+def _compile_fast(schema: dict) -> Predicate:
+    """``True`` when ``value`` has no violation at all (full, non-partial validation)."""
+
+    writer = _FastPathWriter()
+    writer.lines.append("def ok(v0):")
+    writer.emit(schema, "v0", 1)
+    writer.lines.append("    return True")
+    namespace = dict(writer.constants)
+    exec(compile("\n".join(writer.lines), "<evaluator_output_schema>", "exec"), namespace)  # noqa: S102
+    return namespace["ok"]
+
+
+class CompiledSchema:
+    """Reusable validator for one schema; an empty schema accepts everything."""
+
+    def __init__(self, schema: dict | None) -> None:
+        self.schema = schema or {}
+        self._check: Check | None = _compile(self.schema) if self.schema else None
+        self._ok: Predicate | None = _compile_fast(self.schema) if self.schema else None
+
+    def violations(self, value: Any, *, partial: bool = False) -> List[SchemaViolation]:
+        """All violations in ``value``.
+
+        ``partial`` validates a patch such as a GPT-5 standard entry: types, enums and
+        bounds are still checked but missing required fields and list lengths are not,
+        since the merge keeps heuristic values for anything left out and clamps lists.
+        """
+
+        errors: List[SchemaViolation] = []
+        if self._check is not None and (partial or not self._ok(value)):
+            self._check(value, (), errors, partial)
+        return errors
+
+    def is_valid(self, value: Any) -> bool:
+        return self._ok is None or self._ok(value)
+
+    def validate(self, value: Any) -> None:
+        if self._ok is None or self._ok(value):
+            return
+        raise SchemaValidationError(self.violations(value))
+
+
+def compile_schema(schema: dict | None) -> CompiledSchema:
+    return CompiledSchema(schema)
+
+
+def prune(value: Any, violations: List[SchemaViolation]) -> Any:
+    """Copy of ``value`` without the fields and list items that ``violations`` point at."""
+
+    rejected = {violation.path for violation in violations}
+    if () in rejected:
+        return None
+
+    def walk(node: Any, path: Path) -> Any:
+        if isinstance(node, dict):
+            return {key: walk(item, path + (key,)) for key, item in node.items() if path + (key,) not in rejected}
+        if isinstance(node, list):
+            return [walk(item, path + (index,)) for index, item in enumerate(node) if path + (index,) not in rejected]
+        return node
+
+    return walk(value, ())
@@ -0,0 +1,247 @@
+"""Config-driven registry of heuristic standard scorers.
+
+Every ``configs/<standard>/<version>.json`` with a rubric is compiled once into a
+:class:`StandardScorer` holding its criterion weights, heuristic feature
+coefficients, overall scale, rounding, a sorted CEFR table searched with
+``bisect`` and its compiled evaluator output schema. Adding a standard therefore
+only takes a config file.
+"""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from .schema import CompiledSchema, compile_schema
+
+CONFIG_ROOT = Path(__file__).resolve().parents[3] / "configs"
+DEFAULT_VERSION = "v1"
+
+FEATURES: Tuple[str, ...] = (
+    "total_words",
+    "unique_words",
+    "avg_sentence_length",
+    "advanced_word_share",
+    "topic_relevance",
+    "words_per_sentence",
+    "connector_density",
+)
+DEFAULT_NORMALIZERS = {
+    "total_words": 150.0,
+    "unique_words": 100.0,
+    "avg_sentence_length": 22.0,
+    "advanced_word_share": 0.15,
+    "topic_relevance": 0.25,
+    "words_per_sentence": 16.0,
+    "connector_density": 4.0,
+}
+DEFAULT_COEFFICIENTS = {"total_words": 0.5, "unique_words": 0.25, "avg_sentence_length": 0.25}
+DEFAULT_COMMENT = "Score recorded; see the overall summary for guidance."
+
+
+class ConfigNotFoundError(RuntimeError):
+    pass
+
+
+def load_standard_config(standard_id: str, version: str = DEFAULT_VERSION) -> dict:
+    config_path = CONFIG_ROOT / standard_id / f"{version}.json"
+    if not config_path.exists():
+        raise ConfigNotFoundError(f"Config for standard '{standard_id}' not found at {config_path}")
+    return json.loads(config_path.read_text(encoding="utf-8"))
+
+
+@dataclass(frozen=True)
+class CEFRTable:
+    """CEFR bands sorted by lower bound; a score outside every band is ``Undetermined``."""
+
+    mins: Tuple[float, ...]
+    maxs: Tuple[float, ...]
+    labels: Tuple[str, ...]
+
+    @staticmethod
+    def from_mapping(mapping: Sequence[dict]) -> "CEFRTable":
+        bands = sorted(mapping, key=lambda band: band.get("min", float("-inf")))
+        return CEFRTable(
+            mins=tuple(float(band.get("min", float("-inf"))) for band in bands),
+            maxs=tuple(float(band.get("max", float("inf"))) for band in bands),
+            labels=tuple(band.get("cefr", "Undetermined") for band in bands),
+        )
+
+    def lookup(self, score: float) -> str:
+        index = bisect_right(self.mins, score) - 1
+        if index >= 0 and score <= self.maxs[index]:
+            return self.labels[index]
+        return "Undetermined"
+
+
+@dataclass(frozen=True)
+class StandardScorer:
+    standard_id: str
+    label: str
+    short_label: str
+    order: int
+    config: dict
+    criteria_ids: Tuple[str, ...]
+    criterion_labels: Dict[str, str]
+    weights: Tuple[float, ...]
+    normalizers: Tuple[float, ...]
+    coefficients: Tuple[Tuple[float, ...], ...]  # one row per criterion, one column per feature
+    heuristic_min: float
+    heuristic_span: float
+    step: float | None
+    scale_min: float | None
+    scale_max: float | None
+    round_to: int
+    cefr_table: CEFRTable
+    comments: Tuple[Tuple[float, str], ...]  # (lower bound, text), highest bound first
+    fallback_comment: str
+    overall_caption: str
+    output_schema: CompiledSchema
+
+    def features(self, metrics: object) -> Tuple[float, ...]:
+        return tuple(
+            min(1.0, getattr(metrics, feature, 0.0) / normalizer)
+            for feature, normalizer in zip(FEATURES, self.normalizers)
+        )
+
+    def score_criteria(self, metrics: object) -> List[float]:
+        """Heuristic criterion scores (unrounded), in ``criteria_ids`` order."""
+
+        features = self.features(metrics)
+        low = self.scale_min if self.scale_min is not None else float("-inf")
+        high = self.scale_max if self.scale_max is not None else float("inf")
+        scores: List[float] = []
+        for row in self.coefficients:
+            normalized = 0.0
+            for coefficient, feature in zip(row, features):
+                normalized += coefficient * feature
+            score = self.heuristic_min + normalized * self.heuristic_span
+            if self.step:
+                score = round(score / self.step) * self.step
+            scores.append(max(low, min(high, score)))
+        return scores
+
+    def overall(self, criterion_scores: Sequence[float]) -> float:
+        overall = 0.0
+        for weight, score in zip(self.weights, criterion_scores):
+            overall += weight * score
+        overall = round(overall, self.round_to)
+        if self.scale_min is not None:
+            overall = max(self.scale_min, overall)
+        if self.scale_max is not None:
+            overall = min(self.scale_max, overall)
+        return overall
+
+    def cefr(self, overall: float) -> str:
+        return self.cefr_table.lookup(overall)
+
+    def comment(self, score: float) -> str:
+        for bound, text in self.comments:
+            if score >= bound:
+                return text
+        return self.fallback_comment
+
+    def format_score(self, value: float) -> str:
+        return f"{value:.{self.round_to}f}"
+
+    def format_overall(self, value: float) -> str:
+        """Overall score caption used on report cards, e.g. ``2.75 / 4`` or ``Band 6.5``."""
+
+        return self.overall_caption.format(overall=self.format_score(value), max=_format_bound(self.scale_max))
+
+    def format_badge(self, value: float, cefr: str | None) -> str:
+        return f"{self.short_label} {self.format_score(value)}/{_format_bound(self.scale_max)} (~{cefr})"
+
+
+def _format_bound(value: float | None) -> str:
+    return "—" if value is None else f"{value:g}"
+
+
+def _number(value: object) -> float | None:
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def compile_scorer(config: dict) -> StandardScorer:
+    """Compile a standard config into a scorer; raises ``KeyError``/``ValueError`` on invalid configs."""
+
+    meta = config["meta"]
+    rubric = config["rubric"]
+    weights: Dict[str, float] = rubric["weights"]
+    if not weights:
+        raise ValueError(f"Config '{meta['id']}' defines no rubric weights")
+    labels = {item["id"]: item.get("label", item["id"].title()) for item in rubric.get("criteria", [])}
+    scoring = config.get("scoring", {})
+    scale = scoring.get("overall_scale", {})
+    scale_min = _number(scale.get("min"))
+    scale_max = _number(scale.get("max"))
+
+    heuristic = scoring.get("heuristic", {})
+    normalizers = {**DEFAULT_NORMALIZERS, **heuristic.get("normalizers", {})}
+    heuristic_range = heuristic.get("range", {})
+    heuristic_min = _number(heuristic_range.get("min"))
+    heuristic_max = _number(heuristic_range.get("max"))
+    heuristic_min = heuristic_min if heuristic_min is not None else (scale_min or 0.0)
+    heuristic_max = heuristic_max if heuristic_max is not None else (scale_max if scale_max is not None else 1.0)
+    criteria_coefficients = heuristic.get("criteria", {})
+
+    comments = scoring.get("criterion_comments", [])
+    bounded = sorted(
+        ((float(item["min"]), item["text"]) for item in comments if _number(item.get("min")) is not None),
+        key=lambda entry: entry[0],
+        reverse=True,
+    )
+    fallback = next((item["text"] for item in comments if item.get("min") is None), DEFAULT_COMMENT)
+
+    return StandardScorer(
+        standard_id=meta["id"],
+        label=meta["label"],
+        short_label=meta.get("short_label", meta["id"].upper()),
+        order=int(meta.get("order", 100)),
+        config=config,
+        criteria_ids=tuple(weights),
+        criterion_labels={cid: labels.get(cid, cid.title()) for cid in weights},
+        weights=tuple(float(weights[cid]) for cid in weights),
+        normalizers=tuple(float(normalizers[feature]) for feature in FEATURES),
+        coefficients=tuple(
+            tuple(float(criteria_coefficients.get(cid, DEFAULT_COEFFICIENTS).get(feature, 0.0)) for feature in FEATURES)
+            for cid in weights
+        ),
+        heuristic_min=heuristic_min,
+        heuristic_span=heuristic_max - heuristic_min,
+        step=_number(heuristic.get("step")),
+        scale_min=scale_min,
+        scale_max=scale_max,
+        round_to=int(scoring.get("round_to", 1)),
+        cefr_table=CEFRTable.from_mapping(config.get("mapping", {}).get("to_cefr", [])),
+        comments=tuple(bounded),
+        fallback_comment=fallback,
+        overall_caption=config.get("report", {}).get("overall_caption", "{overall} / {max}"),
+        output_schema=compile_schema(config.get("evaluator_output_schema")),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_scorer(standard_id: str, version: str = DEFAULT_VERSION) -> StandardScorer:
+    return compile_scorer(load_standard_config(standard_id, version))
+
+
+def discover_standards(root: Path | None = None, version: str = DEFAULT_VERSION) -> Tuple[str, ...]:
+    """Standards with a rubric config under ``root``, ordered by ``meta.order`` then id."""
+
+    found: List[Tuple[int, str]] = []
+    for path in sorted((root or CONFIG_ROOT).glob(f"*/{version}.json")):
+        try:
+            config = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        if isinstance(config, dict) and isinstance(config.get("rubric"), dict) and config["rubric"].get("weights"):
+            found.append((int(config.get("meta", {}).get("order", 100)), path.parent.name))
+    return tuple(standard_id for _, standard_id in sorted(found))
+
+
+def clear_scorer_cache() -> None:
+    get_scorer.cache_clear()
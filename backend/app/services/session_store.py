@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from ..models import ChatMessage, InteractionMode
+from .live_evaluation import LiveEvaluationState
 
 
 class SessionData:
@@ -32,6 +33,7 @@ class SessionData:
         self.consent_granted_at = consent_granted_at or (datetime.utcnow() if consent_granted else None)
         self.audio_recording_path: Path | None = None
         self.audio_recorded_at: Optional[datetime] = None
+        self.live = LiveEvaluationState(self.session_id)
 
     @property
     def duration_seconds(self) -> int:
@@ -39,10 +41,11 @@ class SessionData:
 
     @property
     def word_count(self) -> int:
-        return sum(len(m.content.split()) for m in self.messages if m.role == "user")
+        return self.live.total_words
 
     def add_message(self, message: ChatMessage) -> None:
         self.messages.append(message)
+        self.live.add(message)
 
 
 class InMemorySessionStore:
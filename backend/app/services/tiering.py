@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Iterable
+
+TIER_HEURISTIC = "tier0"
+TIER_LIGHT = "tier1"
+TIER_FULL = "tier2"
+TIERS = (TIER_HEURISTIC, TIER_LIGHT, TIER_FULL)
+
+_LATENCY_WINDOW = 512
+
+
+@dataclass(frozen=True)
+class TierAssessment:
+    """Confidence signal produced by one evaluation tier."""
+
+    confidence: float
+    cefr_spread: float
+
+    def is_acceptable(self, min_confidence: float, max_spread: float) -> bool:
+        return self.confidence >= min_confidence and self.cefr_spread <= max_spread
+
+
+def heuristic_confidence(total_words: int, turns: int) -> float:
+    """Estimate how far heuristic scores can be trusted from the amount of evidence."""
+
+    words_factor = min(1.0, total_words / 250)
+    turns_factor = min(1.0, turns / 5)
+    return round(0.6 * words_factor + 0.4 * turns_factor, 3)
+
+
+def cefr_spread(ranks: Iterable[float | None]) -> float:
+    values = [rank for rank in ranks if rank is not None]
+    if len(values) < 2:
+        return 0.0
+    return max(values) - min(values)
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class TierStats:
+    """Thread-safe counters describing how often each tier runs and decides evaluations."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset_unlocked()
+
+    def _reset_unlocked(self) -> None:
+        self._runs: Counter[str] = Counter()
+        self._failures: Counter[str] = Counter()
+        self._decisions: Counter[str] = Counter()
+        self._escalations: Counter[str] = Counter()
+        self._latencies: Dict[str, Deque[float]] = {tier: deque(maxlen=_LATENCY_WINDOW) for tier in TIERS}
+
+    def record_run(self, tier: str, latency_seconds: float, *, failed: bool = False) -> None:
+        with self._lock:
+            self._runs[tier] += 1
+            if failed:
+                self._failures[tier] += 1
+            self._latencies[tier].append(latency_seconds)
+
+    def record_escalation(self, reason: str) -> None:
+        with self._lock:
+            self._escalations[reason] += 1
+
+    def record_decision(self, tier: str) -> None:
+        with self._lock:
+            self._decisions[tier] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            total = sum(self._decisions.values())
+            tiers = {}
+            for tier in TIERS:
+                latencies = list(self._latencies[tier])
+                tiers[tier] = {
+                    "runs": self._runs[tier],
+                    "failures": self._failures[tier],
+                    "decisions": self._decisions[tier],
+                    "decision_share": round(self._decisions[tier] / total, 4) if total else 0.0,
+                    "latency_ms": {
+                        "p50": round(_percentile(latencies, 0.5) * 1000, 2),
+                        "p95": round(_percentile(latencies, 0.95) * 1000, 2),
+                        "max": round(max(latencies) * 1000, 2) if latencies else 0.0,
+                    },
+                }
+            return {
+                "evaluations": total,
+                "tiers": tiers,
+                "escalations": dict(self._escalations),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._reset_unlocked()
+
+
+TIER_STATS = TierStats()
+
+
+def get_tier_stats() -> dict:
+    return TIER_STATS.snapshot()
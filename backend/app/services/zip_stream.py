@@ -0,0 +1,200 @@
+"""Streaming ZIP archives with byte-range support.
+
+Entries are STORED, not deflated: reports are small, MP3s do not compress, and, above
+all, every entry size and CRC is then known before the first byte is sent. The
+archive length and every offset in it are fixed up front, so
+:meth:`ZipArchive.iter_bytes` can start anywhere — which is what makes resumable
+``Range`` downloads possible — while holding at most one generated entry or one file
+chunk in memory. Nothing is written to disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import struct
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Hashable, Iterator, List, Sequence, Tuple
+
+CHUNK_SIZE = 64 * 1024
+_MAX_ZIP32 = 0xFFFFFFFF
+_MAX_ZIP32_ENTRIES = 0xFFFF
+_UTF8_NAMES = 0x0800
+_VERSION = 20  # 2.0: the lowest version that knows folders
+_MADE_BY = (3 << 8) | _VERSION  # Unix host, so the external attributes are file permissions
+
+
+@dataclass(frozen=True, slots=True)
+class ZipEntry:
+    name: str
+    size: int
+    crc: int
+    modified: datetime
+    chunks: Callable[[int], Iterator[bytes]]  # content from the given offset on
+
+
+def _file_chunks(path: Path, skip: int = 0) -> Iterator[bytes]:
+    with path.open("rb") as handle:
+        handle.seek(skip)
+        while chunk := handle.read(CHUNK_SIZE):
+            yield chunk
+
+
+@lru_cache(maxsize=4096)
+def _file_crc(path: Path, size: int, mtime_ns: int) -> int:
+    # Keyed by size and mtime, so resumed downloads do not re-read unchanged files.
+    crc = 0
+    for chunk in _file_chunks(path):
+        crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def file_entry(name: str, path: Path) -> ZipEntry:
+    stat = path.stat()
+    return ZipEntry(
+        name=name,
+        size=stat.st_size,
+        crc=_file_crc(path, stat.st_size, stat.st_mtime_ns),
+        modified=datetime.utcfromtimestamp(stat.st_mtime),
+        chunks=lambda skip: _file_chunks(path, skip),
+    )
+
+
+class _SizeCache:
+    """Bounded LRU of (size, crc) for generated entries, keyed by their content identity."""
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[int, int]]" = OrderedDict()
+
+    def get(self, key: Hashable, produce: Callable[[], bytes]) -> Tuple[int, int]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+        data = produce()
+        cached = (len(data), zlib.crc32(data))
+        with self._lock:
+            self._entries[key] = cached
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return cached
+
+
+_GENERATED_SIZES = _SizeCache()
+
+
+def generated_entry(
+    name: str,
+    produce: Callable[[], bytes],
+    modified: datetime,
+    key: Hashable | None = None,
+) -> ZipEntry:
+    """An entry whose bytes are produced on demand, once to size it and again to send it.
+
+    ``produce`` must be deterministic. A ``key`` that fully identifies its output (e.g.
+    source path and mtime) lets resumed downloads skip the sizing pass.
+    """
+
+    if key is None:
+        data = produce()
+        size, crc = len(data), zlib.crc32(data)
+    else:
+        size, crc = _GENERATED_SIZES.get(key, produce)
+    return ZipEntry(name=name, size=size, crc=crc, modified=modified, chunks=lambda skip: iter((produce()[skip:],)))
+
+
+def _dos_timestamp(value: datetime) -> Tuple[int, int]:
+    value = max(value, datetime(1980, 1, 1))
+    date = ((value.year - 1980) << 9) | (value.month << 5) | value.day
+    time = (value.hour << 11) | (value.minute << 5) | (value.second // 2)
+    return time, date
+
+
+class ZipArchive:
+    def __init__(self, entries: Sequence[ZipEntry]) -> None:
+        if len(entries) > _MAX_ZIP32_ENTRIES:
+            raise ValueError("Too many files for one archive")
+        self.entries = list(entries)
+        # (offset, header bytes, entry whose data follows the header)
+        self._segments: List[Tuple[int, bytes, ZipEntry | None]] = []
+        central: List[bytes] = []
+        offset = 0
+        for entry in self.entries:
+            name = entry.name.encode("utf-8")
+            time, date = _dos_timestamp(entry.modified)
+            local = struct.pack(
+                "<IHHHHHIIIHH", 0x04034B50, _VERSION, _UTF8_NAMES, 0, time, date,
+                entry.crc, entry.size, entry.size, len(name), 0,
+            ) + name
+            central.append(
+                struct.pack(
+                    "<IHHHHHHIIIHHHHHII", 0x02014B50, _MADE_BY, _VERSION, _UTF8_NAMES, 0, time, date,
+                    entry.crc, entry.size, entry.size, len(name), 0, 0, 0, 0, 0o100644 << 16, offset,
+                ) + name
+            )
+            self._segments.append((offset, local, entry))
+            offset += len(local) + entry.size
+        directory = b"".join(central)
+        end = struct.pack(
+            "<IHHHHIIH", 0x06054B50, 0, 0, len(self.entries), len(self.entries), len(directory), offset, 0
+        )
+        if offset + len(directory) > _MAX_ZIP32:
+            raise ValueError("Archive exceeds the 4 GiB ZIP limit")
+        self._segments.append((offset, directory + end, None))
+        self.size = offset + len(directory) + len(end)
+        # The central directory names every entry with its size and CRC: a content hash.
+        self.etag = f'"{hashlib.sha256(directory).hexdigest()[:32]}"'
+
+    def iter_bytes(self, start: int = 0, end: int | None = None) -> Iterator[bytes]:
+        """Archive bytes ``start``..``end`` inclusive (default: to the end)."""
+
+        stop = self.size if end is None else end + 1
+        for offset, header, entry in self._segments:
+            segment_end = offset + len(header) + (entry.size if entry else 0)
+            if segment_end <= start:
+                continue
+            if offset >= stop:
+                return
+            position = offset
+            if start < position + len(header):
+                yield header[max(0, start - position) : stop - position]
+            position += len(header)
+            if entry is None or position >= stop:
+                continue
+            skip = max(0, start - position)
+            remaining = min(entry.size, stop - position) - skip
+            for chunk in entry.chunks(skip):
+                if remaining <= 0:
+                    break
+                yield chunk[:remaining]
+                remaining -= len(chunk[:remaining])
+
+
+def parse_range(header: str | None, size: int) -> Tuple[int, int] | None:
+    """The single byte range requested by ``header``, or ``None`` to send everything.
+
+    Raises ``ValueError`` for a range outside the archive (a 416 response).
+    """
+
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            start, end = max(0, size - int(last)), size - 1
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        raise ValueError("Requested range not satisfiable")
+    return start, min(end, size - 1)
@@ -0,0 +1 @@
+"""Performance tooling: load tests, microbenchmarks and regression harnesses."""
@@ -0,0 +1,98 @@
+"""Time and peak allocation per evaluation, with and without the heuristic stage.
+
+``evaluate_transcript`` runs against the local stub provider. ``full`` includes the
+heuristic stage; ``merge`` reuses a precomputed stage and so isolates the GPT-5
+merge, crosswalk and response-model construction. Peak memory is taken with
+``tracemalloc`` over a single evaluation. The JSON output has the ``hotpaths``
+layout, so two runs can be compared with ``python -m benchmarks.compare``::
+
+    python -m benchmarks.allocations --output /tmp/head.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Sequence
+from unittest.mock import patch
+
+from backend.app.models import TranscriptMetadata
+from backend.app.services import evaluation
+from backend.app.services.llm_stub import StubProvider
+
+from .hotpaths import RESULTS_DIR, current_commit, measure
+from .synthetic import SIZES, synthetic_transcript
+
+
+def peak_kib(func: Callable[[], object]) -> float:
+    func()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round((peak - baseline) / 1024, 1)
+
+
+def run_suite(sizes: Sequence[str] = tuple(SIZES), *, repeat: int = 5, min_time: float = 0.05) -> dict:
+    results: dict = {}
+    with patch.object(evaluation, "get_gpt5_client", return_value=StubProvider()):
+        for size in sizes:
+            transcript = synthetic_transcript(SIZES[size])
+            metadata = TranscriptMetadata()
+            stage = evaluation.run_heuristic_stage(transcript)
+            cases = {
+                "evaluation.full": lambda t=transcript: evaluation.evaluate_transcript(t, "bench", metadata),
+                "evaluation.merge": lambda t=transcript, s=stage: evaluation.evaluate_transcript(
+                    t, "bench", metadata, heuristics=s
+                ),
+            }
+            for name, func in cases.items():
+                results[f"{name}[{size}]"] = {
+                    "name": name,
+                    "size": size,
+                    "peak_kib": peak_kib(func),
+                    **measure(func, repeat=repeat, min_time=min_time),
+                }
+    return {
+        "commit": current_commit(),
+        "created_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure time and peak allocations per evaluation.")
+    parser.add_argument("--sizes", default=",".join(SIZES), help=f"Comma-separated subset of {', '.join(SIZES)}")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per timed repeat")
+    parser.add_argument("--output", help="Result path (default: benchmarks/results/<commit>-allocations.json)")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"Unknown sizes: {', '.join(unknown)}")
+
+    report = run_suite(sizes, repeat=args.repeat, min_time=args.min_time)
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{report['commit']}-allocations.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    for key, stats in report["benchmarks"].items():
+        print(f"{key:<32}{stats['median_us']:>12.1f} µs  peak {stats['peak_kib']:>8.1f} KiB")
+    print(f"\nSaved {len(report['benchmarks'])} results to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
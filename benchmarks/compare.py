@@ -0,0 +1,114 @@
+"""Compare two microbenchmark result files and flag regressions.
+
+Arguments are result files or git revisions whose results live in
+``benchmarks/results/<commit>.json``::
+
+    python -m benchmarks.compare main HEAD
+    python -m benchmarks.compare /tmp/base.json /tmp/head.json --threshold 0.10
+
+Exits with status 1 when any benchmark's median slowed down by more than the
+threshold (relative) and more than ``--min-delta-us`` (absolute).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+from .hotpaths import RESULTS_DIR
+
+
+def resolve_results(reference: str) -> Path:
+    path = Path(reference)
+    if path.exists():
+        return path
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short=12", reference],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=RESULTS_DIR.parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError) as exc:
+        raise FileNotFoundError(f"'{reference}' is neither a results file nor a git revision") from exc
+    candidate = RESULTS_DIR / f"{commit}.json"
+    if not candidate.exists():
+        raise FileNotFoundError(
+            f"No results for {reference} ({commit}); check it out and run 'python -m benchmarks.hotpaths'"
+        )
+    return candidate
+
+
+def compare(base: dict, head: dict, *, threshold: float = 0.15, min_delta_us: float = 1.0) -> List[dict]:
+    rows: List[dict] = []
+    for key in sorted(set(base["benchmarks"]) | set(head["benchmarks"])):
+        before = base["benchmarks"].get(key)
+        after = head["benchmarks"].get(key)
+        if before is None or after is None:
+            rows.append({"benchmark": key, "status": "added" if before is None else "removed"})
+            continue
+        base_us = before["median_us"]
+        head_us = after["median_us"]
+        change = (head_us - base_us) / base_us if base_us else 0.0
+        if change > threshold and head_us - base_us > min_delta_us:
+            status = "REGRESSION"
+        elif change < -threshold and base_us - head_us > min_delta_us:
+            status = "improved"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "benchmark": key,
+                "base_us": base_us,
+                "head_us": head_us,
+                "change": round(change, 4),
+                "status": status,
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark runs and flag regressions.")
+    parser.add_argument("base", help="Baseline results file or git revision")
+    parser.add_argument("head", help="Candidate results file or git revision")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Relative slowdown that counts as a regression")
+    parser.add_argument("--min-delta-us", type=float, default=1.0, help="Ignore absolute changes below this")
+    parser.add_argument("--json", action="store_true", help="Print the comparison as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        base = json.loads(resolve_results(args.base).read_text(encoding="utf-8"))
+        head = json.loads(resolve_results(args.head).read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    rows = compare(base, head, threshold=args.threshold, min_delta_us=args.min_delta_us)
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print(f"{'benchmark':<50}{'base µs':>12}{'head µs':>12}{'change':>10}  status")
+        for row in rows:
+            if "change" not in row:
+                print(f"{row['benchmark']:<50}{'':>12}{'':>12}{'':>10}  {row['status']}")
+                continue
+            print(
+                f"{row['benchmark']:<50}{row['base_us']:>12.1f}{row['head_us']:>12.1f}"
+                f"{row['change']:>+10.1%}  {row['status']}"
+            )
+
+    regressions = [row for row in rows if row["status"] == "REGRESSION"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""Golden-transcript regression and latency harness for ``evaluate_transcript``.
+
+Every transcript in ``tests/golden/transcripts`` is evaluated in two modes: merged
+with the local stub LLM (``stub``) and heuristics only, with the LLM failing
+(``heuristic``). Scores per standard and criterion, CEFR labels and evaluation wall
+time are compared against ``tests/golden/expected`` within the tolerances of
+``tests/golden/tolerances.json``::
+
+    python -m benchmarks.golden            # check, exit 1 on drift or slowdown
+    python -m benchmarks.golden --update   # re-record goldens after an intended change
+
+Recorded times are machine-specific, so the pytest suite checks scores only
+(``check_latency=False``); the latency budget is enforced from the command line.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List
+from unittest.mock import patch
+
+from backend.app.models import ChatMessage, DualEvaluationResponse, TranscriptMetadata
+from backend.app.services import evaluation
+from backend.app.services.llm_stub import StubProvider
+
+from ._stats import percentile
+
+GOLDEN_ROOT = Path(__file__).resolve().parents[1] / "tests" / "golden"
+MODES = {
+    "stub": lambda: StubProvider("golden"),
+    "heuristic": lambda: StubProvider("golden-failing", error_rate=1.0),
+}
+
+
+@dataclass
+class GoldenCase:
+    case_id: str
+    transcript: List[ChatMessage]
+    metadata: TranscriptMetadata
+
+
+def load_corpus(root: Path = GOLDEN_ROOT) -> Iterator[GoldenCase]:
+    for path in sorted((root / "transcripts").glob("*.json")):
+        document = json.loads(path.read_text(encoding="utf-8"))
+        yield GoldenCase(
+            case_id=document["id"],
+            transcript=[ChatMessage(**message) for message in document["transcript"]],
+            metadata=TranscriptMetadata(**document.get("metadata", {})),
+        )
+
+
+def snapshot(result: DualEvaluationResponse) -> dict:
+    """Reduce an evaluation to the fields tracked by the goldens."""
+
+    return {
+        "consensus_cefr": result.crosswalk.consensus_cefr,
+        "standards": {
+            standard.standard_id: {
+                "status": standard.status,
+                "overall": standard.overall,
+                "cefr": standard.cefr,
+                "criteria": {cid: criterion.score for cid, criterion in standard.criteria.items()},
+            }
+            for standard in result.standards
+        },
+    }
+
+
+def evaluate_case(case: GoldenCase, mode: str, repeat: int) -> tuple[dict, float]:
+    timings: List[float] = []
+    result: DualEvaluationResponse | None = None
+    with patch.object(evaluation, "get_gpt5_client", return_value=MODES[mode]()):
+        for _ in range(max(1, repeat)):
+            started = time.perf_counter()
+            result = evaluation.evaluate_transcript(case.transcript, session_id=case.case_id, metadata=case.metadata)
+            timings.append(time.perf_counter() - started)
+    assert result is not None
+    return snapshot(result), percentile(timings, 0.5) * 1000
+
+
+def _score_tolerance(tolerances: dict, standard_id: str) -> float:
+    return float(tolerances.get("score", {}).get(standard_id, tolerances.get("score", {}).get("default", 0.0)))
+
+
+def compare_snapshot(case_id: str, mode: str, expected: dict, actual: dict, tolerances: dict) -> List[str]:
+    failures: List[str] = []
+    prefix = f"{case_id}[{mode}]"
+    if expected["consensus_cefr"] != actual["consensus_cefr"]:
+        failures.append(f"{prefix} consensus CEFR {expected['consensus_cefr']} -> {actual['consensus_cefr']}")
+
+    for standard_id, golden in expected["standards"].items():
+        current = actual["standards"].get(standard_id)
+        if current is None:
+            failures.append(f"{prefix} {standard_id} missing from evaluation")
+            continue
+        tolerance = _score_tolerance(tolerances, standard_id)
+        if golden["status"] != current["status"]:
+            failures.append(f"{prefix} {standard_id} status {golden['status']} -> {current['status']}")
+        if golden["cefr"] != current["cefr"]:
+            failures.append(f"{prefix} {standard_id} CEFR {golden['cefr']} -> {current['cefr']}")
+        pairs = [("overall", golden["overall"], current["overall"])]
+        pairs += [(cid, score, current["criteria"].get(cid)) for cid, score in golden["criteria"].items()]
+        for name, before, after in pairs:
+            if before is None and after is None:
+                continue
+            if before is None or after is None or abs(after - before) > tolerance:
+                failures.append(f"{prefix} {standard_id}.{name} {before} -> {after} (tolerance {tolerance})")
+
+    for standard_id in actual["standards"]:
+        if standard_id not in expected["standards"]:
+            failures.append(f"{prefix} {standard_id} not present in goldens")
+    return failures
+
+
+def run_harness(
+    root: Path = GOLDEN_ROOT,
+    *,
+    update: bool = False,
+    repeat: int = 5,
+    check_latency: bool = True,
+) -> dict:
+    tolerances = json.loads((root / "tolerances.json").read_text(encoding="utf-8"))
+    expected_dir = root / "expected"
+    expected_dir.mkdir(parents=True, exist_ok=True)
+    latency_factor = float(tolerances.get("latency_factor", 3.0))
+    latency_floor_ms = float(tolerances.get("latency_floor_ms", 5.0))
+
+    failures: List[str] = []
+    timings: Dict[str, Dict[str, float]] = {}
+    for case in load_corpus(root):
+        golden_path = expected_dir / f"{case.case_id}.json"
+        results = {mode: evaluate_case(case, mode, repeat) for mode in MODES}
+        timings[case.case_id] = {mode: round(elapsed, 3) for mode, (_, elapsed) in results.items()}
+
+        if update or not golden_path.exists():
+            golden = {
+                "id": case.case_id,
+                "modes": {mode: snap for mode, (snap, _) in results.items()},
+                "eval_ms": timings[case.case_id],
+            }
+            golden_path.write_text(json.dumps(golden, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+            if not update:
+                failures.append(f"{case.case_id} had no golden; recorded a new one")
+            continue
+
+        golden = json.loads(golden_path.read_text(encoding="utf-8"))
+        for mode, (snap, elapsed_ms) in results.items():
+            failures.extend(compare_snapshot(case.case_id, mode, golden["modes"][mode], snap, tolerances))
+            if not check_latency:
+                continue
+            budget_ms = golden["eval_ms"][mode] * latency_factor + latency_floor_ms
+            if elapsed_ms > budget_ms:
+                failures.append(
+                    f"{case.case_id}[{mode}] evaluation took {elapsed_ms:.2f} ms, budget {budget_ms:.2f} ms "
+                    f"(golden {golden['eval_ms'][mode]:.2f} ms)"
+                )
+
+    return {"failures": failures, "eval_ms": timings}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check evaluator scores and latency against golden transcripts.")
+    parser.add_argument("--update", action="store_true", help="Re-record goldens from the current code")
+    parser.add_argument("--repeat", type=int, default=5, help="Evaluations per transcript; the median is timed")
+    args = parser.parse_args(argv)
+
+    report = run_harness(update=args.update, repeat=args.repeat)
+    for case_id, modes in report["eval_ms"].items():
+        rendered = ", ".join(f"{mode} {elapsed:.2f} ms" for mode, elapsed in modes.items())
+        print(f"{case_id:<24}{rendered}")
+    if report["failures"]:
+        print("\n" + "\n".join(report["failures"]), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""Microbenchmarks for the evaluation, conversation and reporting hot paths.
+
+Results are written as JSON (default ``benchmarks/results/<commit>.json``) so two
+runs can be compared with ``python -m benchmarks.compare``::
+
+    python -m benchmarks.hotpaths
+    python -m benchmarks.hotpaths --sizes small,medium --filter evaluation. --output /tmp/head.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, List, Sequence
+from unittest.mock import patch
+
+from backend.app.models import TranscriptMetadata
+from backend.app.services import conversation, evaluation, reporting
+from backend.app.services.llm_stub import StubProvider
+from backend.app.services.scoring import get_scorer
+from backend.app.services.session_store import SessionData
+
+from ._stats import percentile
+from .synthetic import SIZES, gpt_entry, synthetic_transcript
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+@dataclass
+class Case:
+    name: str
+    size: str
+    func: Callable[[], object]
+
+
+def _legacy_validate_output(output: dict, schema: dict) -> None:
+    """The recursive schema walker that predates ``services.schema``, kept as a baseline."""
+
+    if schema.get("type") != "object":
+        return
+    for key in schema.get("required", []):
+        if key not in output:
+            raise ValueError(f"Missing required field '{key}' in evaluator output")
+    for key, subschema in schema.get("properties", {}).items():
+        if key not in output:
+            continue
+        value = output[key]
+        expected_type = subschema.get("type")
+        if expected_type == "object" and isinstance(value, dict):
+            _legacy_validate_output(value, subschema)
+        elif expected_type == "array" and isinstance(value, list):
+            min_items = subschema.get("minItems")
+            max_items = subschema.get("maxItems")
+            if min_items is not None and len(value) < min_items:
+                raise ValueError(f"Array '{key}' shorter than required minimum {min_items}")
+            if max_items is not None and len(value) > max_items:
+                raise ValueError(f"Array '{key}' longer than allowed maximum {max_items}")
+
+
+def _evaluator_output(standard) -> dict:
+    return {
+        "criteria": {cid: {"score": c.score, "comment": c.comment} for cid, c in standard.criteria.items()},
+        "overall": standard.overall,
+        "cefr": standard.cefr,
+        "common_errors": [error.model_dump() for error in standard.common_errors],
+        "recommendations": list(standard.recommendations),
+        "evidence_quotes": list(standard.evidence_quotes),
+    }
+
+
+def _evaluation_fixture(turns: int):
+    transcript = synthetic_transcript(turns)
+    metrics = evaluation._compute_metrics(transcript)
+    base_results, _ = evaluation._heuristic_results(metrics)
+    standards = list(base_results.values())
+    with patch.object(evaluation, "get_gpt5_client", return_value=StubProvider()):
+        response = evaluation.evaluate_transcript(transcript, session_id=f"bench-{turns}", metadata=TranscriptMetadata())
+    return transcript, metrics, standards, response
+
+
+def iter_cases(sizes: Sequence[str]) -> Iterator[Case]:
+    for size in sizes:
+        turns = SIZES[size]
+        transcript, metrics, standards, response = _evaluation_fixture(turns)
+        toefl_scorer = get_scorer("toefl")
+        toefl = next(s for s in standards if s.standard_id == "toefl")
+        gpt_payload = gpt_entry("toefl", list(toefl.criteria))
+        session = SessionData(mode="text", duration_minutes=10, consent_granted=True)
+        history = transcript[: min(len(transcript), 9)]
+        toefl_output = _evaluator_output(toefl)
+        toefl_schema = toefl_scorer.config.get("evaluator_output_schema", {})
+
+        yield Case("evaluation._compute_metrics", size, lambda t=transcript: evaluation._compute_metrics(t))
+        yield Case(
+            "evaluation._build_standard_result",
+            size,
+            lambda c=toefl_scorer, m=metrics: evaluation._build_standard_result(c, m),
+        )
+        yield Case(
+            "evaluation._detect_common_errors",
+            size,
+            lambda m=metrics: evaluation._detect_common_errors(m.user_messages),
+        )
+        yield Case("evaluation._summarise_crosswalk", size, lambda s=standards: evaluation._summarise_crosswalk(s))
+        yield Case(
+            "evaluation._merge_standard_with_gpt",
+            size,
+            lambda b=toefl, p=gpt_payload: evaluation._merge_standard_with_gpt(b, p),
+        )
+        yield Case(
+            "schema.legacy_walker",
+            size,
+            lambda o=toefl_output, s=toefl_schema: _legacy_validate_output(o, s),
+        )
+        yield Case(
+            "schema.compiled_validator",
+            size,
+            lambda o=toefl_output, c=toefl_scorer.output_schema: c.validate(o),
+        )
+        yield Case(
+            "conversation.next_prompt",
+            size,
+            lambda h=history, s=session: conversation.next_prompt(h, session=s),
+        )
+        yield Case("reporting.build_html_report", size, lambda r=response: reporting.build_html_report(r))
+        yield Case(
+            "reporting.render_template",
+            size,
+            lambda c=reporting._report_context(response, None): reporting._report_template(None).render(
+                stylesheet=reporting._stylesheet(None), **c
+            ),
+        )
+        yield Case("reporting.persist_report", size, lambda r=response: reporting.persist_report(r, lazy=False))
+        yield Case("reporting.persist_report_lazy", size, lambda r=response: reporting.persist_report(r, lazy=True))
+
+
+def measure(func: Callable[[], object], *, repeat: int, min_time: float) -> dict:
+    """Time ``func`` in calibrated loops and return per-call statistics in microseconds."""
+
+    func()  # warm caches (config loading, question pool, ...)
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or loops >= 1_000_000:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed) + 1))
+
+    samples: List[float] = [elapsed / loops]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        samples.append((time.perf_counter() - started) / loops)
+
+    return {
+        "loops": loops,
+        "repeat": len(samples),
+        "min_us": round(min(samples) * 1e6, 3),
+        "median_us": round(percentile(samples, 0.5) * 1e6, 3),
+        "p95_us": round(percentile(samples, 0.95) * 1e6, 3),
+        "mean_us": round(sum(samples) / len(samples) * 1e6, 3),
+    }
+
+
+def current_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short=12", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return result.stdout.strip()
+
+
+def run_suite(
+    sizes: Sequence[str] = tuple(SIZES),
+    *,
+    repeat: int = 5,
+    min_time: float = 0.05,
+    name_filter: str | None = None,
+) -> dict:
+    original_reports_dir = reporting.REPORTS_DIR
+    results: dict = {}
+    with tempfile.TemporaryDirectory(prefix="bench-reports-") as reports_dir:
+        reporting.REPORTS_DIR = Path(reports_dir)
+        try:
+            for case in iter_cases(sizes):
+                if name_filter and name_filter not in case.name:
+                    continue
+                results[f"{case.name}[{case.size}]"] = {
+                    "name": case.name,
+                    "size": case.size,
+                    **measure(case.func, repeat=repeat, min_time=min_time),
+                }
+        finally:
+            reporting.REPORTS_DIR = original_reports_dir
+
+    return {
+        "commit": current_commit(),
+        "created_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the hot-path microbenchmarks.")
+    parser.add_argument("--sizes", default=",".join(SIZES), help=f"Comma-separated subset of {', '.join(SIZES)}")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05, help="Minimum seconds per timed repeat")
+    parser.add_argument("--filter", dest="name_filter", help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--output", help="Result path (default: benchmarks/results/<commit>.json)")
+    args = parser.parse_args(argv)
+
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"Unknown sizes: {', '.join(unknown)}")
+
+    report = run_suite(sizes, repeat=args.repeat, min_time=args.min_time, name_filter=args.name_filter)
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{report['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    for key, stats in report["benchmarks"].items():
+        print(f"{key:<50}{stats['median_us']:>14.1f} µs  (p95 {stats['p95_us']:.1f} µs, loops {stats['loops']})")
+    print(f"\nSaved {len(report['benchmarks'])} results to {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
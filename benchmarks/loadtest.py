@@ -0,0 +1,269 @@
+"""End-to-end load test driving concurrent candidate flows against the API.
+
+Each flow calls ``/api/session/start`` → 5× ``/api/chat`` → ``/api/session/finish``
+→ ``/api/evaluate`` → ``/api/report``. Concurrency is ramped level by level; the
+highest level whose flow p95 stays within ``--slo-p95-ms`` and whose error rate
+stays under ``--max-error-rate`` is reported as the sustainable load::
+
+    python -m backend.app.mock_gpt5 --port 8100 --latency-ms 800 --latency-dist lognormal &
+    GPT5_API_KEY=mock GPT5_API_BASE_URL=http://127.0.0.1:8100/v1 uvicorn backend.main:app --workers 2 &
+    python -m benchmarks.loadtest --base-url http://127.0.0.1:8000 --levels 5,10,20,40 --workers 2
+
+``--in-process`` runs the flows against the ASGI app directly, without a server.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence
+
+import httpx
+
+from ._stats import latency_summary_ms, percentile
+
+ENDPOINTS = ("session_start", "chat", "session_finish", "evaluate", "report")
+CHAT_TURNS = 5
+SAMPLE_ANSWERS = (
+    "My name is Deniz and I work as a project coordinator in a logistics company.",
+    "I want to improve my English because I often join meetings with international partners and I need to explain schedules clearly.",
+    "Last year our supplier was late, so I organised a call, agreed a new plan with the team and we delivered on time.",
+    "I prepare by writing an outline, practising the key points aloud and asking a colleague for feedback.",
+    "This year I am focusing on presentation skills, especially using linking words and speaking without notes.",
+)
+
+
+@dataclass
+class LevelResult:
+    concurrency: int
+    sessions: int
+    completed: int
+    failed: int
+    wall_seconds: float
+    flow_latencies: List[float] = field(default_factory=list)
+    endpoint_latencies: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(list))
+    endpoint_errors: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def error_rate(self) -> float:
+        return self.failed / self.sessions if self.sessions else 0.0
+
+    @property
+    def sessions_per_second(self) -> float:
+        return self.completed / self.wall_seconds if self.wall_seconds else 0.0
+
+    def summary(self) -> dict:
+        return {
+            "concurrency": self.concurrency,
+            "sessions": self.sessions,
+            "completed": self.completed,
+            "failed": self.failed,
+            "error_rate": round(self.error_rate, 4),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "sessions_per_second": round(self.sessions_per_second, 3),
+            "flow": latency_summary_ms(self.flow_latencies),
+            "endpoints": {
+                endpoint: {
+                    **latency_summary_ms(self.endpoint_latencies.get(endpoint, [])),
+                    "errors": self.endpoint_errors.get(endpoint, 0),
+                }
+                for endpoint in ENDPOINTS
+            },
+        }
+
+
+class FlowError(RuntimeError):
+    pass
+
+
+async def _timed_post(client: httpx.AsyncClient, result: LevelResult, endpoint: str, path: str, payload: dict) -> dict:
+    started = time.perf_counter()
+    try:
+        response = await client.post(path, json=payload)
+    except httpx.HTTPError as exc:
+        result.endpoint_errors[endpoint] += 1
+        raise FlowError(f"{endpoint}: {exc}") from exc
+    result.endpoint_latencies[endpoint].append(time.perf_counter() - started)
+    if response.status_code >= 400:
+        result.endpoint_errors[endpoint] += 1
+        raise FlowError(f"{endpoint}: HTTP {response.status_code}")
+    return response.json()
+
+
+async def run_flow(client: httpx.AsyncClient, result: LevelResult, index: int) -> None:
+    started = time.perf_counter()
+    start = await _timed_post(
+        client,
+        result,
+        "session_start",
+        "/api/session/start",
+        {
+            "mode": "text",
+            "duration_minutes": 10,
+            "user_name": f"Load Test {index}",
+            "consent": {"granted": True},
+        },
+    )
+    session_id = start["session_id"]
+    for turn in range(CHAT_TURNS):
+        answer = SAMPLE_ANSWERS[(index + turn) % len(SAMPLE_ANSWERS)]
+        await _timed_post(client, result, "chat", "/api/chat", {"session_id": session_id, "user_message": answer})
+    finish = await _timed_post(client, result, "session_finish", "/api/session/finish", {"session_id": session_id})
+    evaluation = await _timed_post(client, result, "evaluate", "/api/evaluate", {"session_id": session_id})
+    await _timed_post(
+        client,
+        result,
+        "report",
+        "/api/report",
+        {"evaluation": evaluation, "session_metadata": finish},
+    )
+    result.flow_latencies.append(time.perf_counter() - started)
+
+
+async def run_level(client: httpx.AsyncClient, concurrency: int, sessions: int) -> LevelResult:
+    result = LevelResult(concurrency=concurrency, sessions=sessions, completed=0, failed=0, wall_seconds=0.0)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def guarded(index: int) -> None:
+        async with semaphore:
+            try:
+                await run_flow(client, result, index)
+            except FlowError:
+                result.failed += 1
+            else:
+                result.completed += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(guarded(index) for index in range(sessions)))
+    result.wall_seconds = time.perf_counter() - started
+    return result
+
+
+def _build_client(base_url: str | None, token: str, timeout: float) -> httpx.AsyncClient:
+    headers = {"Authorization": f"Bearer {token}"}
+    if base_url:
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        return httpx.AsyncClient(base_url=base_url, headers=headers, timeout=timeout, limits=limits)
+
+    from backend.app.main import app  # local import: in-process mode only
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://loadtest",
+        headers=headers,
+        timeout=timeout,
+    )
+
+
+async def run_load_test(
+    *,
+    base_url: str | None,
+    token: str,
+    levels: Sequence[int],
+    sessions_per_level: int | None = None,
+    slo_p95_ms: float = 5000.0,
+    max_error_rate: float = 0.01,
+    workers: int = 1,
+    timeout: float = 120.0,
+) -> dict:
+    """Ramp through ``levels`` of concurrent flows and report sustainable load."""
+
+    level_results: List[dict] = []
+    sustainable: dict | None = None
+    async with _build_client(base_url, token, timeout) as client:
+        for concurrency in levels:
+            sessions = sessions_per_level or concurrency * 3
+            result = await run_level(client, concurrency, sessions)
+            summary = result.summary()
+            flow_p95_ms = percentile(result.flow_latencies, 0.95) * 1000
+            summary["within_slo"] = result.error_rate <= max_error_rate and flow_p95_ms <= slo_p95_ms
+            level_results.append(summary)
+            if summary["within_slo"]:
+                sustainable = summary
+            else:
+                break
+
+    workers = max(1, workers)
+    return {
+        "target": base_url or "in-process",
+        "slo_p95_ms": slo_p95_ms,
+        "max_error_rate": max_error_rate,
+        "workers": workers,
+        "levels": level_results,
+        "max_sustainable": {
+            "concurrent_sessions": sustainable["concurrency"] if sustainable else 0,
+            "concurrent_sessions_per_worker": round(sustainable["concurrency"] / workers, 2) if sustainable else 0.0,
+            "sessions_per_second_per_worker": (
+                round(sustainable["sessions_per_second"] / workers, 3) if sustainable else 0.0
+            ),
+        },
+    }
+
+
+def _format_report(report: dict) -> str:
+    lines = [f"Target: {report['target']}  (SLO p95 {report['slo_p95_ms']:.0f} ms, workers {report['workers']})"]
+    for level in report["levels"]:
+        status = "ok" if level["within_slo"] else "SLO breached"
+        lines.append(
+            f"\nconcurrency={level['concurrency']} sessions={level['sessions']} "
+            f"errors={level['error_rate']:.2%} throughput={level['sessions_per_second']:.2f}/s [{status}]"
+        )
+        lines.append(f"  {'endpoint':<16}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        for endpoint, stats in level["endpoints"].items():
+            lines.append(
+                f"  {endpoint:<16}{stats['count']:>7}{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}"
+                f"{stats['p99_ms']:>10.1f}{stats['errors']:>8}"
+            )
+        flow = level["flow"]
+        lines.append(f"  {'full flow':<16}{flow['count']:>7}{flow['p50_ms']:>10.1f}{flow['p95_ms']:>10.1f}{flow['p99_ms']:>10.1f}")
+    best = report["max_sustainable"]
+    lines.append(
+        f"\nMax sustainable: {best['concurrent_sessions']} concurrent sessions "
+        f"({best['concurrent_sessions_per_worker']} per worker, {best['sessions_per_second_per_worker']} sessions/s per worker)"
+    )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Load-test the assessment API with concurrent candidate flows.")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="Base URL of a running API server")
+    target.add_argument("--in-process", action="store_true", help="Drive the ASGI app in-process")
+    parser.add_argument("--token", default=os.getenv("APP_SECRET_TOKEN"), help="Bearer token (defaults to APP_SECRET_TOKEN)")
+    parser.add_argument("--levels", default="5,10,20,40", help="Comma-separated concurrency levels to ramp through")
+    parser.add_argument("--sessions", type=int, default=None, help="Flows per level (default: 3× concurrency)")
+    parser.add_argument("--slo-p95-ms", type=float, default=5000.0, help="Full-flow p95 budget per level")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=1, help="Number of API worker processes behind the target")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    if not args.token:
+        parser.error("--token or APP_SECRET_TOKEN is required")
+
+    report = asyncio.run(
+        run_load_test(
+            base_url=None if args.in_process else args.base_url,
+            token=args.token,
+            levels=[int(level) for level in args.levels.split(",") if level.strip()],
+            sessions_per_level=args.sessions,
+            slo_p95_ms=args.slo_p95_ms,
+            max_error_rate=args.max_error_rate,
+            workers=args.workers,
+            timeout=args.timeout,
+        )
+    )
+    print(_format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Deterministic synthetic transcripts and evaluations for benchmarks."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from backend.app.models import ChatMessage
+
+SIZES: Dict[str, int] = {"small": 5, "medium": 40, "large": 300}
+
+_QUESTIONS = (
+    "Please introduce yourself in English.",
+    "What are your current study or career goals?",
+    "Tell me about a time you solved a challenge at work or school.",
+    "How do you prepare for important presentations or exams?",
+    "What skills are you focused on improving this year?",
+)
+_FRAGMENTS = (
+    "I am agree that teamwork is important",
+    "my manager asked me to prepare a report for the client",
+    "however we needed more information about the budget",
+    "she go to the office early every day",
+    "as a result the project finished on time",
+    "I usually practise speaking with my colleagues",
+    "moreover I read articles about technology and business",
+    "it was difficult but I learned a lot from the experience",
+    "because the deadline was very close we worked late",
+    "in my opinion online courses are flexible and useful",
+)
+
+
+def synthetic_transcript(turns: int, seed: int = 7) -> List[ChatMessage]:
+    """Build an interview transcript with ``turns`` user answers of varying length."""
+
+    rng = random.Random(seed)
+    started = datetime(2024, 5, 18, 10, 0, 0)
+    transcript: List[ChatMessage] = []
+    clock = started
+    for index in range(turns):
+        transcript.append(ChatMessage(role="assistant", content=_QUESTIONS[index % len(_QUESTIONS)], timestamp=clock))
+        clock += timedelta(seconds=rng.randint(3, 12))
+        sentences = [rng.choice(_FRAGMENTS) for _ in range(rng.randint(1, 4))]
+        answer = ". ".join(sentence[0].upper() + sentence[1:] for sentence in sentences) + "."
+        if rng.random() < 0.1:
+            answer = answer[:-1] + "?"
+        transcript.append(ChatMessage(role="user", content=answer, timestamp=clock))
+        clock += timedelta(seconds=rng.randint(20, 60))
+    return transcript
+
+
+def gpt_entry(standard_id: str, criteria: List[str]) -> dict:
+    """A GPT-5 style standard entry used to exercise the merge path."""
+
+    return {
+        "standard_id": standard_id,
+        "label": f"{standard_id.upper()} (GPT)",
+        "overall": 3.1,
+        "cefr": "B2",
+        "criteria": {cid: {"score": 3.0, "comment": f"GPT comment for {cid}."} for cid in criteria + ["extra"]},
+        "common_errors": [{"issue": "Agreement phrase", "fix": "Say 'I agree'."}, "ignored"],
+        "recommendations": ["Add more detail.", "Practice linking words.", "  "],
+        "evidence_quotes": ["I solved a problem with my team."],
+    }
@@ -86,7 +86,7 @@ export interface DualEvaluationResponse {
 export interface ReportResponse {
   report_url: string;
   pdf_url?: string | null;
-  html: string;
+  html?: string | null;
 }
 
 export interface ChatMessage {
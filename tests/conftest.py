@@ -1,6 +1,21 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def isolated_storage(tmp_path_factory, monkeypatch):
+    """Keep reports, their index and recordings out of the working tree."""
+
+    from backend.app.services import audio, reporting
+
+    root = tmp_path_factory.mktemp("storage")
+    monkeypatch.setattr(reporting, "REPORTS_DIR", root / "reports")
+    monkeypatch.setattr(audio, "AUDIO_DIR", root / "audio")
+    (root / "reports").mkdir()
+    (root / "audio").mkdir()
@@ -0,0 +1,169 @@
+import gzip
+import shutil
+import socket
+import subprocess
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.app.config import get_settings
+from backend.app.main import app
+from backend.app.services import audio, evaluation, reporting
+from backend.app.services.llm_stub import StubProvider
+from backend.app.services.session_store import InMemorySessionStore, get_store
+from benchmarks.synthetic import synthetic_transcript
+
+ROOT = Path(__file__).resolve().parent.parent
+RECORDING = b"ID3" + bytes(range(256)) * 400
+
+
+@pytest.fixture
+def stored(tmp_path, monkeypatch):
+    reports, recordings = tmp_path / "reports", tmp_path / "audio"
+    reports.mkdir()
+    recordings.mkdir()
+    monkeypatch.setattr(reporting, "REPORTS_DIR", reports)
+    monkeypatch.setattr(audio, "AUDIO_DIR", recordings)
+
+    session = get_store().create_session(mode="text", duration_minutes=5, user_name="Ada", consent_granted=True)
+    with patch.object(evaluation, "get_gpt5_client", return_value=StubProvider()):
+        result = evaluation.evaluate_transcript(synthetic_transcript(4), session_id=session.session_id)
+    html, url = reporting.persist_report(result, lazy=False)
+    _, lazy_url = reporting.persist_report(result, lazy=True)
+    recording = recordings / "Ada Lovelace.mp3"
+    recording.write_bytes(RECORDING)
+    reporting.register_recording(session.session_id, recording)
+    # Downloads are served by whichever worker nginx picks, possibly after a restart.
+    monkeypatch.setattr(get_store, "_instance", InMemorySessionStore())
+    return {
+        "reports": reports,
+        "recordings": recordings,
+        "html": html.encode("utf-8"),
+        "path": "/api/reports/" + url.rsplit("/", 1)[-1],
+        "lazy_path": "/api/reports/" + lazy_url.rsplit("/", 1)[-1],
+    }
+
+
+def test_downloads_are_handed_to_nginx_when_offloading_is_on(stored, monkeypatch):
+    client = TestClient(app)
+    plain = client.get(f"{stored['path']}/audio", headers={"Range": "bytes=10-19"})
+    assert "x-accel-redirect" not in plain.headers
+    assert plain.status_code == 206 and plain.content == RECORDING[10:20]
+
+    monkeypatch.setattr(get_settings(), "accel_redirect_prefix", "/_protected")
+    report = client.get(stored["path"])
+    assert report.status_code == 200 and report.content == b""
+    assert report.headers["x-accel-redirect"].startswith("/_protected/reports/")
+    stored_file = stored["reports"] / report.headers["x-accel-redirect"].rsplit("/", 1)[1]
+    assert stored_file.read_bytes() == stored["html"]
+    assert report.headers["content-disposition"].startswith("attachment;")
+    assert report.headers["cache-control"].startswith("private, max-age=")
+
+    recording = client.get(f"{stored['path']}/audio")
+    assert recording.headers["x-accel-redirect"] == "/_protected/audio/Ada%20Lovelace.mp3"
+    assert recording.headers["content-type"] == "audio/mpeg" and recording.content == b""
+
+    lazy = client.get(stored["lazy_path"])  # only the evaluation JSON exists: rendered here
+    assert "x-accel-redirect" not in lazy.headers and lazy.content == stored["html"]
+
+    denied = client.get("/api/reports/not-a-token/audio")
+    assert denied.status_code == 404 and "x-accel-redirect" not in denied.headers
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _nginx_config(tmp_path: Path, port: int, backend_port: int, stored: dict) -> Path:
+    server = (
+        (ROOT / "nginx.conf")
+        .read_text(encoding="utf-8")
+        .replace("listen 80;", f"listen 127.0.0.1:{port};")
+        .replace("http://fla-backend:8000", f"http://127.0.0.1:{backend_port}")
+        .replace("/srv/fla/protected_reports/", f"{stored['reports']}/")
+        .replace("/srv/fla/protected_audio/", f"{stored['recordings']}/")
+        .replace("/usr/share/nginx/html", str(tmp_path))
+    )
+    temp = "\n".join(f"{kind}_temp_path {tmp_path / kind};" for kind in ("client_body", "proxy", "fastcgi", "uwsgi", "scgi"))
+    config = tmp_path / "nginx-test.conf"
+    config.write_text(
+        f"""
+        user root;
+        daemon off;
+        pid {tmp_path / 'nginx.pid'};
+        error_log {tmp_path / 'error.log'};
+        events {{}}
+        http {{
+            types {{ text/html html; audio/mpeg mp3; application/pdf pdf; }}
+            access_log off;
+            sendfile on;
+            {temp}
+            {server}
+        }}
+        """,
+        encoding="utf-8",
+    )
+    return config
+
+
+@pytest.mark.skipif(shutil.which("nginx") is None, reason="nginx is not installed")
+def test_bundled_nginx_config_serves_offloaded_files(stored, tmp_path, monkeypatch):
+    import uvicorn
+
+    monkeypatch.setattr(get_settings(), "accel_redirect_prefix", "/_protected")
+    gzip_variant = next(stored["reports"].glob("*.html.gz"))
+    assert gzip.decompress(gzip_variant.read_bytes()) == stored["html"]
+
+    backend_port, port = _free_port(), _free_port()
+    backend = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=backend_port, log_level="warning", lifespan="off"))
+    backend_thread = threading.Thread(target=backend.run, daemon=True)
+    backend_thread.start()
+    config = _nginx_config(tmp_path, port, backend_port, stored)
+    nginx = subprocess.Popen(["nginx", "-p", str(tmp_path), "-c", str(config)])
+
+    def fetch(path: str, **headers: str):
+        request = urllib.request.Request(f"http://127.0.0.1:{port}{path}", headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as exc:
+            return exc.code, exc.headers, exc.read()
+
+    try:
+        for _ in range(100):
+            if backend.started and nginx.poll() is None:
+                try:
+                    socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+                    break
+                except OSError:
+                    pass
+            time.sleep(0.05)
+        assert nginx.poll() is None, (tmp_path / "error.log").read_text()
+
+        status, headers, body = fetch(stored["path"])
+        assert status == 200 and body == stored["html"]
+        assert headers["Content-Disposition"].startswith("attachment;")
+        assert headers["Cache-Control"].startswith("private, max-age=")
+
+        status, headers, body = fetch(stored["path"], **{"Accept-Encoding": "gzip"})
+        assert headers["Content-Encoding"] == "gzip" and gzip.decompress(body) == stored["html"]
+
+        status, headers, body = fetch(f"{stored['path']}/audio", Range="bytes=100-199")
+        assert status == 206 and body == RECORDING[100:200]
+        assert headers["Content-Type"] == "audio/mpeg"
+
+        assert fetch("/_protected/audio/Ada%20Lovelace.mp3")[0] == 404  # internal only
+        assert fetch("/api/reports/not-a-token")[0] == 404
+    finally:
+        nginx.terminate()
+        nginx.wait(timeout=5)
+        backend.should_exit = True
+        backend_thread.join(timeout=5)
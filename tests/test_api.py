@@ -1,12 +1,18 @@
 from fastapi.testclient import TestClient
 
+import asyncio
 import base64
+import json
+import threading
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 
+from backend.app import main
 from backend.app.main import app
 from backend.app.config import get_settings
+from backend.app.services.evaluation import SUPPORTED_STANDARDS, run_heuristic_stage
+from backend.app.services.session_store import get_store
 
 
 def get_auth_headers():
@@ -71,7 +77,7 @@ def test_session_lifecycle():
     )
     assert report_resp.status_code == 200
     report_body = report_resp.json()
-    assert report_body["html"].startswith("\n    <html")
+    assert report_body["html"].startswith("<!DOCTYPE html>\n<html")
 
     email_resp = client.post(
         "/api/email",
@@ -158,3 +164,138 @@ def test_cors_allows_custom_headers():
     assert response.status_code == 200
     allowed_headers = response.headers.get("access-control-allow-headers", "")
     assert "X-Custom-Header" in allowed_headers or allowed_headers == "*"
+
+
+def test_evaluate_batch_streams_ndjson_results():
+    client = TestClient(app)
+    transcript = [
+        {"role": "assistant", "content": "Tell me about your job."},
+        {"role": "user", "content": "I manage a small team and we plan deliveries for our customers every week."},
+    ]
+    lines = [
+        json.dumps({"id": "alpha", "transcript": transcript}),
+        json.dumps({"id": "beta", "session_id": "missing-session"}),
+        "",
+        "{not json",
+        json.dumps({"transcript": transcript}),
+    ]
+
+    def body():
+        for line in lines:
+            yield (line + "\n").encode("utf-8")
+
+    response = client.post(
+        "/api/evaluate/batch",
+        content=body(),
+        headers={**get_auth_headers(), "Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    results = {item["id"]: item for item in map(json.loads, response.text.splitlines())}
+    assert set(results) == {"alpha", "beta", "3", "4"}
+    assert results["alpha"]["status"] == "ok"
+    assert results["alpha"]["result"]["standards"]
+    assert results["beta"]["status_code"] == 404
+    assert results["3"]["status_code"] == 422
+    assert results["4"]["status"] == "ok"
+
+
+def _run_batch(messages: list, evaluate, monkeypatch) -> list:
+    """Drive the batch endpoint over raw ASGI; ``messages`` are followed by a disconnect."""
+
+    monkeypatch.setattr(main, "_evaluate_batch_line", evaluate)
+    token = get_settings().secret_token.encode("utf-8")
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/evaluate/batch",
+        "raw_path": b"/api/evaluate/batch",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"authorization", b"Bearer " + token), (b"content-type", b"application/x-ndjson")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    pending = list(messages)
+    sent: list = []
+
+    async def receive():
+        return pending.pop(0) if pending else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return [message["body"] for message in sent if message["type"] == "http.response.body" and message.get("body")]
+
+
+def test_evaluate_batch_stops_before_yielding_to_a_disconnected_client(monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def evaluate(index, line):
+        calls.append(index)
+        if index == 2:
+            release.wait(5)
+        return b'{"id": "%d"}\n' % index
+
+    body = {"type": "http.request", "body": b'{"id": 1}\n{"id": 2}\n', "more_body": False}
+    try:
+        assert _run_batch([body], evaluate, monkeypatch) == []
+    finally:
+        release.set()
+    assert calls == [1, 2]
+
+
+def test_evaluate_batch_cancels_pending_items_when_the_upload_is_cut(monkeypatch):
+    monkeypatch.setattr(get_settings(), "batch_evaluation_concurrency", 1)
+    calls = []
+
+    def evaluate(index, line):
+        calls.append(index)
+        return b'{"id": "%d"}\n' % index
+
+    first = {"type": "http.request", "body": b'{"id": 1}\n', "more_body": True}
+    assert _run_batch([first], evaluate, monkeypatch) == []
+    assert calls in ([], [1])  # cancelled before or while it ran, never answered
+
+
+def test_provisional_level_tracks_live_session_state():
+    client = TestClient(app)
+    start_resp = client.post(
+        "/api/session/start",
+        json={"mode": "text", "duration_minutes": 5, "consent": {"granted": True}},
+        headers=get_auth_headers(),
+    )
+    session_id = start_resp.json()["session_id"]
+
+    empty = client.get(f"/api/session/{session_id}/provisional", headers=get_auth_headers()).json()
+    assert empty["turns"] == 0 and empty["consensus_cefr"] == "Undetermined"
+
+    answers = [
+        "I am agree that remote work helps me focus, however I miss my colleagues sometimes.",
+        "Last year she go to Berlin for a conference and came back with a information pack.",
+        "Why?",
+    ]
+    for answer in answers:
+        client.post("/api/chat", json={"session_id": session_id, "user_message": answer}, headers=get_auth_headers())
+
+    resp = client.get(f"/api/session/{session_id}/provisional", headers=get_auth_headers())
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["turns"] == 3
+    assert body["total_words"] == sum(len(answer.split()) for answer in answers)
+    assert {standard["standard_id"] for standard in body["standards"]} == set(SUPPORTED_STANDARDS)
+
+    session = get_store().get(session_id)
+    live = session.live.heuristic_stage(session.messages)
+    full = run_heuristic_stage(session.messages)
+    assert live.metrics == full.metrics
+    assert live.base_results == full.base_results
+
+    missing = client.get("/api/session/unknown/provisional", headers=get_auth_headers())
+    assert missing.status_code == 404
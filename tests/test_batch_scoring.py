@@ -0,0 +1,88 @@
+import random
+
+from fastapi.testclient import TestClient
+
+from backend.app.config import get_settings
+from backend.app.main import app
+from backend.app.models import ChatMessage
+from backend.app.services import evaluation
+from backend.app.services.batch_scoring import extract_features, score_transcripts
+from backend.app.services.scoring import get_scorer
+
+WORDS = (
+    "the a team project because however I we think, believe. yes? no! No. Dr. St. etc. in addition for example "
+    "market deadline mitigate ubiquitous"
+).split()
+
+
+def _random_corpus(count: int, seed: int = 7) -> list[list[ChatMessage]]:
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(count):
+        transcript = []
+        for _ in range(rng.randint(0, 10)):
+            transcript.append(ChatMessage(role="assistant", content=" ".join(rng.sample(WORDS, 4))))
+            words = [rng.choice(WORDS) + rng.choice(["", "", str(rng.randint(0, 60))]) for _ in range(rng.randint(0, 45))]
+            transcript.append(ChatMessage(role="user", content=" ".join(words)))
+        corpus.append(transcript)
+    return corpus
+
+
+def test_batch_scores_match_scalar_scorers():
+    corpus = _random_corpus(400)
+    batch = score_transcripts(corpus)
+
+    for index, transcript in enumerate(corpus):
+        metrics = evaluation._compute_metrics(transcript)
+        assert batch.features.total_words[index] == metrics.total_words
+        assert batch.features.unique_words[index] == metrics.unique_words
+        assert batch.features.advanced_word_share[index] == metrics.advanced_word_share
+        assert batch.features.topic_relevance[index] == metrics.topic_relevance
+        assert batch.features.words_per_sentence[index] == metrics.words_per_sentence
+        assert batch.features.connector_density[index] == metrics.connector_density
+        for standard_id in evaluation.SUPPORTED_STANDARDS:
+            expected = evaluation._build_standard_result(get_scorer(standard_id), metrics)
+            scores = batch.standards[standard_id]
+            assert scores.overall[index] == expected.overall
+            assert scores.cefr[index] == expected.cefr
+            assert scores.criteria[index].tolist() == [expected.criteria[cid].score for cid in scores.criteria_ids]
+
+
+def test_batch_scoring_uses_overridden_rubric_weights():
+    corpus = _random_corpus(20)
+    config = evaluation._load_standard_config("toefl")
+    config["rubric"]["weights"] = {cid: (1.0 if cid == "task" else 0.0) for cid in config["rubric"]["weights"]}
+
+    batch = score_transcripts(corpus, standards=["toefl"], configs={"toefl": config})
+
+    task = batch.standards["toefl"].criteria_ids.index("task")
+    assert batch.standards["toefl"].overall.tolist() == batch.standards["toefl"].criteria[:, task].tolist()
+
+
+def test_extract_features_handles_empty_transcripts():
+    features = extract_features([[], [ChatMessage(role="assistant", content="Hello")]])
+
+    assert features.total_words.tolist() == [0.0, 0.0]
+    assert features.unique_words.tolist() == [0.0, 0.0]
+
+
+def test_heuristic_batch_endpoint():
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {get_settings().secret_token}"}
+    items = [
+        {"id": f"cand-{index}", "transcript": [message.model_dump(mode="json") for message in transcript]}
+        for index, transcript in enumerate(_random_corpus(3))
+    ]
+
+    response = client.post("/api/evaluate/heuristic-batch", json={"items": items}, headers=headers)
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["id"] for result in results] == ["cand-0", "cand-1", "cand-2"]
+    assert set(results[0]["standards"]) == set(evaluation.SUPPORTED_STANDARDS)
+
+    rejected = client.post(
+        "/api/evaluate/heuristic-batch",
+        json={"items": items, "standards": ["toeic"]},
+        headers=headers,
+    )
+    assert rejected.status_code == 400
@@ -0,0 +1,52 @@
+from benchmarks import allocations
+from benchmarks.compare import compare
+from benchmarks.hotpaths import run_suite
+
+
+def _result(**medians: float) -> dict:
+    return {"benchmarks": {name: {"median_us": value} for name, value in medians.items()}}
+
+
+def test_compare_flags_regressions_above_threshold():
+    rows = compare(
+        _result(a=100.0, b=100.0, c=100.0, gone=5.0),
+        _result(a=130.0, b=105.0, c=50.0, new=1.0),
+        threshold=0.15,
+    )
+
+    statuses = {row["benchmark"]: row["status"] for row in rows}
+    assert statuses == {"a": "REGRESSION", "b": "ok", "c": "improved", "gone": "removed", "new": "added"}
+
+
+def test_compare_ignores_tiny_absolute_changes():
+    rows = compare(_result(fast=0.5), _result(fast=1.0), threshold=0.15, min_delta_us=1.0)
+
+    assert rows[0]["status"] == "ok"
+
+
+def test_hotpath_suite_covers_every_target():
+    report = run_suite(["small"], repeat=1, min_time=0.0)
+
+    names = {entry["name"] for entry in report["benchmarks"].values()}
+    assert names == {
+        "evaluation._compute_metrics",
+        "evaluation._build_standard_result",
+        "evaluation._detect_common_errors",
+        "evaluation._summarise_crosswalk",
+        "evaluation._merge_standard_with_gpt",
+        "schema.legacy_walker",
+        "schema.compiled_validator",
+        "conversation.next_prompt",
+        "reporting.build_html_report",
+        "reporting.render_template",
+        "reporting.persist_report",
+        "reporting.persist_report_lazy",
+    }
+    assert all(entry["median_us"] > 0 for entry in report["benchmarks"].values())
+
+
+def test_allocation_suite_reports_time_and_peak_memory():
+    report = allocations.run_suite(["small"], repeat=1, min_time=0.0)
+
+    assert {entry["name"] for entry in report["benchmarks"].values()} == {"evaluation.full", "evaluation.merge"}
+    assert all(entry["peak_kib"] > 0 and entry["median_us"] > 0 for entry in report["benchmarks"].values())
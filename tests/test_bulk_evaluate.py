@@ -0,0 +1,87 @@
+import asyncio
+import json
+
+import pytest
+
+from backend.app import bulk_evaluate
+from backend.app.config import get_settings
+from backend.app.services.evaluation import SUPPORTED_STANDARDS
+from backend.app.services.gpt5_client import clear_gpt5_client_cache
+
+ANSWERS = (
+    "I coordinate deliveries for a logistics company and speak with suppliers every day.",
+    "Last year we changed our planning process because the old schedule caused delays.",
+    "I usually prepare an outline, practise the key points and ask a colleague for feedback.",
+)
+
+
+@pytest.fixture()
+def stub_provider(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDERS", json.dumps([{"name": "stub", "kind": "stub"}]))
+    get_settings.cache_clear()
+    clear_gpt5_client_cache()
+    yield
+    monkeypatch.delenv("LLM_PROVIDERS")
+    get_settings.cache_clear()
+    clear_gpt5_client_cache()
+
+
+def _write_input(path, count):
+    with path.open("w", encoding="utf-8") as handle:
+        for index in range(count):
+            transcript = []
+            for answer in ANSWERS[: index % len(ANSWERS) + 1]:
+                transcript.append({"role": "assistant", "content": "Tell me about your work."})
+                transcript.append({"role": "user", "content": answer})
+            handle.write(json.dumps({"id": f"cand-{index}", "transcript": transcript}) + "\n")
+        handle.write("not json\n")
+
+
+def _output_ids(path):
+    return [json.loads(line)["session_id"] for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_bulk_evaluate_streams_results(tmp_path, stub_provider):
+    source = tmp_path / "in.jsonl"
+    output = tmp_path / "out.jsonl"
+    _write_input(source, 6)
+
+    summary = bulk_evaluate.BulkSummary()
+    asyncio.run(
+        bulk_evaluate.run_bulk(
+            bulk_evaluate.read_records([str(tmp_path)], summary.errors),
+            output,
+            workers=2,
+            concurrency=3,
+            summary=summary,
+        )
+    )
+
+    assert summary.completed == 6
+    assert summary.failed == 0
+    assert len(summary.errors) == 1 and "in.jsonl:7" in summary.errors[0]
+    assert sorted(_output_ids(output)) == [f"cand-{index}" for index in range(6)]
+    first = json.loads(output.read_text(encoding="utf-8").splitlines()[0])
+    assert {standard["standard_id"] for standard in first["standards"]} == set(SUPPORTED_STANDARDS)
+
+
+def test_bulk_evaluate_resumes_from_checkpoint(tmp_path, stub_provider):
+    source = tmp_path / "in.jsonl"
+    output = tmp_path / "out.jsonl"
+    checkpoint = tmp_path / "out.jsonl.checkpoint"
+    _write_input(source, 5)
+
+    asyncio.run(bulk_evaluate.run_bulk(bulk_evaluate.read_records([str(source)]), output, workers=0))
+    # Simulate a crash: the last checkpoint entry never landed and a torn line follows.
+    entries = checkpoint.read_text(encoding="utf-8").splitlines()
+    checkpoint.write_text("\n".join(entries[:3]) + "\n{\"id\": ", encoding="utf-8")
+    with output.open("a", encoding="utf-8") as handle:
+        handle.write('{"partial": ')
+
+    summary = asyncio.run(
+        bulk_evaluate.run_bulk(bulk_evaluate.read_records([str(source)]), output, workers=0, resume=True)
+    )
+
+    assert summary.skipped == 3
+    assert summary.completed == 2
+    assert sorted(_output_ids(output)) == [f"cand-{index}" for index in range(5)]
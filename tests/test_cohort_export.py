@@ -0,0 +1,112 @@
+import base64
+import io
+import json
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from backend.app.config import get_settings
+from backend.app.main import app
+from backend.app.services import audio, evaluation, reporting
+from backend.app.services.llm_stub import StubProvider
+from backend.app.services.report_index import ReportIndex
+from backend.app.services.session_store import InMemorySessionStore, get_store
+from backend.app.services.zip_stream import ZipArchive, file_entry, generated_entry
+from benchmarks.synthetic import synthetic_transcript
+
+
+def _auth():
+    return {"Authorization": f"Bearer {get_settings().secret_token}"}
+
+
+def _persist(*, lazy):
+    session = get_store().create_session(mode="text", duration_minutes=5, user_name="Ada", consent_granted=True)
+    with patch.object(evaluation, "get_gpt5_client", return_value=StubProvider()):
+        result = evaluation.evaluate_transcript(synthetic_transcript(4), session_id=session.session_id)
+    reporting.persist_report(result, tenant="acme", lazy=lazy)
+    return session, result
+
+
+def test_cohort_export_streams_a_resumable_zip(tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "REPORTS_DIR", tmp_path)
+    monkeypatch.setattr(audio, "AUDIO_DIR", tmp_path)
+    monkeypatch.setattr(get_settings(), "report_keep_evaluation_json", True)
+    eager, eager_result = _persist(lazy=False)
+    lazy, _ = _persist(lazy=True)
+    client = TestClient(app)
+    upload = {
+        "session_id": eager.session_id,
+        "audio_base64": base64.b64encode(b"ID3" + bytes(range(256)) * 400).decode("ascii"),
+        "mime_type": "audio/mpeg",
+        "report_date": "2024-05-18",
+    }
+    assert client.post("/api/session/audio", json=upload, headers=_auth()).status_code == 200
+    # Exports run long after the interviews, typically on a restarted or different worker.
+    monkeypatch.setattr(get_store, "_instance", InMemorySessionStore())
+
+    url = f"/api/exports/cohort?session_id={eager.session_id}&session_id={lazy.session_id}"
+    full = client.get(url, headers=_auth())
+    assert full.status_code == 200 and full.headers["accept-ranges"] == "bytes"
+    assert int(full.headers["content-length"]) == len(full.content)
+
+    archive = zipfile.ZipFile(io.BytesIO(full.content))
+    assert archive.testzip() is None
+    names = set(archive.namelist())
+    assert f"{eager.session_id}/Ada-20240518.mp3" in names
+    assert f"{lazy.session_id}/evaluation.json" in names
+    report = archive.read(f"{eager.session_id}/assessment_report_{eager.session_id}.html").decode("utf-8")
+    assert report == reporting.build_html_report(eager_result, tenant="acme")
+    exported = json.loads(archive.read(f"{eager.session_id}/evaluation.json"))
+    assert exported["session"]["id"] == eager.session_id
+
+    resumed = client.get(url, headers={**_auth(), "Range": "bytes=1000-", "If-Range": full.headers["etag"]})
+    assert resumed.status_code == 206 and resumed.content == full.content[1000:]
+    assert resumed.headers["content-range"] == f"bytes 1000-{len(full.content) - 1}/{len(full.content)}"
+    stale = client.get(url, headers={**_auth(), "Range": "bytes=1000-", "If-Range": '"stale"'})
+    assert stale.status_code == 200 and stale.content == full.content
+    assert client.get(url, headers={**_auth(), "Range": f"bytes={len(full.content)}-"}).status_code == 416
+
+    by_tenant = client.get("/api/exports/cohort?tenant=acme", headers=_auth())
+    assert by_tenant.headers["etag"] == full.headers["etag"]
+    assert client.get("/api/exports/cohort?tenant=other", headers=_auth()).status_code == 404
+
+
+def test_rendered_reports_keep_their_evaluation_json_only_when_configured(tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "REPORTS_DIR", tmp_path)
+    session, _ = _persist(lazy=False)
+    assert not list(tmp_path.glob("*.json"))
+
+    archive = TestClient(app).get(f"/api/exports/cohort?session_id={session.session_id}", headers=_auth())
+    names = zipfile.ZipFile(io.BytesIO(archive.content)).namelist()
+    assert names == [f"{session.session_id}/assessment_report_{session.session_id}.html"]
+
+
+def test_zip_archive_serves_any_byte_range(tmp_path):
+    source = tmp_path / "a.bin"
+    source.write_bytes(bytes(range(256)) * 700)
+    archive = ZipArchive(
+        [
+            file_entry("a/one.bin", source),
+            generated_entry("a/two.txt", lambda: "çift".encode("utf-8") * 50, reporting._now()),
+        ]
+    )
+    full = b"".join(archive.iter_bytes())
+    assert len(full) == archive.size and zipfile.ZipFile(io.BytesIO(full)).testzip() is None
+    for start, end in [(0, 0), (10, 29), (30, 70_000), (179_000, archive.size - 1), (archive.size - 1, archive.size - 1)]:
+        assert b"".join(archive.iter_bytes(start, end)) == full[start : end + 1]
+
+
+def test_workers_opening_a_new_index_migrate_it_once(tmp_path):
+    for attempt in range(20):
+        path = tmp_path / f"reports-{attempt}.sqlite3"
+        barrier = threading.Barrier(8)
+
+        def open_index(_):
+            barrier.wait()
+            return ReportIndex(path)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert len(list(pool.map(open_index, range(8)))) == 8
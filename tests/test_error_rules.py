@@ -0,0 +1,105 @@
+import re
+
+import pytest
+
+from backend.app.models import CommonError
+from backend.app.services.error_rules import ErrorRuleSet, RuleStats, load_rule_set
+
+
+def _legacy_detect(messages):
+    detections = []
+    for message in messages:
+        lower = message.lower()
+        if "i am agree" in lower:
+            detections.append("Agreement phrase")
+        if "a information" in lower:
+            detections.append("Article use")
+        if "he go" in lower or "she go" in lower:
+            detections.append("Third-person verb")
+        if len(message.split()) < 6:
+            detections.append("Short responses")
+        if lower.endswith("?"):
+            detections.append("Rising intonation")
+        if len(detections) >= 5:
+            break
+    if not detections:
+        detections.append("Limited elaboration")
+    issues = list(dict.fromkeys(detections))[:5]
+    for default in ("Linking phrases", "Complex sentences", "Pronunciation clarity"):
+        if len(issues) >= 3:
+            break
+        if default not in issues:
+            issues.append(default)
+    return issues[:5]
+
+
+def test_default_rules_match_legacy_detection():
+    transcripts = [
+        [],
+        ["I am agree with my manager because she go to every meeting early?"],
+        ["Short one?", "I am agree.", "We need a information about the plan before Monday."],
+        ["Every weekend my brother and I cook dinner together for the family.", "He goes to the gym."],
+        ["The shepherd goes home after he gone through the forest with the sheep?\nReally"],
+        ["ok", "yes", "no", "fine", "sure", "maybe", "I AM AGREE TOTALLY WITH THIS IDEA HERE"],
+    ]
+    rule_set = load_rule_set()
+    for messages in transcripts:
+        assert [error.issue for error in rule_set.detect(messages)] == _legacy_detect(messages)
+
+
+def test_compiled_rules_scan_each_message_once_and_count_hits():
+    config = {
+        "max_detections": 10,
+        "min_detections": 0,
+        "rules": [
+            {"id": "he_go", "type": "token_sequence", "tokens": ["he|she", "go"], "issue": "Verb", "fix": "goes"},
+            {"id": "question", "type": "regex", "pattern": r"\?$", "issue": "Question", "fix": "state"},
+            {"id": "she", "type": "regex", "pattern": r"she\b", "issue": "She", "fix": "-"},
+            {"id": "agree", "type": "phrase", "phrases": ["am agree"], "word_boundary": True, "issue": "Agree", "fix": "-"},
+            {"id": "agreed", "type": "phrase", "phrases": ["agree", "gree"], "issue": "Gree", "fix": "-"},
+        ],
+    }
+    stats = RuleStats()
+    rule_set = ErrorRuleSet.from_config(config, stats=stats)
+
+    fired = rule_set.scan(["She, go?", "He goes home", "I am agreed", "We i am agree"])
+    ids = [{rule_set.rules[index].rule_id for index in message} for message in fired]
+    assert ids == [{"he_go", "question", "she"}, set(), {"agreed"}, {"agree", "agreed"}]
+    assert stats.snapshot()["hits"]["agreed"] == 2
+
+    stats.reset()
+
+    errors = rule_set.detect(["She go there?", "I am agree"])
+    assert errors[0] == CommonError(issue="Verb", fix="goes")
+    assert [error.issue for error in errors] == ["Verb", "Question", "She", "Agree", "Gree"]
+    snapshot = stats.snapshot()
+    assert snapshot["scans"] == 1 and snapshot["messages"] == 2
+    assert snapshot["hits"] == {"he_go": 1, "question": 1, "she": 1, "agree": 1, "agreed": 1}
+
+
+def test_regex_rules_do_not_match_across_messages():
+    config = {
+        "min_detections": 0,
+        "rules": [
+            {"id": "you_are", "type": "regex", "pattern": r"\byou\s+are\b", "issue": "You are", "fix": "-"},
+            {"id": "trailing", "type": "regex", "pattern": r"so\W+\w+", "issue": "So", "fix": "-"},
+        ],
+    }
+    rule_set = ErrorRuleSet.from_config(config, stats=RuleStats())
+
+    fired = rule_set.scan(["Thank you", "are welcome", "I think so", "really so much", "you  are"])
+    ids = [{rule_set.rules[index].rule_id for index in message} for message in fired]
+    assert ids == [set(), set(), set(), {"trailing"}, {"you_are"}]
+
+
+@pytest.mark.parametrize("pattern", [r"(\w+) \1", r"(?P<word>\w+) (?P=word)", r"(?P<word>\w+)", r"a(?i)b"])
+def test_regex_rules_that_cannot_be_combined_are_rejected(pattern):
+    config = {"rules": [{"type": "regex", "pattern": pattern, "issue": "-", "fix": "-"}]}
+    with pytest.raises((ValueError, re.error)):
+        ErrorRuleSet.from_config(config)
+
+
+def test_escaped_backslash_before_a_digit_is_not_a_backreference():
+    config = {"rules": [{"type": "regex", "pattern": r"\\1", "issue": "Backslash one", "fix": "-"}]}
+    rule_set = ErrorRuleSet.from_config(config, stats=RuleStats())
+    assert rule_set.scan([r"c:\1"]) == [{0}]
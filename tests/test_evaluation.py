@@ -1,7 +1,44 @@
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from backend.app.config import get_settings
 from backend.app.models import ChatMessage
-from backend.app.services.evaluation import evaluate_transcript
+from backend.app.services.evaluation import (
+    SUPPORTED_STANDARDS,
+    _merge_standard_with_gpt,
+    evaluate_transcript,
+    run_heuristic_stage,
+)
+from backend.app.services.metrics import MetricsAccumulator, compute_metrics
+from backend.app.services.scoring import compile_scorer, discover_standards
+from backend.app.services.tiering import TIER_STATS
+
+
+@pytest.fixture
+def tiering_env(monkeypatch):
+    monkeypatch.setenv("EVALUATION_TIERING", "true")
+    get_settings.cache_clear()
+    TIER_STATS.reset()
+    yield monkeypatch
+    get_settings.cache_clear()
+    TIER_STATS.reset()
+
+
+def _long_transcript() -> list[ChatMessage]:
+    answer = (
+        "I usually plan my week on {day} evening because it helps me focus on the most important tasks "
+        "and avoid stress later, and I also review what went well in the previous week so that I can "
+        "improve my habits over time."
+    )
+    transcript: list[ChatMessage] = []
+    for index, day in enumerate(("Monday", "Friday", "Sunday", "Tuesday", "Saturday")):
+        transcript.append(ChatMessage(role="assistant", content=f"Question {index}?"))
+        transcript.append(ChatMessage(role="user", content=answer.format(day=day)))
+    return transcript
 
 
 def test_evaluation_returns_scores():
@@ -110,7 +147,7 @@ def test_evaluation_returns_scores():
         result = evaluate_transcript(transcript, session_id="test-session")
 
     assert result.session.id == "test-session"
-    assert len(result.standards) == 3
+    assert len(result.standards) == len(SUPPORTED_STANDARDS)
     toefl = next(std for std in result.standards if std.standard_id == "toefl")
     itep = next(std for std in result.standards if std.standard_id == "itep")
     ielts = next(std for std in result.standards if std.standard_id == "ielts")
@@ -122,3 +159,186 @@ def test_evaluation_returns_scores():
     assert len(toefl.recommendations) >= 5
     assert itep.cefr in {"A1", "A2", "B1", "B2", "C1", "C2", "Undetermined"}
     assert result.crosswalk.consensus_cefr in {"A1", "A2", "B1", "B2", "C1", "C2", "Undetermined"}
+
+
+def test_tier0_accepts_confident_heuristics_without_llm(tiering_env):
+    with patch("backend.app.services.evaluation.get_gpt5_client") as mock_factory:
+        result = evaluate_transcript(_long_transcript(), session_id="tier0")
+
+    mock_factory.assert_not_called()
+    assert len(result.standards) == len(SUPPORTED_STANDARDS)
+    stats = TIER_STATS.snapshot()
+    assert stats["tiers"]["tier0"]["decisions"] == 1
+    assert stats["tiers"]["tier2"]["runs"] == 0
+
+
+def test_tier1_disagreement_escalates_to_full_model(tiering_env):
+    tiering_env.setenv("GPT5_TIER1_MODEL", "gpt-5-mini")
+    get_settings.cache_clear()
+    transcript = [
+        ChatMessage(role="assistant", content="Hello"),
+        ChatMessage(role="user", content="I like my job."),
+    ]
+    light_client = MagicMock()
+    light_client.generate_evaluation.return_value = {
+        "standards": [
+            {"standard_id": "toefl", "cefr": "A1"},
+            {"standard_id": "ielts", "cefr": "C2"},
+        ]
+    }
+    full_client = MagicMock()
+    full_client.generate_evaluation.return_value = {"standards": [{"standard_id": "toefl", "cefr": "B1"}]}
+
+    def factory(model=None):  # noqa: ANN001 - mirrors get_gpt5_client
+        return light_client if model == "gpt-5-mini" else full_client
+
+    with patch("backend.app.services.evaluation.get_gpt5_client", side_effect=factory):
+        result = evaluate_transcript(transcript, session_id="tier1")
+
+    full_client.generate_evaluation.assert_called_once()
+    toefl = next(std for std in result.standards if std.standard_id == "toefl")
+    assert toefl.cefr == "B1"
+    stats = TIER_STATS.snapshot()
+    assert stats["tiers"]["tier1"]["runs"] == 1
+    assert stats["tiers"]["tier2"]["decisions"] == 1
+    assert stats["escalations"]["tier1_disagreement"] == 1
+    assert sum(stats["escalations"].values()) == 2
+
+
+def test_full_model_tenant_bypasses_lower_tiers(tiering_env):
+    tiering_env.setenv("GPT5_TIER1_MODEL", "gpt-5-mini")
+    tiering_env.setenv("GPT5_FULL_MODEL_TENANTS", "acme")
+    get_settings.cache_clear()
+
+    with patch("backend.app.services.evaluation.get_gpt5_client") as mock_factory:
+        mock_factory.return_value.generate_evaluation.return_value = {}
+        evaluate_transcript(_long_transcript(), session_id="tenant", tenant="acme")
+
+    mock_factory.assert_called_once_with()
+    assert TIER_STATS.snapshot()["escalations"] == {"full_model_requested": 1}
+
+
+def test_scorer_registry_discovers_configs_and_maps_cefr(tmp_path):
+    config = {
+        "meta": {"id": "demo", "label": "Demo Speaking", "order": 7},
+        "rubric": {
+            "criteria": [{"id": "range", "label": "Range"}, {"id": "flow", "label": "Flow"}],
+            "weights": {"range": 0.5, "flow": 0.5},
+        },
+        "scoring": {
+            "overall_scale": {"min": 0, "max": 10},
+            "round_to": 1,
+            "heuristic": {"criteria": {"range": {"unique_words": 1.0}, "flow": {"total_words": 1.0}}},
+        },
+        "mapping": {"to_cefr": [{"min": 5.0, "max": 10.0, "cefr": "B2"}, {"min": 0.0, "max": 4.9, "cefr": "A2"}]},
+    }
+    (tmp_path / "demo").mkdir()
+    (tmp_path / "demo" / "v1.json").write_text(json.dumps(config), encoding="utf-8")
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "v1.json").write_text(json.dumps({"meta": {"id": "notes"}}), encoding="utf-8")
+
+    assert discover_standards(tmp_path) == ("demo",)
+
+    scorer = compile_scorer(config)
+    metrics = SimpleNamespace(total_words=150, unique_words=50, avg_sentence_length=10)
+    assert scorer.score_criteria(metrics) == [5.0, 10.0]
+    assert scorer.overall([5.0, 10.0]) == 7.5
+    assert scorer.cefr(7.5) == "B2"
+    assert scorer.cefr(4.95) == "Undetermined"
+    assert scorer.format_overall(7.5) == "7.5 / 10"
+
+
+def test_all_shipped_standards_are_evaluated():
+    assert {"toefl", "itep", "ielts", "cefr_global", "cambridge_b2"} <= set(SUPPORTED_STANDARDS)
+
+    result = evaluate_transcript(_long_transcript(), session_id="registry")
+    by_id = {standard.standard_id: standard for standard in result.standards}
+    for standard_id in ("cefr_global", "cambridge_b2"):
+        assert by_id[standard_id].status == "ok"
+        assert by_id[standard_id].cefr in {"A1", "A2", "B1", "B2", "C1", "C2"}
+
+
+def test_metrics_accumulator_single_pass_features():
+    start = datetime(2025, 1, 6, 9, 0, 0)
+    transcript = [
+        ChatMessage(role="assistant", content="Tell me about your job.", timestamp=start),
+        ChatMessage(
+            role="user",
+            content="I work with Dr. Smith. However, even though it is hard, I like it! For example, we ship 3.5 tons",
+            timestamp=start + timedelta(seconds=4),
+            audio_meta={"duration_ms": 12000},
+        ),
+        ChatMessage(role="assistant", content="Why?", timestamp=start + timedelta(seconds=10)),
+        ChatMessage(role="user", content="Because it is fun", timestamp=start + timedelta(seconds=12)),
+    ]
+
+    metrics = compute_metrics(transcript)
+
+    # Heuristic scorer features keep their historical definitions.
+    assert (metrics.total_words, metrics.unique_words, metrics.avg_sentence_length, metrics.turns) == (24, 20, 12.0, 2)
+    assert metrics.sentences == 4
+    assert metrics.connectors == 4 and metrics.distinct_connectors == 4
+    assert metrics.latency_mean_sec == 3.0 and metrics.latency_p90_sec == 3.8
+    assert metrics.speech_rate_wpm == 100.0
+    assert 0 < metrics.mattr <= 1 and metrics.mtld > 0
+    payload = metrics.to_payload()
+    assert payload["connector_density"] == metrics.connector_density
+    assert payload["sample_user_messages"] == metrics.user_messages
+
+    incremental = MetricsAccumulator()
+    for message in transcript[:2]:
+        incremental.add(message)
+    assert incremental.snapshot().turns == 1
+    for message in transcript[2:]:
+        incremental.add(message)
+    assert incremental.snapshot() == metrics
+
+
+def test_sentence_segmentation_handles_abbreviations_and_short_answers():
+    cases = {
+        "Did you go? No! I stayed home.": [3, 1, 3],
+        "Is it? No? Really.": [2, 1, 1],
+        "I live on Main St. It is big.": [5, 3],
+        "I read No. 5 and liked it.": [7],
+        "No. I did not.": [1, 3],
+        "I met Dr. Smith, e.g. at work.": [7],
+        "We sold pens, books etc. and more.": [7],
+    }
+    for text, lengths in cases.items():
+        accumulator = MetricsAccumulator()
+        accumulator.add_user_text(text)
+        assert accumulator.sentence_lengths == lengths, text
+
+
+def test_mattr_uses_sliding_window_over_long_transcripts():
+    accumulator = MetricsAccumulator()
+    accumulator.add_user_text(" ".join(f"word{index % 10}" for index in range(200)))
+    accumulator.add_user_text(" ".join(f"term{index}" for index in range(60)))
+
+    metrics = accumulator.snapshot()
+    assert metrics.unique_words == 70
+    assert 0.2 < metrics.mattr < 0.5
+    assert metrics.mtld < 50
+
+
+def test_gpt_merge_shares_untouched_fields_and_leaves_base_intact():
+    stage = run_heuristic_stage(_long_transcript())
+    base = stage.base_results["toefl"]
+    snapshot = (dict(base.criteria), list(base.recommendations), list(base.common_errors))
+    criterion = next(iter(base.criteria))
+
+    merged = _merge_standard_with_gpt(
+        base,
+        {"cefr": "C1", "criteria": {criterion: {"comment": "Clear."}, "bonus_skill": {"score": 3.5}}},
+    )
+
+    assert (dict(base.criteria), base.recommendations, base.common_errors) == snapshot
+    assert "bonus_skill" not in base.criteria and "bonus_skill" not in base.criterion_labels
+    assert merged.cefr == "C1" and merged.criteria[criterion].comment == "Clear."
+    assert merged.criteria[criterion].score == base.criteria[criterion].score
+    assert merged.criterion_labels["bonus_skill"] == "Bonus Skill"
+    assert merged.recommendations is base.recommendations and merged.common_errors is base.common_errors
+
+    model = merged.to_model()
+    assert model.criteria["bonus_skill"].score == 3.5
+    assert model.common_errors == base.common_errors
@@ -0,0 +1,28 @@
+import copy
+
+from benchmarks.golden import compare_snapshot, run_harness
+
+
+def test_golden_transcripts_have_not_drifted():
+    # Timings depend on the machine; the latency budget is checked by ``python -m benchmarks.golden``.
+    report = run_harness(repeat=1, check_latency=False)
+
+    assert report["failures"] == []
+
+
+def test_compare_snapshot_reports_score_and_label_drift():
+    expected = {
+        "consensus_cefr": "B2",
+        "standards": {
+            "toefl": {"status": "ok", "overall": 3.0, "cefr": "B2", "criteria": {"delivery": 3.0}},
+        },
+    }
+    actual = copy.deepcopy(expected)
+    actual["standards"]["toefl"]["criteria"]["delivery"] = 3.2
+    actual["standards"]["toefl"]["cefr"] = "C1"
+
+    failures = compare_snapshot("case", "stub", expected, actual, {"score": {"default": 0.05}})
+
+    assert any("toefl.delivery" in failure for failure in failures)
+    assert any("CEFR B2 -> C1" in failure for failure in failures)
+    assert compare_snapshot("case", "stub", expected, expected, {"score": {"default": 0.05}}) == []
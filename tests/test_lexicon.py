@@ -0,0 +1,43 @@
+import numpy as np
+
+from backend.app.services.lexicon import (
+    BANDS,
+    OFF_LIST,
+    Lexicon,
+    binary_is_current,
+    build_binary,
+    get_lexicon,
+)
+from backend.app.services.metrics import MetricsAccumulator
+
+
+def test_shipped_binary_matches_source():
+    assert binary_is_current()
+    lexicon = get_lexicon()
+    assert isinstance(lexicon.hashes, np.memmap)
+    assert np.all(lexicon.hashes[1:] > lexicon.hashes[:-1])
+
+    words = ["the", "teachers", "negotiating", "ubiquitous", "happily", "studied", "xyzzy", "It's"]
+    bands = [BANDS[band] if band != OFF_LIST else None for band in lexicon.lookup([w.lower() for w in words])]
+    assert bands == ["A1", "A1", "B1", "C1", "A1", "A1", None, "A1"]
+
+
+def test_build_binary_round_trip_and_profile(tmp_path):
+    source = tmp_path / "words.tsv"
+    source.write_text("# comment\nplan\tA1\nmitigate\tC1\nleverage\tB2\nplan\tB1\n", encoding="utf-8")
+    target = tmp_path / "words.bin"
+
+    assert build_binary(source, target) == 3
+    assert binary_is_current(source, target)
+    lexicon = Lexicon.open(target)
+    assert lexicon.lookup(["plans", "mitigated", "leveraging", "planet"]).tolist() == [0, 4, 3, OFF_LIST]
+
+    source.write_text("plan\tA2\n", encoding="utf-8")
+    assert not binary_is_current(source, target)
+
+    accumulator = MetricsAccumulator()
+    accumulator.add_user_text("We mitigate risks because we plan ahead and we mitigate delays.")
+    metrics = accumulator.snapshot()
+    assert metrics.lexical_profile["C1"] == 2
+    assert sum(metrics.lexical_profile.values()) == 11
+    assert 0 < metrics.advanced_word_share < 1
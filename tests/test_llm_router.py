@@ -0,0 +1,140 @@
+import pytest
+
+from backend.app.config import get_settings
+from backend.app.models import ChatMessage, TranscriptMetadata
+from backend.app.services.evaluation import SUPPORTED_STANDARDS, _load_standard_config, _validate_output
+from backend.app.services.gpt5_client import GPT5APIError, clear_gpt5_client_cache, get_gpt5_client
+from backend.app.services.llm_router import LLMRouter
+from backend.app.services.llm_stub import StubProvider, build_stub_evaluation
+
+METRICS = {
+    "total_words": 140,
+    "unique_words": 70,
+    "avg_sentence_length": 18.0,
+    "turns": 5,
+    "sample_user_messages": ["I enjoy working with teams on complex problems.", "I prepare by outlining my ideas."],
+}
+
+
+class FailingProvider:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+
+    def generate_evaluation(self, transcript, metadata, metrics):  # noqa: ANN001 - provider protocol
+        self.calls += 1
+        raise GPT5APIError("boom")
+
+
+def _call(router: LLMRouter) -> dict:
+    return router.generate_evaluation([ChatMessage(role="user", content="Hello")], TranscriptMetadata(), METRICS)
+
+
+def test_stub_payload_is_schema_valid():
+    payload = build_stub_evaluation(METRICS)
+
+    assert [entry["standard_id"] for entry in payload["standards"]] == list(SUPPORTED_STANDARDS)
+    for entry in payload["standards"]:
+        _validate_output(entry, _load_standard_config(entry["standard_id"]).get("evaluator_output_schema", {}))
+    assert payload["crosswalk"]["consensus_cefr"]
+
+
+def test_router_prefers_lowest_p95_latency():
+    slow = StubProvider("slow", latency_ms=30)
+    fast = StubProvider("fast", latency_ms=1)
+    router = LLMRouter([slow, fast])
+
+    for _ in range(2):
+        _call(router)
+
+    assert router.ranked_providers()[0].name == "fast"
+    assert router.health("slow").p95_latency > router.health("fast").p95_latency
+
+
+def test_router_fails_over_and_deprioritises_unhealthy_provider():
+    broken = FailingProvider("broken")
+    backup = StubProvider("backup")
+    router = LLMRouter([broken, backup], max_error_rate=0.2)
+
+    assert _call(router)["standards"]
+    assert broken.calls == 1
+    assert router.ranked_providers()[0].name == "backup"
+
+    _call(router)
+    assert broken.calls == 1
+
+
+def test_router_raises_when_every_provider_fails():
+    router = LLMRouter([FailingProvider("a"), FailingProvider("b")])
+
+    with pytest.raises(GPT5APIError, match="All LLM providers failed"):
+        _call(router)
+
+
+def test_llm_providers_setting_builds_router(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDERS", '[{"name": "local", "kind": "stub"}]')
+    get_settings.cache_clear()
+    clear_gpt5_client_cache()
+    try:
+        client = get_gpt5_client()
+        assert isinstance(client, LLMRouter)
+        assert [provider.name for provider in client.providers] == ["local"]
+    finally:
+        monkeypatch.delenv("LLM_PROVIDERS")
+        get_settings.cache_clear()
+        clear_gpt5_client_cache()
+
+
+def test_tier_model_wins_over_provider_model(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDERS", '[{"name": "primary", "api_key": "key", "model": "provider-full"}]')
+    get_settings.cache_clear()
+    clear_gpt5_client_cache()
+    try:
+        full = get_gpt5_client()
+        tier1 = get_gpt5_client(model="tier1-mini")
+        assert [provider._client._model for provider in full.providers] == ["provider-full"]
+        assert [provider._client._model for provider in tier1.providers] == ["tier1-mini"]
+    finally:
+        monkeypatch.delenv("LLM_PROVIDERS")
+        get_settings.cache_clear()
+        clear_gpt5_client_cache()
+
+
+def test_degraded_provider_gets_one_probe_per_cooldown(monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr("backend.app.services.llm_router.time.monotonic", lambda: clock[0])
+    flaky = FailingProvider("flaky")
+    backup = StubProvider("backup")
+    router = LLMRouter([flaky, backup], max_error_rate=0.2, cooldown_seconds=30.0)
+
+    _call(router)
+    _call(router)
+    assert flaky.calls == 1
+
+    clock[0] += 31
+    _call(router)
+    _call(router)
+    assert flaky.calls == 2  # one probe, then back behind the healthy provider
+
+    clock[0] += 31
+    router._providers[0] = StubProvider("flaky")  # the endpoint came back
+    _call(router)
+    assert router.health("flaky").error_rate == 0.0
+    stats = router.snapshot()["flaky"]
+    assert stats["requests"] == 1 and not stats["cooling_down"]
+
+
+def test_health_is_tracked_per_model():
+    registry = {}
+    full = LLMRouter([FailingProvider("primary")], health=registry)
+    tier1_provider = StubProvider("primary")
+    tier1_provider.model = "tier1-mini"
+    tier1 = LLMRouter([tier1_provider], health=registry)
+
+    with pytest.raises(GPT5APIError):
+        _call(full)
+    _call(tier1)
+
+    assert registry[("primary", None)].error_rate == 1.0
+    assert registry[("primary", "tier1-mini")].error_rate == 0.0
+    assert set(tier1.snapshot()) == {"primary:tier1-mini"}
@@ -0,0 +1,58 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from backend.app.config import get_settings
+from backend.app.mock_gpt5 import MockConfig, create_app
+from backend.app.services.evaluation import SUPPORTED_STANDARDS
+from benchmarks.loadtest import ENDPOINTS, run_load_test
+
+REQUEST = {
+    "model": "gpt-5",
+    "messages": [
+        {"role": "system", "content": "rate"},
+        {"role": "user", "content": json.dumps({"transcript": [], "metrics": {"total_words": 120, "unique_words": 60}})},
+    ],
+}
+
+
+def test_mock_server_returns_stub_evaluation():
+    client = TestClient(create_app(MockConfig()))
+
+    response = client.post("/v1/chat/completions", json=REQUEST)
+
+    assert response.status_code == 200
+    content = json.loads(response.json()["choices"][0]["message"]["content"])
+    assert {entry["standard_id"] for entry in content["standards"]} == set(SUPPORTED_STANDARDS)
+
+
+def test_mock_server_streams_chunks():
+    client = TestClient(create_app(MockConfig(stream_chunk_chars=32)))
+
+    response = client.post("/v1/chat/completions", json={**REQUEST, "stream": True})
+
+    events = [line[len("data: "):] for line in response.text.splitlines() if line.startswith("data: ")]
+    assert events[-1] == "[DONE]"
+    content = "".join(json.loads(event)["choices"][0]["delta"].get("content", "") for event in events[:-1])
+    assert json.loads(content)["standards"]
+
+
+def test_mock_server_simulates_errors():
+    client = TestClient(create_app(MockConfig(error_rate=1.0, error_status=503)))
+
+    response = client.post("/v1/chat/completions", json=REQUEST)
+
+    assert response.status_code == 503
+
+
+def test_in_process_load_test_reports_endpoint_percentiles():
+    report = asyncio.run(
+        run_load_test(base_url=None, token=get_settings().secret_token, levels=[2], sessions_per_level=2)
+    )
+
+    level = report["levels"][0]
+    assert level["completed"] == 2
+    assert set(level["endpoints"]) == set(ENDPOINTS)
+    assert level["endpoints"]["chat"]["count"] == 10
+    assert report["max_sustainable"]["concurrent_sessions"] == 2
@@ -0,0 +1,33 @@
+from backend.app.models import ChatMessage
+from backend.app.services.metrics import compute_metrics
+from backend.app.services.relevance import score_pairs
+
+QUESTION = "What do you do at work every day?"
+
+
+def test_on_topic_answers_score_higher_and_batching_is_exact():
+    answers = [
+        "At work I manage daily deliveries and answer supplier emails every morning.",
+        "I love cooking pasta with tomatoes and fresh basil.",
+        "",
+    ]
+    scores = score_pairs([QUESTION] * 3, answers)
+
+    assert scores[0] > 0.2
+    assert scores[1] == 0.0 and scores[2] == 0.0
+    for index, answer in enumerate(answers):
+        assert score_pairs([QUESTION], [answer])[0] == scores[index]
+
+
+def test_metrics_pair_each_answer_with_preceding_question():
+    transcript = [
+        ChatMessage(role="user", content="Hello there, I am ready."),
+        ChatMessage(role="assistant", content=QUESTION),
+        ChatMessage(role="user", content="At work I manage daily deliveries for our warehouse."),
+        ChatMessage(role="user", content="Also pasta recipes."),
+    ]
+    metrics = compute_metrics(transcript)
+
+    expected = score_pairs([QUESTION, QUESTION], [transcript[2].content, transcript[3].content])
+    assert metrics.topic_relevance == sum(expected.tolist()) / 2
+    assert metrics.to_payload()["topic_relevance"] == round(metrics.topic_relevance, 4)
@@ -0,0 +1,261 @@
+import shutil
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from fastapi.testclient import TestClient
+
+from backend.app.config import get_settings
+from backend.app.main import app
+from backend.app.services import evaluation, pdf_queue, report_delivery, report_expiry, reporting
+from backend.app.services.llm_stub import StubProvider
+from benchmarks.synthetic import synthetic_transcript
+
+
+@pytest.fixture
+def response():
+    with patch.object(evaluation, "get_gpt5_client", return_value=StubProvider()):
+        result = evaluation.evaluate_transcript(synthetic_transcript(3), session_id="report-test")
+    toefl = result.standards[0]
+    criterion = next(iter(toefl.criteria))
+    toefl.criteria[criterion].comment = "<script>alert('x')</script>"
+    toefl.common_errors[0].fix = "Use <b>agree</b>"
+    return result
+
+
+@pytest.fixture
+def tenant_templates(tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "TENANT_TEMPLATES_DIR", tmp_path)
+    reporting.clear_template_cache()
+    yield tmp_path
+    reporting.clear_template_cache()
+
+
+def test_report_escapes_llm_text(response):
+    html = reporting.build_html_report(response, {"participant": {"full_name": "Ada & <Lovelace>"}})
+
+    assert "<script>" not in html and "&lt;script&gt;alert(&#39;x&#39;)&lt;/script&gt;" in html
+    assert "Use &lt;b&gt;agree&lt;/b&gt;" in html
+    assert "Ada &amp; &lt;Lovelace&gt;" in html
+    assert ".summary .badge {" in html
+
+
+def test_tenant_overrides_are_compiled_once(response, tenant_templates):
+    override = tenant_templates / "acme" / "report"
+    override.mkdir(parents=True)
+    (override / "report.css").write_text("body { color: #123456; }", encoding="utf-8")
+
+    acme = reporting.build_html_report(response, tenant="acme")
+    default = reporting.build_html_report(response, tenant="other")
+
+    assert "#123456" in acme and "#123456" not in default
+    assert "Criteria Breakdown" in acme
+    assert reporting.build_html_report(response, tenant="../acme") == default
+    assert reporting._report_template("acme") is reporting._report_template("acme")
+    assert reporting._report_template("acme") is not reporting._report_template(None)
+
+    (override / "report.css").write_text("body { color: #654321; }", encoding="utf-8")
+    assert "#123456" in reporting.build_html_report(response, tenant="acme")
+    reporting.clear_template_cache()
+    assert "#654321" in reporting.build_html_report(response, tenant="acme")
+
+
+def test_report_links_survive_a_restart(response, tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "REPORTS_DIR", tmp_path)
+    _, first_url = reporting.persist_report(response)
+    _, second_url = reporting.persist_report(response)
+
+    reporting._open_index.cache_clear()  # a fresh worker process opens the index again
+    reporting._open_scheduler.cache_clear()
+    record = reporting.resolve_report_token(second_url.rsplit("/", 1)[-1])
+    assert record.path.exists() and record.filename == "assessment_report_report-test.html"
+    assert reporting.get_latest_report_for_session("report-test") == record
+    assert len(reporting._report_index()) == 2
+
+    later = reporting._now() + reporting.timedelta(minutes=reporting._TOKEN_TTL_MINUTES + 1)
+    monkeypatch.setattr(reporting, "_now", lambda: later)
+    with pytest.raises(ValueError):
+        reporting.resolve_report_token(first_url.rsplit("/", 1)[-1])
+    assert reporting.get_latest_report_for_session("report-test") is None
+    assert len(reporting._report_index()) == 2  # deleting is left to the background reaper
+
+
+def test_stateless_tokens_resolve_without_the_index(response, tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "REPORTS_DIR", tmp_path)
+    _, url = reporting.persist_report(response)
+    token = url.rsplit("/", 1)[-1]
+    ((report_id, _, _),) = reporting._report_index().expiries()
+    stored = reporting._report_index().get(report_id)
+    legacy = reporting._build_signed_token("legacy", stored.expires_at)
+    reporting._report_index().add("legacy", stored)
+
+    with patch.object(reporting, "_report_index", side_effect=AssertionError("index lookup")):
+        assert reporting.resolve_report_token(token) == stored
+    assert reporting.resolve_report_token(legacy) == stored
+
+    stored.path.write_text(stored.path.read_text(encoding="utf-8") + "<!-- edited -->", encoding="utf-8")
+    with pytest.raises(ValueError, match="does not match"):
+        reporting.resolve_report_token(token)
+    payload, signature = token.split(".")
+    forged = reporting._urlsafe_b64decode(payload).replace(b'"fn":"', b'"fn":"x')
+    with pytest.raises(ValueError, match="signature"):
+        reporting.resolve_report_token(f"{reporting._urlsafe_b64encode(forged)}.{signature}")
+
+
+def test_reaper_deletes_expired_reports_in_batches(response, tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "REPORTS_DIR", tmp_path)
+    report_expiry.EXPIRY_STATS.reset()
+    for _ in range(3):
+        reporting.persist_report(response)
+    scheduler = reporting._expiry_scheduler()
+    scheduler.batch_size = 2
+    # A report registered by another worker is only in the index, not on this heap.
+    foreign = tmp_path / "foreign.html"
+    foreign.write_text("<html></html>", encoding="utf-8")
+    index = reporting._report_index()
+    expired = reporting._now() - reporting.timedelta(seconds=1)
+    index.add("foreign", reporting.ReportRecord(foreign, "f.html", expired, expired, "other"))
+    stored = [path for path in tmp_path.iterdir() if not path.name.startswith(reporting.INDEX_FILENAME)]
+    stored_bytes = sum(path.stat().st_size for path in stored)
+
+    assert len(scheduler) == 3 and scheduler.run_due() == 1 and not foreign.exists()
+    later = reporting._now() + reporting.timedelta(minutes=reporting._TOKEN_TTL_MINUTES + 1)
+    assert scheduler.run_due(later) == 3
+
+    stats = report_expiry.get_expiry_stats()
+    assert stats["reaped_reports"] == 4 and stats["sweeps"] == 3 and stats["bytes_freed"] == stored_bytes
+    assert len(index) == 0 and len(scheduler) == 0
+
+
+def test_report_download_serves_precompressed_variants_with_etags(response, tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "REPORTS_DIR", tmp_path)
+    html, url = reporting.persist_report(response)
+    path = "/api/reports/" + url.rsplit("/", 1)[-1]
+    client = TestClient(app)
+    report_delivery.get_report_cache().reset()
+
+    plain = client.get(path, headers={"Accept-Encoding": "identity"})
+    packed = client.get(path, headers={"Accept-Encoding": "gzip, br;q=0"})
+    assert plain.text == packed.text == html and "content-encoding" not in plain.headers
+    assert packed.headers["content-encoding"] == "gzip" and packed.headers["vary"] == "Accept-Encoding"
+    assert packed.headers["etag"] != plain.headers["etag"]
+    assert packed.headers["cache-control"].startswith("private, max-age=")
+
+    revalidated = client.get(path, headers={"Accept-Encoding": "gzip", "If-None-Match": packed.headers["etag"]})
+    assert revalidated.status_code == 304 and revalidated.content == b""
+    assert report_delivery.get_report_cache_stats()["hits"] == 1
+
+
+def test_report_body_cache_is_bounded_by_bytes():
+    cache = report_delivery.ReportBodyCache(max_bytes=10)
+    for name in "abc":
+        cache.put((name, None, 0), report_delivery.ReportBody(b"x" * 4, None, name))
+
+    assert cache.get(("a", None, 0)) is None and cache.get(("c", None, 0)).etag == "c"
+    assert cache.snapshot()["bytes"] == 8 and cache.snapshot()["evictions"] == 1
+
+
+def test_lazy_reports_store_deduplicated_json_and_render_on_download(response, tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "REPORTS_DIR", tmp_path)
+    report_delivery.get_report_cache().reset()
+    html, url = reporting.persist_report(response, lazy=True)
+    _, second_url = reporting.persist_report(response, lazy=True)
+
+    (source,) = tmp_path.glob("*.json")
+    assert html is None and not list(tmp_path.glob("*.html*"))
+    record = reporting.resolve_report_token(url.rsplit("/", 1)[-1])
+    assert record.path == source and record.filename == "assessment_report_report-test.html"
+
+    client = TestClient(app)
+    downloaded = client.get("/api/reports/" + second_url.rsplit("/", 1)[-1], headers={"Accept-Encoding": "gzip"})
+    assert downloaded.headers["content-encoding"] == "gzip"
+    assert downloaded.text == reporting.build_html_report(response)
+    assert reporting.read_report_html(record) == reporting.build_html_report(response).encode("utf-8")
+
+    # An expired report sharing the stored evaluation must not take it down with it.
+    expired = reporting._now() - reporting.timedelta(seconds=1)
+    reporting._report_index().add("old", reporting.ReportRecord(source, "old.html", expired, expired, "report-test"))
+    reporting._expiry_scheduler().run_due()
+    assert source.exists() and len(reporting._report_index()) == 2
+
+
+def test_lazy_report_etag_follows_template_changes(response, tmp_path, monkeypatch):
+    templates = tmp_path / "templates"
+    shutil.copytree(reporting.TEMPLATES_DIR, templates)
+    monkeypatch.setattr(reporting, "TEMPLATES_DIR", templates)
+    reporting.clear_template_cache()
+    _, url = reporting.persist_report(response, lazy=True)
+    path = "/api/reports/" + url.rsplit("/", 1)[-1]
+    client = TestClient(app)
+
+    first = client.get(path)
+    assert client.get(path, headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    stylesheet = templates / "report.css"
+    stylesheet.write_text(stylesheet.read_text(encoding="utf-8") + "\nbody { color: #123456; }\n", encoding="utf-8")
+    reporting.clear_template_cache()
+    restyled = client.get(path, headers={"If-None-Match": first.headers["etag"]})
+    assert restyled.status_code == 200 and "#123456" in restyled.text
+    assert restyled.headers["etag"] != first.headers["etag"]
+
+    monkeypatch.setattr(get_settings(), "report_language", "tr")
+    assert client.get(path, headers={"If-None-Match": restyled.headers["etag"]}).status_code == 200
+    reporting.clear_template_cache()
+
+
+def test_reaper_cannot_delete_a_source_reused_while_it_checks(response, tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "REPORTS_DIR", tmp_path)
+    reporting.persist_report(response, lazy=True)
+    index = reporting._report_index()
+    ((report_id, source, _),) = index.expiries()
+    index.delete(report_id)
+    expired = reporting._now() - reporting.timedelta(seconds=1)
+    index.add("old", reporting.ReportRecord(reporting.Path(source), "old.html", expired, expired, "report-test"))
+
+    in_use = index.paths_in_use
+    reused: list = []
+
+    def persist_identical_meanwhile(paths):
+        found = in_use(paths)
+        # Another request stores the same evaluation between the check and the delete.
+        worker = threading.Thread(target=lambda: reused.append(reporting.persist_report(response, lazy=True)))
+        worker.start()
+        worker.join(timeout=0.2)
+        reused.append(worker)
+        return found
+
+    monkeypatch.setattr(index, "paths_in_use", persist_identical_meanwhile)
+    reporting._expiry_scheduler().run_due()
+    reused[0].join(timeout=5)
+
+    _, url = reused[-1]
+    assert reporting.resolve_report_token(url.rsplit("/", 1)[-1]).path.exists()
+
+
+def test_report_pdf_renders_on_a_bounded_process_pool(response, tmp_path, monkeypatch):
+    monkeypatch.setattr(reporting, "REPORTS_DIR", tmp_path)
+    queue = pdf_queue.PdfRenderQueue(workers=1, max_pending=1)
+    monkeypatch.setattr(reporting, "get_pdf_queue", lambda: queue)
+    _, url = reporting.persist_report(response, lazy=True)
+    try:
+        pdf_url = reporting.schedule_report_pdf(url, response)
+        assert pdf_url == f"{url}/pdf"
+        assert not queue.submit("other", tmp_path / "other.pdf", reporting._render_pdf_document, {})
+
+        client = TestClient(app)
+        path = "/api/reports/" + pdf_url.split("/api/reports/", 1)[1]
+        deadline = time.monotonic() + 60
+        downloaded = client.get(path)
+        while downloaded.status_code == 202 and time.monotonic() < deadline:
+            time.sleep(0.1)
+            downloaded = client.get(path)
+    finally:
+        queue.shutdown()
+
+    assert downloaded.status_code == 200 and downloaded.headers["content-type"] == "application/pdf"
+    assert downloaded.headers["content-disposition"] == 'attachment; filename="assessment_report_report-test.pdf"'
+    assert downloaded.content == reporting.build_pdf_report(response)
+    assert downloaded.content.startswith(b"%PDF-1.4") and downloaded.content.endswith(b"%%EOF\n")
+    assert queue.snapshot()["completed"] == 1 and queue.snapshot()["rejected"] == 1
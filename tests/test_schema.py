@@ -0,0 +1,62 @@
+import pytest
+
+from backend.app.models import ChatMessage
+from backend.app.services.evaluation import _compute_metrics, _heuristic_results, _merge_standard_with_gpt
+from backend.app.services.schema import SchemaValidationError, compile_schema, prune
+
+SCHEMA = {
+    "type": "object",
+    "required": ["overall", "cefr", "tags"],
+    "properties": {
+        "overall": {"type": "number", "minimum": 0},
+        "cefr": {"type": "string", "enum": ["A1", "B1"]},
+        "tags": {"type": "array", "items": {"type": "string"}, "minItems": 2},
+        "extra": {"type": "object", "additionalProperties": {"type": "integer"}},
+    },
+}
+
+
+def test_compiled_schema_reports_every_violation():
+    validator = compile_schema(SCHEMA)
+
+    with pytest.raises(SchemaValidationError) as excinfo:
+        validator.validate({"overall": -1, "cefr": "C2", "tags": ["ok", 3], "extra": {"a": 1, "b": "x"}})
+
+    found = {(violation.path, violation.keyword) for violation in excinfo.value.violations}
+    assert found == {
+        (("overall",), "minimum"),
+        (("cefr",), "enum"),
+        (("tags", 1), "type"),
+        (("extra", "b"), "type"),
+    }
+    assert [v.keyword for v in validator.violations({"overall": True, "tags": []})] == [
+        "required",
+        "type",
+        "minItems",
+    ]
+    assert validator.is_valid({"overall": 2.5, "cefr": "B1", "tags": ["a", "b"], "extra": {"n": 3}})
+    assert not validator.is_valid({"overall": 2.5, "cefr": "B1", "tags": ["a", "b"], "extra": {"n": 3.0}})
+    assert compile_schema({}).violations(object()) == []
+
+
+def test_partial_validation_prunes_invalid_fields_before_merge():
+    validator = compile_schema(SCHEMA)
+    patch = {"overall": "high", "tags": ["one", None, "two"], "extra": {"a": 2}}
+
+    violations = validator.violations(patch, partial=True)
+
+    assert {v.path for v in violations} == {("overall",), ("tags", 1)}
+    assert prune(patch, violations) == {"tags": ["one", "two"], "extra": {"a": 2}}
+
+    transcript = [ChatMessage(role="user", content="I usually plan my week carefully on Sunday evenings.")]
+    base = _heuristic_results(_compute_metrics(transcript))[0]["toefl"]
+    criterion = next(iter(base.criteria))
+    merged = _merge_standard_with_gpt(
+        base,
+        {"overall": "3.5", "cefr": "B2", "criteria": {criterion: {"score": "high", "comment": "Clear delivery."}}},
+    )
+
+    assert merged.overall == base.overall
+    assert merged.cefr == "B2"
+    assert merged.criteria[criterion].score == base.criteria[criterion].score
+    assert merged.criteria[criterion].comment == "Clear delivery."